@@ -1,269 +1,281 @@
 #!/usr/bin/env python3
 """
 Convert requirements.md (job history creation - natural language) to Excel spreadsheet.
+
+The Markdown is read line by line in a single pass; each Epic, Feature and
+User Story row is held only until its description line arrives (or the next
+heading shows there is none), so parsing is linear in the file size. The
+workbook is written in openpyxl's write-only mode with shared named styles
+and requirements.csv is written from the same rows in the same pass.
+
+Usage:
+    python docs/plans/convert_requirements_to_excel.py [requirements.md] [requirements.xlsx]
+    python docs/plans/convert_requirements_to_excel.py --csv-only
+
+Defaults are docs/requirements/requirements.md, with the .xlsx and .csv
+written next to it.
 """
 
+import argparse
+import csv
 import re
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from copy import copy
+from pathlib import Path
 
-def parse_requirements_md(filepath):
-    """Parse the requirements markdown file and extract hierarchical data."""
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    rows = []
-    lines = content.split('\n')
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Match Epic: # EPIC X.0.0.0: Title
-        epic_match = re.match(r'^# EPIC (\d+\.0\.0\.0): (.+)$', line)
-        if epic_match:
-            epic_number = epic_match.group(1)
-            epic_title = epic_match.group(2)
-            # Look for description
-            desc = ""
-            j = i + 1
-            while j < len(lines):
-                next_line = lines[j].strip()
-                if next_line.startswith('**Description:**'):
-                    desc = next_line.replace('**Description:**', '').strip()
-                    break
-                elif next_line.startswith('#'):
-                    break
-                j += 1
-            rows.append({
-                'level': 1,
-                'number': epic_number,
-                'text': epic_title,
-                'description': desc
-            })
-            i += 1
-            continue
-        
-        # Match Feature: ## Feature X.Y.0.0: Title
-        feature_match = re.match(r'^## Feature (\d+\.\d+\.0\.0): (.+)$', line)
-        if feature_match:
-            feature_number = feature_match.group(1)
-            feature_title = feature_match.group(2)
-            # Look for description
-            desc = ""
-            j = i + 1
-            while j < len(lines):
-                next_line = lines[j].strip()
-                if next_line.startswith('**Description:**'):
-                    desc = next_line.replace('**Description:**', '').strip()
-                    break
-                elif next_line.startswith('#'):
-                    break
-                j += 1
-            rows.append({
-                'level': 2,
-                'number': feature_number,
-                'text': feature_title,
-                'description': desc
-            })
-            i += 1
-            continue
-        
-        # Match User Story: ### User Story X.Y.Z.0: Title
-        story_match = re.match(r'^### User Story (\d+\.\d+\.\d+\.0): (.+)$', line)
-        if story_match:
-            story_number = story_match.group(1)
-            story_title = story_match.group(2)
-            # Get the full user story text from next line
-            desc = ""
-            j = i + 1
-            while j < len(lines):
-                next_line = lines[j].strip()
-                if next_line.startswith('**As a**'):
-                    desc = next_line
-                    break
-                elif next_line.startswith('#'):
-                    break
-                j += 1
-            rows.append({
-                'level': 3,
-                'number': story_number,
-                'text': story_title,
-                'description': desc
-            })
-            i += 1
+REQUIREMENTS_DIR = Path(__file__).resolve().parent.parent / 'requirements'
+
+HEADING_RE = re.compile(r'^(#{1,3}) (EPIC|Feature|User Story) (\d+\.\d+\.\d+\.\d+): (.+)$')
+ITEM_RE = re.compile(r'^- \*\*(\d+\.\d+\.\d+\.([AR])\.\d+):\*\* (.+)$')
+
+# heading -> (level, number pattern, prefix of the line holding its description)
+HEADINGS = {
+    ('#', 'EPIC'): (1, re.compile(r'\d+\.0\.0\.0$'), '**Description:**'),
+    ('##', 'Feature'): (2, re.compile(r'\d+\.\d+\.0\.0$'), '**Description:**'),
+    ('###', 'User Story'): (3, re.compile(r'\d+\.\d+\.\d+\.0$'), '**As a**'),
+}
+
+HEADERS = [
+    'Epic #', 'Feature #', 'Story #', 'AC/BR #', 'Rule Typ',
+    'Epic Title', 'Feature Title', 'User Story Statement', 'Acceptance Criteria', 'Business Rule',
+    'Functional Title / Description'
+]
+
+COLUMN_WIDTHS = {
+    'A': 14, 'B': 14, 'C': 16, 'D': 20, 'E': 18,
+    'F': 40, 'G': 45, 'H': 55, 'I': 60, 'J': 60,
+    'K': 80
+}
+
+# level -> (named style, fill color)
+LEVEL_STYLES = {
+    1: ('req_epic', 'D9E2F3'),
+    2: ('req_feature', 'E2F0D9'),
+    3: ('req_story', 'FFF2CC'),
+    4: ('req_ac', 'FCE4D6'),
+    5: ('req_br', 'EDEDED'),
+}
+
+LEVEL_NAMES = {1: 'Epics', 2: 'Features', 3: 'User Stories', 4: 'Acceptance Criteria', 5: 'Business Rules'}
+
+
+def iter_requirements(lines):
+    """
+    Yield hierarchical rows ({level, number, text, description}) from
+    requirements Markdown lines, in document order.
+
+    An Epic or Feature takes the first following "**Description:**" line and
+    a User Story the first following "**As a**" line, as long as no heading
+    line ("#...") comes first. Until then the row is held (with any
+    Acceptance Criteria or Business Rules listed before its description),
+    so each line is looked at exactly once.
+    """
+    held = []       # pending heading row first, then rows that follow it
+    prefix = None   # description prefix the pending row waits for
+
+    for raw in lines:
+        line = raw.strip()
+        if not line:
             continue
-        
-        # Match Acceptance Criteria: - **X.Y.Z.A.n:** Text
-        ac_match = re.match(r'^- \*\*(\d+\.\d+\.\d+\.A\.\d+):\*\* (.+)$', line)
-        if ac_match:
-            ac_number = ac_match.group(1)
-            ac_text = ac_match.group(2)
-            rows.append({
-                'level': 4,
-                'number': ac_number,
-                'text': ac_text,
-                'description': ''
-            })
-            i += 1
+
+        if line[0] == '#':
+            yield from held
+            held.clear()
+            heading = HEADING_RE.match(line)
+            if heading:
+                spec = HEADINGS.get((heading.group(1), heading.group(2)))
+                if spec and spec[1].match(heading.group(3)):
+                    held.append({
+                        'level': spec[0],
+                        'number': heading.group(3),
+                        'text': heading.group(4),
+                        'description': ''
+                    })
+                    prefix = spec[2]
             continue
-        
-        # Match Business Rule: - **X.Y.Z.R.n:** Text
-        br_match = re.match(r'^- \*\*(\d+\.\d+\.\d+\.R\.\d+):\*\* (.+)$', line)
-        if br_match:
-            br_number = br_match.group(1)
-            br_text = br_match.group(2)
-            rows.append({
-                'level': 5,
-                'number': br_number,
-                'text': br_text,
-                'description': ''
-            })
-            i += 1
+
+        if held and line.startswith(prefix):
+            if prefix == '**As a**':
+                held[0]['description'] = line
+            else:
+                held[0]['description'] = line.replace(prefix, '').strip()
+            yield from held
+            held.clear()
             continue
-        
-        i += 1
-    
-    return rows
 
-def create_excel(rows, output_path):
-    """Create Excel file with hierarchical structure."""
-    
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Requirements"
-    
-    # Define column headers
-    headers = [
-        'Epic #', 'Feature #', 'Story #', 'AC/BR #', 'Rule Typ',
-        'Epic Title', 'Feature Title', 'User Story Statement', 'Acceptance Criteria', 'Business Rule',
-        'Functional Title / Description'
-    ]
-    
-    # Style for headers
-    header_font = Font(bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-    header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    
-    # Write headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-    
-    # Style definitions
-    epic_fill = PatternFill(start_color='D9E2F3', end_color='D9E2F3', fill_type='solid')
-    feature_fill = PatternFill(start_color='E2F0D9', end_color='E2F0D9', fill_type='solid')
-    story_fill = PatternFill(start_color='FFF2CC', end_color='FFF2CC', fill_type='solid')
-    ac_fill = PatternFill(start_color='FCE4D6', end_color='FCE4D6', fill_type='solid')
-    br_fill = PatternFill(start_color='EDEDED', end_color='EDEDED', fill_type='solid')
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    wrap_alignment = Alignment(vertical='top', wrap_text=True)
-    
-    # Write data rows
-    row_num = 2
-    for item in rows:
-        level = item['level']
-        number = item['number']
-        text = item['text']
-        description = item.get('description', '')
-        
-        # Mapping mapping logic for best practice
-        # Col 1-5: Numbers
-        # Col 6-10: Primary Content
-        # Col 11: Description/Meta
-        
-        if level == 1: # Epic
-            ws.cell(row=row_num, column=1, value=number)
-            ws.cell(row=row_num, column=6, value=text)
-            ws.cell(row=row_num, column=11, value=description)
-        elif level == 2: # Feature
-            ws.cell(row=row_num, column=2, value=number)
-            ws.cell(row=row_num, column=7, value=text)
-            ws.cell(row=row_num, column=11, value=description)
-        elif level == 3: # User Story
-            ws.cell(row=row_num, column=3, value=number)
-            # BEST PRACTICE: "User Story Statement" is the core content, "Title" is metadata
-            ws.cell(row=row_num, column=8, value=description) # Statement
-            ws.cell(row=row_num, column=11, value=text)        # Functional Title
-        elif level == 4: # AC
-            ws.cell(row=row_num, column=4, value=number)
-            ws.cell(row=row_num, column=9, value=text)
-        elif level == 5: # BR
-            ws.cell(row=row_num, column=4, value=number) # Shared col with AC for numbering
-            ws.cell(row=row_num, column=5, value='BUSRULE')
-            ws.cell(row=row_num, column=10, value=text)
-        
-        # Apply fills based on level
-        fill = None
-        if level == 1:
-            fill = epic_fill
-        elif level == 2:
-            fill = feature_fill
-        elif level == 3:
-            fill = story_fill
-        elif level == 4:
-            fill = ac_fill
-        elif level == 5:
-            fill = br_fill
-        
-        if fill:
-            for col in range(1, 12):
-                ws.cell(row=row_num, column=col).fill = fill
-        
-        # Apply borders
-        for col in range(1, 12):
-            ws.cell(row=row_num, column=col).border = thin_border
-        
-        row_num += 1
-    
-    # Set column widths
-    column_widths = {
-        'A': 14, 'B': 14, 'C': 16, 'D': 20, 'E': 18,
-        'F': 40, 'G': 45, 'H': 55, 'I': 60, 'J': 60,
-        'K': 80
-    }
-    
-    for col, width in column_widths.items():
+        if line.startswith('- **'):
+            item = ITEM_RE.match(line)
+            if item:
+                row = {
+                    'level': 4 if item.group(2) == 'A' else 5,
+                    'number': item.group(1),
+                    'text': item.group(3),
+                    'description': ''
+                }
+                if held:
+                    held.append(row)
+                else:
+                    yield row
+
+    yield from held
+
+
+def parse_requirements_md(filepath):
+    """Parse the requirements markdown file and extract hierarchical data."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return list(iter_requirements(f))
+
+
+def row_values(item):
+    """Spreadsheet columns (see HEADERS) for one requirement row."""
+    values = [None] * len(HEADERS)
+    level = item['level']
+    number = item['number']
+    text = item['text']
+    description = item.get('description', '')
+
+    # Col 1-5: Numbers
+    # Col 6-10: Primary Content
+    # Col 11: Description/Meta
+    if level == 1:  # Epic
+        values[0], values[5], values[10] = number, text, description
+    elif level == 2:  # Feature
+        values[1], values[6], values[10] = number, text, description
+    elif level == 3:  # User Story
+        # BEST PRACTICE: "User Story Statement" is the core content, "Title" is metadata
+        values[2], values[7], values[10] = number, description, text
+    elif level == 4:  # AC
+        values[3], values[8] = number, text
+    elif level == 5:  # BR
+        values[3], values[4], values[9] = number, 'BUSRULE', text  # Shared col with AC for numbering
+    return values
+
+
+def _workbook():
+    """Write-only workbook with the header and per-level named styles registered."""
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+    wb = Workbook(write_only=True)
+    wb.add_named_style(NamedStyle(
+        name='req_header',
+        font=Font(bold=True, color='FFFFFF'),
+        fill=PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid'),
+        alignment=Alignment(horizontal='center', vertical='center', wrap_text=True)
+    ))
+    thin = Side(style='thin')
+    for name, color in LEVEL_STYLES.values():
+        wb.add_named_style(NamedStyle(
+            name=name,
+            fill=PatternFill(start_color=color, end_color=color, fill_type='solid'),
+            border=Border(left=thin, right=thin, top=thin, bottom=thin)
+        ))
+
+    ws = wb.create_sheet("Requirements")
+    for col, width in COLUMN_WIDTHS.items():
         ws.column_dimensions[col].width = width
-    
     # Set row heights for better readability
     ws.row_dimensions[1].height = 30
-    
     # Freeze header row
     ws.freeze_panes = 'A2'
-    
-    # Save workbook
-    wb.save(output_path)
-    print(f"Excel file created: {output_path}")
-    print(f"Total rows: {row_num - 1} (including header)")
+    return wb, ws
+
+
+def export_requirements(rows, xlsx_path=None, csv_path=None):
+    """
+    Stream rows into the Excel file and/or CSV in one pass; either path may
+    be None. Returns the number of rows written, including the header.
+    """
+    ws = None
+    if xlsx_path is not None:
+        from openpyxl.cell import WriteOnlyCell
+
+        wb, ws = _workbook()
+
+        # Resolve each named style once; cells then share its style array
+        # instead of looking the name up again for every cell
+        prototypes = {}
+        for style in ['req_header'] + [name for name, _ in LEVEL_STYLES.values()]:
+            prototypes[style] = WriteOnlyCell(ws)
+            prototypes[style].style = style
+
+        def styled(values, style):
+            cells = []
+            for value in values:
+                cell = WriteOnlyCell(ws, value=value)
+                cell._style = copy(prototypes[style]._style)
+                cells.append(cell)
+            return cells
+
+        ws.append(styled(HEADERS, 'req_header'))
+
+    csv_file = open(csv_path, 'w', encoding='utf-8-sig', newline='') if csv_path is not None else None
+    try:
+        writer = csv.writer(csv_file) if csv_file else None
+        if writer:
+            writer.writerow(HEADERS)
+
+        count = 1
+        for item in rows:
+            values = row_values(item)
+            if ws is not None:
+                ws.append(styled(values, LEVEL_STYLES[item['level']][0]))
+            if writer:
+                writer.writerow(['' if value is None else value for value in values])
+            count += 1
+    finally:
+        if csv_file:
+            csv_file.close()
+
+    if ws is not None:
+        wb.save(xlsx_path)
+        print(f"Excel file created: {xlsx_path}")
+    if csv_path is not None:
+        print(f"CSV file created: {csv_path}")
+    print(f"Total rows: {count} (including header)")
+    return count
+
+
+def create_excel(rows, output_path):
+    """Create Excel file with hierarchical structure."""
+    return export_requirements(rows, xlsx_path=output_path)
+
+
+class _LevelCounter:
+    """Pass rows through while counting them per level (keeps the export streaming)."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.counts = {}
+
+    def __iter__(self):
+        for row in self.rows:
+            self.counts[row['level']] = self.counts.get(row['level'], 0) + 1
+            yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert requirements.md to requirements.xlsx and requirements.csv.")
+    parser.add_argument('input', nargs='?', default=str(REQUIREMENTS_DIR / 'requirements.md'),
+                        help="Requirements Markdown (default: docs/requirements/requirements.md)")
+    parser.add_argument('output', nargs='?', help="Excel file (default: input with .xlsx extension)")
+    parser.add_argument('--csv', help="CSV file (default: input with .csv extension)")
+    parser.add_argument('--csv-only', action='store_true', help="Write only the CSV (no openpyxl needed)")
+    args = parser.parse_args()
+
+    input_file = Path(args.input)
+    output_file = None if args.csv_only else Path(args.output or input_file.with_suffix('.xlsx'))
+    csv_file = Path(args.csv or input_file.with_suffix('.csv'))
 
-if __name__ == '__main__':
-    input_file = 'requirements.md'
-    output_file = 'requirements.xlsx'
-    
     print(f"Parsing: {input_file}")
-    rows = parse_requirements_md(input_file)
-    print(f"Found {len(rows)} items")
-    
-    # Print summary by level
-    level_counts = {}
-    for row in rows:
-        level = row['level']
-        level_counts[level] = level_counts.get(level, 0) + 1
-    
-    level_names = {1: 'Epics', 2: 'Features', 3: 'User Stories', 4: 'Acceptance Criteria', 5: 'Business Rules'}
+    with open(input_file, 'r', encoding='utf-8') as f:
+        counter = _LevelCounter(iter_requirements(f))
+        export_requirements(counter, xlsx_path=output_file, csv_path=csv_file)
+
+    print(f"Found {sum(counter.counts.values())} items")
     print("\nBreakdown:")
-    for level in sorted(level_counts.keys()):
-        print(f"  {level_names.get(level, f'Level {level}')}: {level_counts[level]}")
-    
-    create_excel(rows, output_file)
+    for level in sorted(counter.counts.keys()):
+        print(f"  {LEVEL_NAMES.get(level, f'Level {level}')}: {counter.counts[level]}")
+
+
+if __name__ == '__main__':
+    main()
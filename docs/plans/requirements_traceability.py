@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+requirements_traceability.py - Incremental Requirements Traceability Index
+
+Purpose: Keeps an index of requirements.md (one content hash per requirement
+         ID, from parse_requirements_md's rows), of the story IDs mapped in
+         requirements-traceability-matrix.md, and of every requirement ID
+         cited by a test case in docs/enhancements/*/test-cases.md and
+         docs/issues/**/test-cases.md (an inverted index: ID -> test cases).
+
+         Each run re-reads only the files whose size/mtime changed (and
+         re-parses them only if their SHA-256 did), reports which
+         requirement rows were added, changed or removed since the last run,
+         and re-exports only those rows. Coverage questions ("which
+         acceptance criteria have no test case?") are then answered from the
+         index instead of a grep sweep over the docs tree.
+
+         The index lives in .cache/omr/requirements_index.json.
+
+Usage:
+    python docs/plans/requirements_traceability.py                  # refresh + coverage summary
+    python docs/plans/requirements_traceability.py sync --changes changed.csv [--export]
+    python docs/plans/requirements_traceability.py uncovered [--level ac|br|story|all]
+    python docs/plans/requirements_traceability.py refs 1.2.3.0
+    python docs/plans/requirements_traceability.py untraced         # stories missing from the RTM
+    python docs/plans/requirements_traceability.py dangling         # test-case IDs not in requirements.md
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from convert_requirements_to_excel import HEADERS, LEVEL_NAMES, export_requirements, parse_requirements_md, row_values
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+REQUIREMENTS_DIR = REPO_ROOT / "docs" / "requirements"
+REQUIREMENTS_FILE = REQUIREMENTS_DIR / "requirements.md"
+RTM_FILE = REQUIREMENTS_DIR / "requirements-traceability-matrix.md"
+TEST_CASE_GLOBS = ("docs/enhancements/*/test-cases.md", "docs/issues/**/test-cases.md")
+INDEX_FILE = REPO_ROOT / ".cache" / "omr" / "requirements_index.json"
+
+# Bump when the index layout or what gets indexed changes
+INDEX_VERSION = 1
+
+# Requirement IDs as cited in prose: X.Y.Z.A.n, X.Y.Z.R.n, or an Epic/Feature/Story X.Y.Z.0
+# (not part of a longer dotted number or a "v9.3.5.0" version)
+REF_RE = re.compile(r'(?<![\w.])(\d+\.\d+\.\d+\.(?:[AR]\.\d+|0))(?!\w)(?!\.\d)')
+
+# A matrix row: | 1.1.1.0 | ✅ | ...
+RTM_ROW_RE = re.compile(r'^\|\s*(\d+\.\d+\.\d+\.\d+)\s*\|', re.MULTILINE)
+
+HEADING_RE = re.compile(r'^#{1,6}\s+(.+?)\s*$')
+
+LEVELS = {"epic": 1, "feature": 2, "story": 3, "ac": 4, "br": 5}
+
+
+# ---------------------------------------------------------------------------
+# Index storage
+# ---------------------------------------------------------------------------
+
+def _stamp(path: Path) -> Dict:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _needs_read(path: Path, entry: Optional[Dict]) -> Tuple[bool, Dict]:
+    """
+    (changed, source stamp) for a file against its index entry. Equal
+    size and mtime are trusted; otherwise the file is hashed and counts as
+    changed only if its content is.
+    """
+    stamp = _stamp(path)
+    if entry and entry["source"]["size"] == stamp["size"] and entry["source"]["mtime_ns"] == stamp["mtime_ns"]:
+        return False, entry["source"]
+    stamp["sha256"] = _sha256(path)
+    return not entry or entry["source"].get("sha256") != stamp["sha256"], stamp
+
+
+def load_index(path: Path = INDEX_FILE) -> Dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if index.get("version") == INDEX_VERSION else {}
+
+
+def save_index(index: Dict, path: Path = INDEX_FILE):
+    """Atomically replace the index file; a read-only tree just skips saving."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+def row_hash(row: Dict) -> str:
+    """Content hash of one requirement row (level, text and description)."""
+    content = "\x1f".join((str(row['level']), row['text'], row.get('description', '')))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+
+def scan_test_cases(path: Path) -> Dict[str, List[Tuple[str, int]]]:
+    """{requirement ID: [(test case, line)]} for one test-cases.md file."""
+    refs: Dict[str, List[Tuple[str, int]]] = {}
+    test_case = "(file)"
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            heading = HEADING_RE.match(line)
+            if heading:
+                test_case = heading.group(1).split(':', 1)[0].strip()
+            for match in REF_RE.finditer(line):
+                refs.setdefault(match.group(1), []).append((test_case, number))
+    return refs
+
+
+def test_case_files(root: Path = REPO_ROOT) -> List[Path]:
+    found = set()
+    for pattern in TEST_CASE_GLOBS:
+        found.update(root.glob(pattern))
+    return sorted(found)
+
+
+def _relative(path: Path) -> str:
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+# ---------------------------------------------------------------------------
+# Refresh
+# ---------------------------------------------------------------------------
+
+class Changes:
+    """What one refresh found: requirement IDs by change kind, and the files it re-read."""
+
+    def __init__(self):
+        self.added: List[str] = []
+        self.changed: List[str] = []
+        self.removed: List[str] = []
+        self.rows: Dict[str, Dict] = {}     # parsed rows of added and changed IDs
+        self.rescanned: List[str] = []
+        self.initial = False                # first build: every row counts as added
+        self.dirty = False                  # index differs from what was loaded
+
+    @property
+    def requirements_changed(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def refresh(index: Dict, requirements: Path = REQUIREMENTS_FILE, rtm: Path = RTM_FILE,
+            test_cases: Optional[Iterable[Path]] = None) -> Changes:
+    """Bring the index up to date in place, touching only sources that changed."""
+    changes = Changes()
+    index["version"] = INDEX_VERSION
+
+    entry = index.get("requirements")
+    changed, stamp = _needs_read(requirements, entry)
+    changes.initial = entry is None
+    changes.dirty |= entry is None or stamp is not entry["source"]
+    if changed:
+        old = entry["rows"] if entry else {}
+        rows = {}
+        for row in parse_requirements_md(requirements):
+            if row['number'] in rows:
+                continue
+            digest = row_hash(row)
+            rows[row['number']] = [digest, row['level']]
+            previous = old.get(row['number'])
+            if previous is None:
+                changes.added.append(row['number'])
+                changes.rows[row['number']] = row
+            elif previous[0] != digest:
+                changes.changed.append(row['number'])
+                changes.rows[row['number']] = row
+        changes.removed = [number for number in old if number not in rows]
+        index["requirements"] = {"source": stamp, "rows": rows}
+        changes.rescanned.append(_relative(requirements))
+    elif entry:
+        entry["source"] = stamp
+
+    entry = index.get("rtm")
+    if rtm.exists():
+        changed, stamp = _needs_read(rtm, entry)
+        changes.dirty |= entry is None or stamp is not entry["source"]
+        if changed:
+            ids = sorted(set(RTM_ROW_RE.findall(rtm.read_text(encoding='utf-8'))))
+            index["rtm"] = {"source": stamp, "ids": ids}
+            changes.rescanned.append(_relative(rtm))
+        else:
+            entry["source"] = stamp
+    elif index.pop("rtm", None) is not None:
+        changes.dirty = True
+
+    files = index.setdefault("test_cases", {})
+    current = {_relative(path): path for path in (test_case_files() if test_cases is None else test_cases)}
+    postings_changed = False
+    for name in [name for name in files if name not in current]:
+        del files[name]
+        postings_changed = True
+    for name, path in current.items():
+        changed, stamp = _needs_read(path, files.get(name))
+        changes.dirty |= name not in files or stamp is not files[name]["source"]
+        if changed:
+            files[name] = {"source": stamp, "refs": scan_test_cases(path)}
+            changes.rescanned.append(name)
+            postings_changed = True
+        else:
+            files[name]["source"] = stamp
+    if postings_changed or "inverted" not in index:
+        index["inverted"] = build_inverted(files)
+        changes.dirty = True
+    return changes
+
+
+def build_inverted(files: Dict[str, Dict]) -> Dict[str, List[List]]:
+    """{requirement ID: [[file, test case, line]]} from the per-file postings."""
+    inverted: Dict[str, List[List]] = {}
+    for name in sorted(files):
+        for req_id, refs in files[name]["refs"].items():
+            inverted.setdefault(req_id, []).extend([name, test_case, line] for test_case, line in refs)
+    return inverted
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+def export_changes(changes: Changes, path: Path) -> int:
+    """Write only the added, changed and removed rows (spreadsheet columns plus a Change column)."""
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Change'] + HEADERS)
+        count = 0
+        for kind, numbers in (("added", changes.added), ("changed", changes.changed)):
+            for number in numbers:
+                values = row_values(changes.rows[number])
+                writer.writerow([kind] + ['' if value is None else value for value in values])
+                count += 1
+        for number in changes.removed:
+            writer.writerow(["removed", number] + [''] * (len(HEADERS) - 1))
+            count += 1
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def _scope_prefix(req_id: str) -> Tuple[str, ...]:
+    """Leading ID parts an Epic/Feature/Story stands for ("1.2.0.0" -> ("1", "2"))."""
+    parts = req_id.split('.')
+    if len(parts) != 4:
+        return tuple(parts)
+    while len(parts) > 1 and parts[-1] == '0':
+        parts.pop()
+    return tuple(parts)
+
+
+def references(index: Dict, req_id: str) -> Dict[str, List[List]]:
+    """Test-case citations of req_id and, for an Epic/Feature/Story, of everything under it."""
+    inverted = index.get("inverted", {})
+    prefix = _scope_prefix(req_id)
+    if len(req_id.split('.')) != 4:
+        return {req_id: inverted[req_id]} if req_id in inverted else {}
+    return {cited: refs for cited, refs in inverted.items()
+            if tuple(cited.split('.')[:len(prefix)]) == prefix}
+
+
+def uncovered(index: Dict, levels: Iterable[int]) -> List[str]:
+    """Requirement IDs of the given levels that no test case cites, in document order."""
+    levels = set(levels)
+    inverted = index.get("inverted", {})
+    return [number for number, (_, level) in index["requirements"]["rows"].items()
+            if level in levels and number not in inverted]
+
+
+def untraced(index: Dict) -> List[str]:
+    """User stories with no row in the traceability matrix."""
+    mapped = set(index.get("rtm", {}).get("ids", []))
+    return [number for number, (_, level) in index["requirements"]["rows"].items()
+            if level == 3 and number not in mapped]
+
+
+def dangling(index: Dict) -> Dict[str, List[List]]:
+    """Citations of IDs that requirements.md does not define."""
+    rows = index["requirements"]["rows"]
+    return {req_id: refs for req_id, refs in index.get("inverted", {}).items() if req_id not in rows}
+
+
+def coverage(index: Dict) -> List[Tuple[str, int, int]]:
+    """[(level name, cited, total)] per requirement level."""
+    inverted = index.get("inverted", {})
+    totals: Dict[int, List[int]] = {}
+    for number, (_, level) in index["requirements"]["rows"].items():
+        counts = totals.setdefault(level, [0, 0])
+        counts[0] += number in inverted
+        counts[1] += 1
+    return [(LEVEL_NAMES.get(level, f"Level {level}"), cited, total)
+            for level, (cited, total) in sorted(totals.items())]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _print_changes(changes: Changes):
+    if changes.initial:
+        print(f"📝 Indexed {len(changes.added)} requirement(s)")
+    elif changes.requirements_changed:
+        print(f"📝 Requirements: {len(changes.added)} added, {len(changes.changed)} changed, "
+              f"{len(changes.removed)} removed")
+        for kind, numbers in (("+", changes.added), ("~", changes.changed), ("-", changes.removed)):
+            for number in numbers:
+                print(f"  {kind} {number}")
+    if changes.rescanned:
+        print(f"🔄 Re-indexed {len(changes.rescanned)} file(s)")
+    else:
+        print("✅ Index up to date")
+
+
+def _print_refs(refs: Dict[str, List[List]]):
+    for req_id in sorted(refs):
+        for name, test_case, line in refs[req_id]:
+            print(f"  {req_id}  {name}:{line}  {test_case}")
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Incremental requirements traceability index.")
+    sub = parser.add_subparsers(dest="command")
+    p = sub.add_parser("sync", help="Refresh the index and report changed requirement rows")
+    p.add_argument("--changes", help="Write only the added/changed/removed rows to this CSV")
+    p.add_argument("--export", action="store_true",
+                   help="Regenerate requirements.csv (and .xlsx with --xlsx) when any row changed")
+    p.add_argument("--xlsx", action="store_true", help="With --export, also regenerate requirements.xlsx")
+    p = sub.add_parser("uncovered", help="Requirements no test case cites")
+    p.add_argument("--level", choices=sorted(LEVELS) + ["all"], default="ac",
+                   help="Requirement level (default: ac = acceptance criteria)")
+    p = sub.add_parser("refs", help="Test cases citing a requirement (and everything under it)")
+    p.add_argument("id", help="Requirement ID, e.g. 1.2.3.A.4 or 1.2.3.0")
+    sub.add_parser("untraced", help="User stories missing from the traceability matrix")
+    sub.add_parser("dangling", help="Test-case citations of IDs not in requirements.md")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the stored index and re-read everything")
+    args = parser.parse_args(argv)
+
+    if not REQUIREMENTS_FILE.exists():
+        print(f"Error: File not found: {REQUIREMENTS_FILE}")
+        sys.exit(1)
+
+    index = {} if args.rebuild else load_index()
+    changes = refresh(index)
+    if changes.dirty:
+        save_index(index)
+    command = args.command or "summary"
+
+    if command in ("sync", "summary"):
+        _print_changes(changes)
+    if command == "sync":
+        if args.changes:
+            count = export_changes(changes, Path(args.changes))
+            print(f"📤 Exported {count} changed row(s) to {args.changes}")
+        if args.export and changes.requirements_changed:
+            rows = parse_requirements_md(REQUIREMENTS_FILE)
+            export_requirements(rows, xlsx_path=REQUIREMENTS_DIR / "requirements.xlsx" if args.xlsx else None,
+                                csv_path=REQUIREMENTS_DIR / "requirements.csv")
+        return
+
+    if command == "summary":
+        print("\nTest-case coverage:")
+        for name, cited, total in coverage(index):
+            print(f"  {name}: {cited}/{total} cited" + (f" ({cited * 100 // total}%)" if total else ""))
+        print(f"User stories missing from the RTM: {len(untraced(index))}")
+        return
+
+    if command == "uncovered":
+        levels = LEVELS.values() if args.level == "all" else [LEVELS[args.level]]
+        missing = uncovered(index, levels)
+        for number in missing:
+            print(number)
+        print(f"{len(missing)} requirement(s) without a test case", file=sys.stderr)
+    elif command == "refs":
+        refs = references(index, args.id)
+        _print_refs(refs)
+        if not refs:
+            print(f"No test case cites {args.id}", file=sys.stderr)
+    elif command == "untraced":
+        for number in untraced(index):
+            print(number)
+    elif command == "dangling":
+        _print_refs(dangling(index))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+bench_sanitizer.py - Microbenchmark for the Layer 0 sanitizer engine
+
+Purpose: Measures sanitize_input() throughput against the original
+         per-character implementation on ASCII, mixed-Unicode and adversarial
+         (zero-width-stuffed) inputs, and verifies both produce identical
+         output for every corpus, both for the whole text and for the text
+         fed to sanitize_chunks() in small pieces of random length (cutting
+         through combining sequences and, in the single-line corpus,
+         forcing cuts away from newlines).
+
+Usage:
+    python scripts/bench_sanitizer.py [--size-kb N] [--repeat N]
+
+Exit Codes:
+    0 = Outputs identical for all corpora
+    1 = Output mismatch detected
+"""
+
+import argparse
+import random
+import sys
+import time
+import unicodedata
+
+from validate_bullets import sanitize_chunks, sanitize_input
+
+
+def reference_sanitize_input(text: str) -> str:
+    """The original sanitize_input, kept as the equivalence oracle."""
+    text = unicodedata.normalize('NFKC', text)
+    for char in ['​', '‌', '‍', '﻿']:
+        text = text.replace(char, '')
+    return "".join(ch for ch in text if unicodedata.category(ch)[0] != "C" or ch in ['\n', '\t', '\r'])
+
+
+SAMPLE_BULLET = (
+    "- Built a distributed ingestion pipeline processing 4M events per day, "
+    "cutting analytics latency from hours to under 5 minutes.\n"
+)
+
+
+def build_corpora(size: int, seed: int = 7) -> dict:
+    """Build benchmark inputs of roughly `size` characters each."""
+    rng = random.Random(seed)
+    ascii_text = (SAMPLE_BULLET * (size // len(SAMPLE_BULLET) + 1))[:size]
+
+    unicode_pool = "résumé – naïve “quoted” café ﬁnance Ⅻ ① ｆｕｌｌ 東京 é́ ｶﾞ 한글 •\t"
+    mixed = "".join(
+        rng.choice(unicode_pool) if rng.random() < 0.15 else ch
+        for ch in ascii_text
+    )
+
+    hidden = "​‌‍﻿⁠­\x07\x1b"
+    adversarial = "".join(ch + rng.choice(hidden) for ch in ascii_text[:size // 2])
+
+    single_line = mixed.replace("\n", " ")
+
+    return {"ascii": ascii_text, "mixed-unicode": mixed, "zero-width-stuffed": adversarial,
+            "single-line": single_line}
+
+
+def random_pieces(text: str, seed: int = 11, max_len: int = 97):
+    """text split into pieces of 1..max_len characters, regardless of character sequences."""
+    rng = random.Random(seed)
+    i = 0
+    while i < len(text):
+        n = rng.randint(1, max_len)
+        yield text[i:i + n]
+        i += n
+
+
+def chunked_sanitize(text: str, chunk_size: int = 256) -> str:
+    return "".join(sanitize_chunks(random_pieces(text), chunk_size=chunk_size))
+
+
+def bench(func, text: str, repeat: int) -> float:
+    """Return best-of-`repeat` throughput in MB/s (UTF-8 input size)."""
+    size_mb = len(text.encode('utf-8')) / 1e6
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return size_mb / best if best else float('inf')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sanitize_input throughput.")
+    parser.add_argument("--size-kb", type=int, default=512, help="Corpus size in KB (default: 512)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    corpora = build_corpora(args.size_kb * 1024)
+    identical = True
+
+    print("\n" + "=" * 70)
+    print("SANITIZER MICROBENCHMARK")
+    print("=" * 70)
+    print(f"{'corpus':<22}{'reference MB/s':>16}{'engine MB/s':>14}{'speedup':>10}  identical")
+
+    for name, text in corpora.items():
+        expected = reference_sanitize_input(text)
+        same = sanitize_input(text) == expected and chunked_sanitize(text) == expected
+        identical &= same
+
+        ref = bench(reference_sanitize_input, text, args.repeat)
+        new = bench(sanitize_input, text, args.repeat)
+        print(f"{name:<22}{ref:>16.1f}{new:>14.1f}{new / ref:>9.1f}x  {'✅' if same else '❌'}")
+
+    print("=" * 70 + "\n")
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
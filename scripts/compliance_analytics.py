@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+compliance_analytics.py - Layer 5: Queryable Compliance Analytics
+
+Purpose: Indexed SQLite view over the compliance log (compliance_tracker.py)
+         with per-(guardrail, platform, day) rollups maintained as each run
+         is inserted, so pass-rate, trend and top-failing-guardrail queries
+         read a few rollup rows instead of the whole history. Checks counts
+         runs: a guardrail with several results in one run is one check.
+
+         The database is derived data: it syncs incrementally from the NDJSON
+         segments before every query (only new lines are read) and can be
+         deleted and rebuilt at any time.
+
+Usage:
+    python scripts/compliance_analytics.py pass-rate [--guardrail G24] [--platform claude] [--days 7]
+    python scripts/compliance_analytics.py trend --guardrail G24 [--platform claude] [--days 30]
+    python scripts/compliance_analytics.py top-failing [--platform claude] [--days 7] [--limit 10]
+    python scripts/compliance_analytics.py sync
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sqlite3
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from compliance_tracker import ACTIVE_SEGMENT, ComplianceStore, get_store
+
+DB_NAME = "analytics.sqlite3"
+
+# Bumped when the way rows are derived changes; older databases are rebuilt
+# from the log. 1: one rollup check per guardrail per run.
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_key TEXT NOT NULL UNIQUE,
+    timestamp TEXT NOT NULL,
+    day TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_platform_day ON runs (platform, day);
+CREATE INDEX IF NOT EXISTS runs_day ON runs (day);
+
+CREATE TABLE IF NOT EXISTS rollup_daily (
+    guardrail TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    day TEXT NOT NULL,
+    checks INTEGER NOT NULL,
+    passes INTEGER NOT NULL,
+    PRIMARY KEY (guardrail, platform, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rollup_platform_day ON rollup_daily (platform, day);
+CREATE INDEX IF NOT EXISTS rollup_day ON rollup_daily (day);
+
+CREATE TABLE IF NOT EXISTS ingested_segments (
+    name TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    head TEXT NOT NULL
+);
+"""
+
+UPSERT_ROLLUP = """
+INSERT INTO rollup_daily (guardrail, platform, day, checks, passes) VALUES (?, ?, ?, 1, ?)
+ON CONFLICT (guardrail, platform, day)
+DO UPDATE SET checks = checks + 1, passes = passes + excluded.passes
+"""
+
+# Offset value marking an immutable (rotated) segment as fully ingested
+SEGMENT_DONE = -1
+
+
+class ComplianceAnalytics:
+    """SQLite analytics store fed from a ComplianceStore."""
+
+    def __init__(self, store: ComplianceStore = None, db_path: Optional[Path] = None):
+        self.store = store or get_store()
+        self.db_path = Path(db_path) if db_path else self.store.directory / DB_NAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self.conn.executescript(
+                "DROP TABLE IF EXISTS runs; DROP TABLE IF EXISTS rollup_daily; "
+                f"DROP TABLE IF EXISTS ingested_segments; PRAGMA user_version = {SCHEMA_VERSION};")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # -- Ingestion ---------------------------------------------------------
+
+    def insert_entry(self, entry: Dict, run_key: str) -> bool:
+        """Insert one run and fold it into the rollups. Returns False for duplicates."""
+        timestamp = entry.get("timestamp", "")
+        day = timestamp[:10]
+        platform = entry.get("platform") or "unknown"
+        results = entry.get("results", [])
+        summary = entry.get("summary", {})
+
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO runs (run_key, timestamp, day, platform, total, passed) VALUES (?, ?, ?, ?, ?, ?)",
+            (run_key, timestamp, day, platform, summary.get("total", len(results)),
+             summary.get("passed", sum(1 for r in results if r.get("passed")))),
+        )
+        if cursor.rowcount != 1:
+            return False
+        # A guardrail ID may cover several checks (e.g. both G12 checks):
+        # count it once per run, passing only if all of them passed.
+        outcomes = {}
+        for r in results:
+            guardrail = r.get("guardrail", "?")
+            outcomes[guardrail] = outcomes.get(guardrail, True) and bool(r.get("passed"))
+        self.conn.executemany(
+            UPSERT_ROLLUP,
+            [(guardrail, platform, day, 1 if passed else 0) for guardrail, passed in outcomes.items()],
+        )
+        return True
+
+    def sync(self) -> int:
+        """
+        Ingest entries appended since the last sync. Rotated segments are
+        read once; the active segment resumes from its recorded offset
+        unless it was rotated in the meantime (detected by its first line).
+        Returns the number of new runs.
+        """
+        seen = {name: (offset, head) for name, offset, head in
+                self.conn.execute("SELECT name, offset, head FROM ingested_segments")}
+        inserted = 0
+
+        with self.conn:
+            for path in self.store.segments():
+                if path.name == ACTIVE_SEGMENT:
+                    inserted += self._sync_active(path, seen.get(path.name))
+                elif seen.get(path.name, (None,))[0] != SEGMENT_DONE:
+                    with (gzip.open(path, "rb") if path.suffix == ".gz" else open(path, "rb")) as f:
+                        inserted += self._ingest_lines(f)[0]
+                    self._mark(path.name, SEGMENT_DONE, "")
+        return inserted
+
+    def _sync_active(self, path: Path, state) -> int:
+        with open(path, "rb") as f:
+            head = hashlib.sha1(f.readline()).hexdigest()
+            offset = state[0] if state and state[1] == head else 0
+            f.seek(offset)
+            inserted, consumed = self._ingest_lines(f)
+        self._mark(path.name, offset + consumed, head)
+        return inserted
+
+    def _ingest_lines(self, f):
+        """Ingest complete lines from f. Returns (new runs, bytes consumed)."""
+        inserted = consumed = 0
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # line still being written; picked up on the next sync
+            consumed += len(raw)
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                continue
+            inserted += self.insert_entry(entry, hashlib.sha1(raw).hexdigest())
+        return inserted, consumed
+
+    def _mark(self, name: str, offset: int, head: str):
+        self.conn.execute(
+            "INSERT INTO ingested_segments (name, offset, head) VALUES (?, ?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET offset = excluded.offset, head = excluded.head",
+            (name, offset, head),
+        )
+
+    # -- Queries -----------------------------------------------------------
+
+    @staticmethod
+    def _filters(guardrail=None, platform=None, since=None, until=None):
+        clauses, params = [], []
+        for column, op, value in (("guardrail", "=", guardrail), ("platform", "=", platform),
+                                  ("day", ">=", since), ("day", "<=", until)):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def pass_rate(self, guardrail=None, platform=None, since=None, until=None) -> List[Dict]:
+        """Pass rate per (guardrail, platform) over the period."""
+        where, params = self._filters(guardrail, platform, since, until)
+        rows = self.conn.execute(
+            f"SELECT guardrail, platform, SUM(checks), SUM(passes) FROM rollup_daily{where} "
+            "GROUP BY guardrail, platform ORDER BY guardrail, platform", params)
+        return [_rate_row(dict(guardrail=g, platform=p), checks, passes) for g, p, checks, passes in rows]
+
+    def trend(self, guardrail, platform=None, since=None, until=None) -> List[Dict]:
+        """Daily pass rate for one guardrail (all platforms unless given)."""
+        where, params = self._filters(guardrail, platform, since, until)
+        rows = self.conn.execute(
+            f"SELECT day, SUM(checks), SUM(passes) FROM rollup_daily{where} GROUP BY day ORDER BY day", params)
+        return [_rate_row(dict(day=d), checks, passes) for d, checks, passes in rows]
+
+    def top_failing(self, platform=None, since=None, until=None, limit=10) -> List[Dict]:
+        """Guardrails ordered by failure count over the period."""
+        where, params = self._filters(None, platform, since, until)
+        rows = self.conn.execute(
+            f"SELECT guardrail, SUM(checks), SUM(passes) FROM rollup_daily{where} GROUP BY guardrail "
+            "ORDER BY SUM(checks) - SUM(passes) DESC, guardrail LIMIT ?", params + [limit])
+        return [_rate_row(dict(guardrail=g), checks, passes) for g, checks, passes in rows]
+
+
+def _rate_row(row: Dict, checks: int, passes: int) -> Dict:
+    row.update(checks=checks, failures=checks - passes,
+               pass_rate=round(passes / checks * 100, 2) if checks else 0.0)
+    return row
+
+
+def print_table(rows: List[Dict]):
+    if not rows:
+        print("No data for this query.")
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    print("  ".join("-" * widths[c] for c in columns))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(widths[c]) for c in columns))
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Query compliance pass rates, trends and failures.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_period(p):
+        p.add_argument("--platform", help="Filter by OPTIMIZE_PLATFORM value")
+        p.add_argument("--days", type=int, help="Only the last N days (including today)")
+        p.add_argument("--since", help="Start day, YYYY-MM-DD")
+        p.add_argument("--until", help="End day, YYYY-MM-DD")
+        p.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+
+    p = sub.add_parser("pass-rate", help="Pass rate per guardrail and platform")
+    p.add_argument("--guardrail", help="Guardrail ID, e.g. G24")
+    add_period(p)
+
+    p = sub.add_parser("trend", help="Daily pass rate for one guardrail")
+    p.add_argument("--guardrail", required=True, help="Guardrail ID, e.g. G24")
+    add_period(p)
+
+    p = sub.add_parser("top-failing", help="Guardrails with the most failures")
+    p.add_argument("--limit", type=int, default=10)
+    add_period(p)
+
+    sub.add_parser("sync", help="Ingest new compliance log entries")
+
+    args = parser.parse_args(argv)
+
+    analytics = ComplianceAnalytics()
+    try:
+        new_runs = analytics.sync()
+        if args.command == "sync":
+            print(f"Synced {new_runs} new run(s) into {analytics.db_path}")
+            return
+
+        since = args.since
+        if args.days:
+            since = (date.today() - timedelta(days=args.days - 1)).isoformat()
+        period = dict(platform=args.platform, since=since, until=args.until)
+
+        if args.command == "pass-rate":
+            rows = analytics.pass_rate(guardrail=args.guardrail, **period)
+        elif args.command == "trend":
+            rows = analytics.trend(args.guardrail, **period)
+        else:
+            rows = analytics.top_failing(limit=args.limit, **period)
+    finally:
+        analytics.close()
+
+    if args.json:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,59 +3,286 @@
 compliance_tracker.py - Layer 5: Compliance Tracking & Observability
 
 Purpose: Logs per-guardrail Pass/Fail status to detect enforcement drift over time.
-         Calculates compliance rates per session and platform.
+         Calculates compliance rates per session and platform. Every logged
+         run is also fed to the online drift detector (drift_detector.py).
+
+Storage: Append-only NDJSON segment log under docs/governance/compliance_logs/
+         - current.ndjson           active segment, one JSON entry per line
+         - segment-<time>.ndjson.gz rotated, gzip-compacted segments
+         Appends take an fcntl lock and write a single line, so logging costs
+         O(1) no matter how much history exists, and concurrent validator
+         runs cannot lose or corrupt entries. The active segment is rotated
+         once it exceeds a size or age limit.
+
+         The legacy docs/governance/compliance_logs.json array is migrated
+         once into a segment on first use; the original file is left as is.
+
+Usage:
+    echo '[{"guardrail": "G1", "passed": true}]' | python scripts/compliance_tracker.py
 """
 
-import sys
+import gzip
 import json
 import os
-from datetime import datetime
-from typing import List, Dict
+import shutil
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still single writes, just unlocked
+    fcntl = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LOG_DIR = Path(os.getenv("OMR_COMPLIANCE_DIR", REPO_ROOT / "docs" / "governance" / "compliance_logs"))
+LEGACY_LOG_FILE = REPO_ROOT / "docs" / "governance" / "compliance_logs.json"
+
+ACTIVE_SEGMENT = "current.ndjson"
+LEGACY_SEGMENT = "segment-00000000T000000000000-legacy.ndjson.gz"
+
+# Rotation limits for the active segment
+MAX_SEGMENT_BYTES = 8 * 1024 * 1024
+MAX_SEGMENT_AGE = timedelta(days=7)
+
+
+class ComplianceStore:
+    """Append-only, lock-safe NDJSON segment log of compliance entries."""
+
+    def __init__(self, directory: Path = LOG_DIR, max_segment_bytes: int = MAX_SEGMENT_BYTES,
+                 max_segment_age: timedelta = MAX_SEGMENT_AGE, legacy_file: Path = LEGACY_LOG_FILE):
+        self.directory = Path(directory)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age = max_segment_age
+        self.legacy_file = Path(legacy_file) if legacy_file else None
+        self.active_path = self.directory / ACTIVE_SEGMENT
+        self.lock_path = self.directory / ".lock"
+
+    def append(self, entry: Dict):
+        """Append one entry. Rotates the active segment afterwards if it is due."""
+        line = (json.dumps(entry, separators=(',', ':')) + "\n").encode("utf-8")
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with self._locked():
+            self._migrate_legacy()
+            fd = os.open(self.active_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            rotated = self._rotate_if_due(size)
+
+        if rotated:
+            self._compact(rotated)
+
+    def iter_entries(self) -> Iterator[Dict]:
+        """
+        Yield every entry, oldest first (rotated segments, then the active one).
+        The segments are listed and the active one is opened under the lock,
+        so a rotation cannot rename it in between; rotated segments only
+        change from .ndjson to .ndjson.gz, which _open_segment() follows.
+        """
+        with self._locked():
+            self._migrate_legacy()
+            paths = self.segments()
+            active = _open_segment(self.active_path) if self.active_path in paths else None
+        try:
+            for path in paths:
+                f = active if path == self.active_path else _open_segment(path)
+                if f is None:
+                    continue
+                with f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            try:
+                                yield json.loads(line)
+                            except ValueError:
+                                continue  # torn line from a crashed writer
+        finally:
+            if active is not None:
+                active.close()
+
+    def segments(self) -> List[Path]:
+        """All segment files in chronological order."""
+        if not self.directory.exists():
+            return []
+        rotated = sorted(
+            p for p in self.directory.glob("segment-*")
+            if p.name.endswith(".ndjson.gz") or p.name.endswith(".ndjson")
+        )
+        # A plain .ndjson segment is mid-compaction; prefer its .gz once complete
+        names = {p.name for p in rotated}
+        rotated = [p for p in rotated if not (p.suffix == ".ndjson" and p.name + ".gz" in names)]
+        return rotated + ([self.active_path] if self.active_path.exists() else [])
+
+    def rotate(self):
+        """Force rotation of the active segment."""
+        with self._locked():
+            rotated = self._rotate_if_due(force=True)
+        if rotated:
+            self._compact(rotated)
+
+    def _rotate_if_due(self, size: int = 0, force: bool = False):
+        """Rename the active segment out of the way (caller holds the lock)."""
+        if not self.active_path.exists():
+            return None
+        if not force and size < self.max_segment_bytes and not self._segment_expired():
+            return None
+        target = self.directory / f"segment-{datetime.now().strftime('%Y%m%dT%H%M%S%f')}.ndjson"
+        os.replace(self.active_path, target)
+        return target
+
+    def _segment_expired(self) -> bool:
+        """Age check reads only the first entry's timestamp."""
+        try:
+            with open(self.active_path, "r", encoding="utf-8") as f:
+                first = json.loads(f.readline())
+            started = datetime.fromisoformat(first["timestamp"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return datetime.now() - started >= self.max_segment_age
+
+    def _compact(self, segment: Path):
+        """Gzip a rotated segment (outside the lock; readers skip the partial .gz)."""
+        tmp = segment.with_name(segment.name + ".gz.tmp")
+        with open(segment, "rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, segment.with_name(segment.name + ".gz"))
+        segment.unlink()
+
+    def _migrate_legacy(self):
+        """One-time import of the legacy JSON array (caller holds the lock)."""
+        target = self.directory / LEGACY_SEGMENT
+        if not self.legacy_file or target.exists() or not self.legacy_file.exists():
+            return
+        try:
+            with open(self.legacy_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = []
+        if not isinstance(entries, list):
+            entries = []
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(',', ':')) + "\n")
+        os.replace(tmp, target)
+
+    def _locked(self):
+        return _FileLock(self.lock_path)
 
-LOG_FILE = "docs/governance/compliance_logs.json"
 
-def log_compliance(results: List[Dict], platform: str = "unknown"):
+def _open_segment(path: Path):
     """
-    Append validation results to the compliance log.
-    results: List of dicts like {"guardrail": "G1", "passed": True}
+    Open a segment for reading. A plain .ndjson segment listed just before
+    _compact() unlinked it is read from its .gz instead; None if neither
+    exists any more (only possible for the active segment when opened
+    without the lock).
     """
-    log_entry = {
+    try:
+        if path.suffix == ".gz":
+            return gzip.open(path, "rt", encoding="utf-8")
+        return open(path, "rt", encoding="utf-8")
+    except FileNotFoundError:
+        if path.suffix == ".gz":
+            return None
+    try:
+        return gzip.open(path.with_name(path.name + ".gz"), "rt", encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+class _FileLock:
+    """Exclusive fcntl lock on a lock file (no-op where fcntl is unavailable)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.fd = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+
+
+def build_entry(results: List[Dict], platform: str = "unknown", model: Optional[str] = None) -> Dict:
+    """Build a compliance log entry from per-guardrail results."""
+    passed = sum(1 for r in results if r["passed"])
+    entry = {
         "timestamp": datetime.isoformat(datetime.now()),
         "platform": platform,
         "results": results,
         "summary": {
             "total": len(results),
-            "passed": sum(1 for r in results if r["passed"]),
-            "rate": round(sum(1 for r in results if r["passed"]) / len(results) * 100, 2) if results else 0
+            "passed": passed,
+            "rate": round(passed / len(results) * 100, 2) if results else 0
         }
     }
+    if model:
+        entry["model"] = model
+    return entry
 
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
 
-    # Load existing logs
-    data = []
-    if os.path.exists(LOG_FILE):
-        try:
-            with open(LOG_FILE, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            pass
+_default_store = None
 
-    data.append(log_entry)
 
-    # Write back
-    with open(LOG_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+def get_store() -> ComplianceStore:
+    """Process-wide store for the default log directory."""
+    global _default_store
+    if _default_store is None:
+        _default_store = ComplianceStore()
+    return _default_store
 
-    print(f"Compliance logged: {log_entry['summary']['rate']}% pass rate.")
 
-if __name__ == "__main__":
+def record_compliance(results: List[Dict], platform: str = "unknown",
+                      model: Optional[str] = None) -> Tuple[Dict, List]:
+    """
+    Append an entry for these results to the store and feed it to the
+    drift detector. Returns (entry, newly raised drift alerts).
+    """
+    from drift_detector import observe_entry
+
+    entry = build_entry(results, platform, model)
+    store = get_store()
+    store.append(entry)
+    return entry, observe_entry(entry, store.directory)
+
+
+def log_compliance(results: List[Dict], platform: str = "unknown", model: Optional[str] = None):
+    """
+    Append validation results to the compliance log.
+    results: List of dicts like {"guardrail": "G1", "passed": True}
+    """
+    entry, alerts = record_compliance(results, platform, model)
+    print(f"Compliance logged: {entry['summary']['rate']}% pass rate.")
+    for alert in alerts:
+        print(alert)
+
+
+def main():
     # If run directly as a script, expect JSON results on stdin
     try:
         input_data = sys.stdin.read()
         if input_data:
             results_list = json.loads(input_data)
-            log_compliance(results_list)
+            log_compliance(results_list, platform=os.getenv("OPTIMIZE_PLATFORM", "unknown"),
+                           model=os.getenv("OPTIMIZE_MODEL"))
     except Exception as e:
         print(f"Error logging compliance: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,27 +4,79 @@ Convert job history .txt file (with XML structure) to beautiful Markdown format.
 
 Usage:
     python convert_job_history_to_md.py input.txt [output.md]
+    python convert_job_history_to_md.py archive.txt [output.md] --mmap
+    python convert_job_history_to_md.py input.txt - | less
+    python convert_job_history_to_md.py candidates/ [out_dir/] [--jobs N] [--force]
 
 If output.md is not specified, it will be created in the same directory as input
-with .md extension.
+with .md extension. The Markdown is rendered by generators and written fragment
+by fragment through a buffered writer, so output starts before the whole file
+has been processed.
+
+The file is parsed into the job history model (job_history_model.py), the
+same one validate_job_history.py builds; a model already cached for this
+exact file (e.g. by a preceding validation) is loaded instead of re-parsed.
+The rendered Markdown is cached as well (parse_cache.py, keyed by the file's
+hash and the renderer sources), so converting an unchanged file again only
+hashes it and writes the stored output.
+
+Files of MMAP_THRESHOLD bytes or more (or with --mmap) are memory-mapped and
+scanned as bytes; only the header, the rendered sections and each position
+are decoded, one at a time, so memory stays bounded on both ends.
+
+Given a directory, every *.txt under it is converted by a process pool.
+Files whose .md is newer and whose content hash matches the last conversion
+(recorded in .cache/omr/md_batch.json, together with a hash of the renderer
+code) are skipped; a throughput summary is printed at the end.
 """
 
+import argparse
+import fnmatch
+import itertools
+import json
+import mmap
 import re
 import sys
 import os
+import time
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from job_history_model import (
+    GLOBAL_SECTIONS,
+    REPO_ROOT,
+    Certification,
+    Degree,
+    HistoryBuilder,
+    JobHistory,
+    Position,
+    load_job_history,
+    parse_job_history,
+    position_zero_from_text,
+    source_digest,
+)
+from job_history_scanner import TreeBuilder
+from lazy_re import lazy_compile
+from parse_cache import get_cache, source_version
+
+# Files at least this large are memory-mapped instead of read into a str
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# Parse cache namespace for rendered Markdown
+CACHE_TOOL = "convert_job_history_to_md"
+
+# Output buffer size for the streamed Markdown
+WRITE_BUFFER = 1 << 16
+
+
+def render_version_history(history):
+    """Yield the version history (the text of the "Version History:" comment) as Markdown."""
+    if history is None:
+        return
 
-
-def extract_version_history(content):
-    """Extract version history from HTML comments."""
-    version_match = re.search(r'<!-- Version History:(.*?)-->', content, re.DOTALL)
-    if not version_match:
-        return ""
-
-    history = version_match.group(1).strip()
     lines = history.split('\n')
 
-    md_history = "## 📚 Version History\n\n"
+    yield "## 📚 Version History\n\n"
     current_version = None
 
     for line in lines:
@@ -43,349 +95,493 @@ def extract_version_history(content):
             if date_match:
                 date = date_match.group(1)
                 desc = desc_and_date[:date_match.start()].strip()
-                md_history += f"\n### {version_num}: {desc}\n**Date:** {date}\n\n"
+                yield f"\n### {version_num}: {desc}\n**Date:** {date}\n\n"
             else:
-                md_history += f"\n### {version_num}: {desc_and_date}\n\n"
+                yield f"\n### {version_num}: {desc_and_date}\n\n"
             current_version = version_num
         # Change items (start with -)
         elif line.startswith('-'):
-            md_history += f"- ✅ {line[1:].strip()}\n"
-
-    return md_history + "\n---\n\n"
-
+            yield f"- ✅ {line[1:].strip()}\n"
 
-def extract_metadata(content):
-    """Extract global metadata (format, last updated, total jobs)."""
-    format_match = re.search(r'Format: (.+)', content)
-    updated_match = re.search(r'Last Updated: (.+)', content)
-    jobs_match = re.search(r'Total Jobs: (.+)', content)
+    yield "\n---\n\n"
 
-    md = "## 📋 Document Information\n\n"
-    if format_match:
-        md += f"**Format:** {format_match.group(1)}  \n"
-    if updated_match:
-        md += f"**Last Updated:** {updated_match.group(1)}  \n"
-    if jobs_match:
-        md += f"**Total Positions:** {jobs_match.group(1)}  \n"
 
-    return md + "\n---\n\n"
+def render_metadata(history: JobHistory):
+    """Yield global metadata (format, last updated, total jobs)."""
+    yield "## 📋 Document Information\n\n"
+    if history.format is not None:
+        yield f"**Format:** {history.format}  \n"
+    if history.last_updated is not None:
+        yield f"**Last Updated:** {history.last_updated}  \n"
+    if history.total_jobs is not None:
+        yield f"**Total Positions:** {history.total_jobs}  \n"
 
+    yield "\n---\n\n"
 
-def extract_global_summary(content):
-    """Extract global professional summary."""
-    summary_match = re.search(r'<global_professional_summary>(.*?)</global_professional_summary>', content, re.DOTALL)
-    if not summary_match:
-        return ""
-    
-    md = "## ✍️ Global Professional Summary\n\n"
-    md += summary_match.group(1).strip() + "\n\n"
-    return md + "---\n\n"
 
+def render_global_summary(summary: Optional[str]):
+    """Yield the global professional summary."""
+    if summary is None:
+        return
 
-def extract_linkedin_narrative(content):
-    """Extract LinkedIn about narrative."""
-    about_match = re.search(r'<linkedin_about_narrative>(.*?)</linkedin_about_narrative>', content, re.DOTALL)
-    if not about_match:
-        # Fallback to older <about> tag if needed
-        about_match = re.search(r'<about>(.*?)</about>', content, re.DOTALL)
-        
-    if not about_match:
-        return ""
-    
-    md = "## 🔗 LinkedIn About Narrative\n\n"
-    md += about_match.group(1).strip() + "\n\n"
-    return md + "---\n\n"
+    yield "## ✍️ Global Professional Summary\n\n"
+    yield summary + "\n\n"
+    yield "---\n\n"
 
 
-def extract_education(content):
-    """Extract education section."""
-    education_match = re.search(r'<education>(.*?)</education>', content, re.DOTALL)
-    if not education_match:
-        return ""
+def render_linkedin_narrative(about: Optional[str]):
+    """Yield the LinkedIn about narrative."""
+    if about is None:
+        return
 
-    edu_content = education_match.group(1)
+    yield "## 🔗 LinkedIn About Narrative\n\n"
+    yield about + "\n\n"
+    yield "---\n\n"
 
-    md = "## 🎓 Education\n\n"
 
-    # Find all degrees
-    degrees = re.findall(r'<degree type="(.*?)">(.*?)</degree>', edu_content, re.DOTALL)
+def render_education(degrees: Optional[List[Degree]]):
+    """Yield the education section."""
+    if degrees is None:
+        return
 
-    for degree_type, degree_content in degrees:
-        title_match = re.search(r'<title>(.*?)</title>', degree_content)
-        inst_match = re.search(r'<institution>(.*?)</institution>', degree_content)
-        loc_match = re.search(r'<location>(.*?)</location>', degree_content)
+    yield "## 🎓 Education\n\n"
 
-        if title_match and inst_match:
-            md += f"### {title_match.group(1)}\n"
-            md += f"**Institution:** {inst_match.group(1)}  \n"
-            if loc_match:
-                md += f"**Location:** {loc_match.group(1)}  \n"
-            md += "\n"
+    for degree in degrees:
+        if degree.title is not None and degree.institution is not None:
+            yield f"### {degree.title}\n"
+            yield f"**Institution:** {degree.institution}  \n"
+            if degree.location is not None:
+                yield f"**Location:** {degree.location}  \n"
+            yield "\n"
 
-    return md + "---\n\n"
+    yield "---\n\n"
 
 
-def extract_certifications(content):
-    """Extract certifications section."""
-    cert_match = re.search(r'<certifications>(.*?)</certifications>', content, re.DOTALL)
-    if not cert_match:
-        return ""
+def render_certifications(certifications: Optional[List[Certification]]):
+    """Yield the certifications section."""
+    if certifications is None:
+        return
 
-    cert_content = cert_match.group(1)
+    yield "## 📜 Certifications\n\n"
 
-    md = "## 📜 Certifications\n\n"
+    for cert in certifications:
+        if cert.name is not None:
+            status_emoji = "✅" if cert.status == "active" else "📋"
+            yield f"{status_emoji} **{cert.name}**  \n"
+            if cert.issuer is not None:
+                yield f"   *Issuer:* {cert.issuer}  \n"
+            if cert.date_earned is not None:
+                yield f"   *Earned:* {cert.date_earned}  \n"
+            yield "\n"
 
-    # Find all certifications
-    certs = re.findall(r'<certification status="(.*?)">(.*?)</certification>', cert_content, re.DOTALL)
-
-    for status, cert_details in certs:
-        name_match = re.search(r'<name>(.*?)</name>', cert_details)
-        issuer_match = re.search(r'<issuer>(.*?)</issuer>', cert_details)
-        date_match = re.search(r'<date_earned>(.*?)</date_earned>', cert_details)
-
-        if name_match:
-            status_emoji = "✅" if status == "active" else "📋"
-            md += f"{status_emoji} **{name_match.group(1)}**  \n"
-            if issuer_match:
-                md += f"   *Issuer:* {issuer_match.group(1)}  \n"
-            if date_match:
-                md += f"   *Earned:* {date_match.group(1)}  \n"
-            md += "\n"
+    yield "---\n\n"
 
-    return md + "---\n\n"
 
-
-def extract_position(position_content, position_id):
-    """Extract and format a single position."""
+def render_position(position: Position):
+    """Yield a single position, formatted, one subsection at a time."""
     # Determine emoji based on position
-    position_emoji = "🎯" if position_id == "0" else "🏢"
-
-    # Extract title from header
-    title_match = re.search(r'POSITION \d+: (.+)', position_content)
-    if not title_match:
-        title_match = re.search(r'JOB POSITION \d+: (.+)', position_content)
-
-    title = title_match.group(1) if title_match else f"Position {position_id}"
-
-    md = f"## {position_emoji} Position {position_id}: {title}\n\n"
-
-    # Metadata - check for <metadata> or <job_metadata>
-    metadata_match = re.search(r'<(?:job_)?metadata>(.*?)</(?:job_)?metadata>', position_content, re.DOTALL)
-    if metadata_match:
-        metadata = metadata_match.group(1)
-
-        job_title = re.search(r'<job_title>(.*?)</job_title>', metadata)
-        company = re.search(r'<company>(.*?)</company>', metadata)
-        duration = re.search(r'<duration>(.*?)</duration>', metadata)
-        dates_section = re.search(r'<dates>(.*?)</dates>', metadata, re.DOTALL)
-
-        md += "### 📊 Metadata\n\n"
-        if job_title:
-            md += f"**Role:** {job_title.group(1)}  \n"
-        if company:
-            md += f"**Company:** {company.group(1)}  \n"
-        if dates_section:
-            start = re.search(r'<start>(.*?)</start>', dates_section.group(1))
-            end = re.search(r'<end>(.*?)</end>', dates_section.group(1))
-            if start and end:
-                md += f"**Period:** {start.group(1)} - {end.group(1)}  \n"
-        if duration:
-            md += f"**Duration:** {duration.group(1)}  \n"
-        md += "\n"
-
-    # Professional Summary
-    summary_match = re.search(r'<professional_summary>(.*?)</professional_summary>', position_content, re.DOTALL)
-    if summary_match:
-        summary = summary_match.group(1).strip()
-        md += "### 📝 Professional Summary\n\n"
-        md += f"{summary}\n\n"
-
-    # Core Responsibilities
-    resp_match = re.search(r'<core_responsibilities>(.*?)</core_responsibilities>', position_content, re.DOTALL)
-    if resp_match:
-        resp_content = resp_match.group(1).strip()
-        md += "### 🎯 Core Responsibilities\n\n"
-        # Extract bullet points
-        bullets = re.findall(r'- (.+?)(?=\n    -|\n  </core_responsibilities>|$)', resp_content, re.DOTALL)
-        for bullet in bullets:
-            bullet = bullet.strip().replace('\n    ', ' ')
-            md += f"- {bullet}\n"
-        md += "\n"
-
-    # Key Achievements
-    achievements_match = re.search(r'<key_achievements>(.*?)</key_achievements>', position_content, re.DOTALL)
-    if achievements_match:
-        ach_content = achievements_match.group(1).strip()
-        md += "### 🏆 Key Achievements\n\n"
-
-        # Check for structured achievements or bullet list
-        structured_achievements = re.findall(r'<achievement id="(\d+)".*?>(.*?)</achievement>', ach_content, re.DOTALL)
-
-        if structured_achievements:
-            for ach_id, ach_details in structured_achievements:
-                md += f"#### Achievement #{ach_id}\n\n"
-
-                context = re.search(r'<context>(.*?)</context>', ach_details, re.DOTALL)
-                action = re.search(r'<action>(.*?)</action>', ach_details, re.DOTALL)
-                result = re.search(r'<result>(.*?)</result>', ach_details, re.DOTALL)
-                impact = re.search(r'<impact>(.*?)</impact>', ach_details, re.DOTALL)
-
-                if context:
-                    md += f"**Context:** {context.group(1).strip()}\n\n"
-                if action:
-                    md += f"**Action:** {action.group(1).strip()}\n\n"
-                if result:
-                    md += f"**Result:** {result.group(1).strip()}\n\n"
-                if impact:
-                    md += f"**Impact:** {impact.group(1).strip()}\n\n"
-        else:
-            # Simple bullet list
-            bullets = re.findall(r'- (.+?)(?=\n    -|\n  </key_achievements>|$)', ach_content, re.DOTALL)
-            for bullet in bullets:
-                bullet = bullet.strip().replace('\n    ', ' ')
-                md += f"- ✅ {bullet}\n"
-
-        md += "\n"
-
-    # Hard Skills
-    hard_skills_match = re.search(r'<hard_skills_demonstrated>(.*?)</hard_skills_demonstrated>', position_content, re.DOTALL)
-    if hard_skills_match:
-        skills_content = hard_skills_match.group(1).strip()
-        md += "### 💼 Hard Skills Demonstrated\n\n"
-        bullets = re.findall(r'- (.+?)(?=\n    -|\n  </hard_skills_demonstrated>|$)', skills_content, re.DOTALL)
-        for bullet in bullets:
-            bullet = bullet.strip()
-            md += f"- {bullet}\n"
-        md += "\n"
-
-    # Soft Skills
-    soft_skills_match = re.search(r'<soft_skills_demonstrated>(.*?)</soft_skills_demonstrated>', position_content, re.DOTALL)
-    if soft_skills_match:
-        skills_content = soft_skills_match.group(1).strip()
-        md += "### 🤝 Soft Skills Demonstrated\n\n"
-        bullets = re.findall(r'- (.+?)(?=\n    -|\n  </soft_skills_demonstrated>|$)', skills_content, re.DOTALL)
-        for bullet in bullets:
-            bullet = bullet.strip()
-            md += f"- {bullet}\n"
-        md += "\n"
-
-    # Impact Metrics
-    metrics_match = re.search(r'<impact_metrics>(.*?)</impact_metrics>', position_content, re.DOTALL)
-    if metrics_match:
-        metrics_content = metrics_match.group(1).strip()
-        md += "### 📊 Impact Metrics\n\n"
-        md += "| Metric | Value |\n"
-        md += "|--------|-------|\n"
-
-        bullets = re.findall(r'- (.+?)(?=\n    -|\n  </impact_metrics>|$)', metrics_content, re.DOTALL)
-        for bullet in bullets:
-            bullet = bullet.strip()
+    position_emoji = "🎯" if position.id == "0" else "🏢"
+    title = position.title if position.title is not None else f"Position {position.id}"
+
+    yield f"## {position_emoji} Position {position.id}: {title}\n\n"
+
+    metadata = position.metadata
+    if metadata is not None:
+        yield "### 📊 Metadata\n\n"
+        if metadata.job_title is not None:
+            yield f"**Role:** {metadata.job_title}  \n"
+        if metadata.company is not None:
+            yield f"**Company:** {metadata.company}  \n"
+        if metadata.start is not None and metadata.end is not None:
+            yield f"**Period:** {metadata.start} - {metadata.end}  \n"
+        if metadata.duration is not None:
+            yield f"**Duration:** {metadata.duration}  \n"
+        yield "\n"
+
+    if position.professional_summary is not None:
+        yield "### 📝 Professional Summary\n\n"
+        yield f"{position.professional_summary}\n\n"
+
+    if position.core_responsibilities is not None:
+        yield "### 🎯 Core Responsibilities\n\n"
+        for bullet in position.core_responsibilities:
+            yield f"- {bullet}\n"
+        yield "\n"
+
+    if position.key_achievements is not None:
+        yield "### 🏆 Key Achievements\n\n"
+        for achievement in position.key_achievements:
+            if achievement.text is not None:
+                yield f"- ✅ {achievement.text}\n"
+                continue
+            yield f"#### Achievement #{achievement.id}\n\n"
+            if achievement.context is not None:
+                yield f"**Context:** {achievement.context}\n\n"
+            if achievement.action is not None:
+                yield f"**Action:** {achievement.action}\n\n"
+            if achievement.result is not None:
+                yield f"**Result:** {achievement.result}\n\n"
+            if achievement.impact is not None:
+                yield f"**Impact:** {achievement.impact}\n\n"
+        yield "\n"
+
+    if position.hard_skills is not None:
+        yield "### 💼 Hard Skills Demonstrated\n\n"
+        for bullet in position.hard_skills:
+            yield f"- {bullet}\n"
+        yield "\n"
+
+    if position.soft_skills is not None:
+        yield "### 🤝 Soft Skills Demonstrated\n\n"
+        for bullet in position.soft_skills:
+            yield f"- {bullet}\n"
+        yield "\n"
+
+    if position.impact_metrics is not None:
+        yield "### 📊 Impact Metrics\n\n"
+        yield "| Metric | Value |\n"
+        yield "|--------|-------|\n"
+        for bullet in position.impact_metrics:
             # Try to split metric into label and value
             if ':' in bullet:
-                parts = bullet.split(':', 1)
-                metric_name = parts[0].strip()
-                metric_value = parts[1].strip()
-                md += f"| {metric_name} | {metric_value} |\n"
+                metric_name, metric_value = bullet.split(':', 1)
+                yield f"| {metric_name.strip()} | {metric_value.strip()} |\n"
             else:
-                md += f"| Achievement | {bullet} |\n"
-        md += "\n"
-
-    # Tools & Technologies
-    tools_match = re.search(r'<tools_technologies>(.*?)</tools_technologies>', position_content, re.DOTALL)
-    if tools_match:
-        tools_content = tools_match.group(1).strip()
-        md += "### 🛠️ Tools & Technologies\n\n"
-        bullets = re.findall(r'- (.+?)(?=\n    -|\n  </tools_technologies>|$)', tools_content, re.DOTALL)
-        if bullets:
-            for bullet in bullets:
-                md += f"- {bullet.strip()}\n"
-        else:
-            # Fallback for comma separated
-            tools = [t.strip() for t in re.split(r'[,;]\s*|\n', tools_content) if t.strip()]
-            for tool in tools:
-                md += f"- {tool}\n"
-        md += "\n"
-
-    md += "---\n\n"
-    return md
-
-
-def convert_to_markdown(txt_file_path, output_file_path=None):
-    """Convert job history .txt to .md format."""
-    # Read input file
-    with open(txt_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
+                yield f"| Achievement | {bullet} |\n"
+        yield "\n"
+
+    if position.tools is not None:
+        yield "### 🛠️ Tools & Technologies\n\n"
+        for tool in position.tools:
+            yield f"- {tool}\n"
+        yield "\n"
+
+    yield "---\n\n"
+
+
+def document_positions(positions: Iterable[Position]) -> Iterator[Position]:
+    """The positions written after Position 0: numbered ones, in document order."""
+    for position in positions:
+        if position.id.isdigit() and position.id != "0":
+            yield position
+
+
+def rendered_positions(positions: Iterable[Position]) -> Iterator[str]:
+    """Fragments for every numbered position except Position 0 (rendered first, on its own)."""
+    for position in document_positions(positions):
+        yield from render_position(position)
+
+
+def iter_document(history: JobHistory, position_zero: Iterable[str], positions: Iterable[str]):
+    """
+    Yield the document in convert_to_markdown's order: the header and global
+    sections from history, then the fragments of position_zero and
+    positions (which may still be streaming from the scan).
+    """
+    title = history.version or "Job History"
+
+    yield f"# 📋 Comprehensive Job History Summaries\n## Version {title}\n\n"
+    yield "---\n\n"
+    yield from render_version_history(history.version_history)
+    yield from render_global_summary(history.global_summary)
+    yield from render_linkedin_narrative(history.linkedin_about)
+    yield from render_education(history.education)
+    yield from render_certifications(history.certifications)
+    yield from position_zero
+    yield from positions
+
+
+def render_history(history: JobHistory) -> Iterator[str]:
+    """Yield the Markdown for a parsed job history."""
+    position_zero = history.first_position_zero()
+    return iter_document(history, render_position(position_zero) if position_zero else (),
+                         rendered_positions(history.positions))
+
+
+# What must be seen before the document head (global sections, Position 0)
+# can be written
+_HEAD_RE = lazy_compile(rb'<(?:%s)>|<position\b[^<>]*\bid\s*=\s*["\']0["\']'
+                      % '|'.join(GLOBAL_SECTIONS).encode('ascii'))
+
+
+def mapped_parts(data) -> Tuple[JobHistory, Optional[Position], Iterator[Position]]:
+    """
+    Parse a mapped (bytes) job history for streaming output: the history
+    with its header and global sections, Position 0, and an iterator over
+    the other positions, each parsed as its closing tag is scanned. Only
+    the slices being parsed are decoded. Positions are held back only
+    while a global section or Position 0 may still follow them (normally
+    they all come first).
+    """
+    builder = TreeBuilder(data, sections=('position',) + GLOBAL_SECTIONS, detach=True)
+    model = HistoryBuilder(builder.tree, retain=False)
+    head_end = -1
+    for m in _HEAD_RE.finditer(data):
+        head_end = m.start()
+
+    elements = itertools.chain(builder.feed(), builder.finish())
+    position_zero = None
+    pending = []
+    for element in elements:
+        position = model.add(element)
+        if position is not None:
+            if position.id == "0" and position_zero is None:
+                position_zero = position
+            else:
+                pending.append(position)
+        if element.parent is builder.tree.root and element.end > head_end:
+            break
+
+    history = model.header()
+    if position_zero is None:
+        position_zero = position_zero_from_text(data)
+
+    def positions():
+        yield from pending
+        for element in elements:
+            position = model.add(element)
+            if position is not None:
+                yield position
+
+    return history, position_zero, positions()
+
+
+def iter_mapped(data):
+    """Yield Markdown for a mapped (bytes) job history, matching iter_markdown."""
+    history, position_zero, positions = mapped_parts(data)
+    yield from iter_document(history, render_position(position_zero) if position_zero else (),
+                             rendered_positions(positions))
+
+
+def iter_markdown(content):
+    """Yield the Markdown for job history text, section by section."""
+    return render_history(parse_job_history(content))
+
+
+def convert_to_markdown(txt_file_path, output_file_path=None, use_mmap=None, use_cache=True,
+                        digest=None, verbose=True):
+    """
+    Convert job history .txt to .md format, writing fragments as they are
+    rendered. output_file_path "-" writes to stdout.
+    use_mmap: map the file and scan it as bytes (default: files of
+              MMAP_THRESHOLD bytes or more).
+    use_cache: reuse the Markdown (or at least the parsed model) cached
+               when this exact file was converted (or parsed) before, and
+               store them otherwise.
+    digest: the input's source_digest(), when the caller already has it.
+    """
     # Determine output path
     if output_file_path is None:
         output_file_path = Path(txt_file_path).with_suffix('.md')
 
-    # Extract title
-    title_match = re.search(r'COMPREHENSIVE JOB HISTORY SUMMARIES - VERSION (.+)', content)
-    title = title_match.group(1) if title_match else "Job History"
-
-    # Build markdown
-    md = f"# 📋 Comprehensive Job History Summaries\n## Version {title}\n\n"
-    md += "---\n\n"
-
-    # Add version history
-    md += extract_version_history(content)
-
-    # Add global summary
-    md += extract_global_summary(content)
-
-    # Add LinkedIn narrative
-    md += extract_linkedin_narrative(content)
-
-    # Add education
-    md += extract_education(content)
-
-    # Add certifications
-    md += extract_certifications(content)
-
-    # Handle Position 0 (Special case - may not be wrapped in <position>)
-    p0_match = re.search(r'JOB POSITION 0:.*?(?=== POSITION 1|==\s*POSITION 1|<\/impact_metrics>|<\/hard_skills_demonstrated>)', content, re.DOTALL | re.IGNORECASE)
-    if p0_match:
-        p0_content = p0_match.group(0)
-        # Wrap it for extract_position if not wrapped
-        if '<position' not in p0_content:
-            p0_content = '<position id="0">' + p0_content + '</position>'
-        md += extract_position(p0_content, "0")
-
-    # Extract all other positions (including Position 0 if it WAS wrapped)
-    positions = re.findall(r'<position id="(\d+)">(.*?)</position>', content, re.DOTALL)
-
-    for position_id, position_content in positions:
-        if position_id == "0": continue # Already handled or will be handled below
-        
-        # Find the header for this position
-        header_pattern = f'(?:JOB )?POSITION {position_id}:.*?(?=<position id="{position_id}">)'
-        header_match = re.search(header_pattern, content, re.DOTALL | re.IGNORECASE)
-        if header_match:
-            full_position = header_match.group(0) + f'<position id="{position_id}">' + position_content + '</position>'
-        else:
-            full_position = f'<position id="{position_id}">' + position_content + '</position>'
-
-        md += extract_position(full_position, position_id)
+    if use_mmap is None:
+        use_mmap = os.path.getsize(txt_file_path) >= MMAP_THRESHOLD
+    if use_mmap and os.path.getsize(txt_file_path) > 0:
+        with open(txt_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _write_markdown(txt_file_path, output_file_path, iter_mapped(data), verbose)
+
+    if not use_cache:
+        history = load_job_history(txt_file_path, use_cache=False)
+        return _write_markdown(txt_file_path, output_file_path, render_history(history), verbose)
+
+    digest = digest or source_digest(txt_file_path)
+    markdown = get_cache().get(CACHE_TOOL, renderer_digest(), digest)
+    if isinstance(markdown, str):
+        return _write_markdown(txt_file_path, output_file_path, [markdown], verbose)
+
+    history = load_job_history(txt_file_path, digest=digest)
+    fragments = []
+    output_file_path = _write_markdown(txt_file_path, output_file_path,
+                                       _collect(render_history(history), fragments), verbose)
+    get_cache().put(CACHE_TOOL, renderer_digest(), digest, ''.join(fragments))
+    return output_file_path
 
-    # Write output
-    with open(output_file_path, 'w', encoding='utf-8') as f:
-        f.write(md)
 
-    print(f"✅ Converted {txt_file_path} to {output_file_path}")
+def _collect(fragments: Iterable[str], into: List[str]) -> Iterator[str]:
+    """Pass fragments through while keeping them."""
+    for fragment in fragments:
+        into.append(fragment)
+        yield fragment
+
+
+def _write_markdown(txt_file_path, output_file_path, fragments, verbose=True):
+    """
+    Stream fragments through a buffered writer (or stdout for "-"). Files are
+    written to a temporary sibling and renamed into place, so a reader (or a
+    failed conversion) never leaves a half-written .md behind.
+    """
+    if str(output_file_path) == '-':
+        sys.stdout.writelines(fragments)
+        sys.stdout.flush()
+        print(f"✅ Converted {txt_file_path} to stdout", file=sys.stderr)
+        return output_file_path
+
+    output_file_path = Path(output_file_path)
+    tmp = output_file_path.with_name(f".{output_file_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8', buffering=WRITE_BUFFER) as f:
+            f.writelines(fragments)
+        os.replace(tmp, output_file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+    if verbose:
+        print(f"✅ Converted {txt_file_path} to {output_file_path}")
     return output_file_path
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python convert_job_history_to_md.py input.txt [output.md]")
+# ----------------------------------------------------------------------------
+# Batch conversion
+# ----------------------------------------------------------------------------
+# For each written .md, the SHA-256 of the input it was rendered from (and which renderer)
+BATCH_MANIFEST = REPO_ROOT / ".cache" / "omr" / "md_batch.json"
+
+# Files whose changes alter the rendered Markdown; editing any of them
+# invalidates every manifest entry and cached rendering
+RENDERER_FILES = (Path(__file__).resolve(), REPO_ROOT / "scripts" / "job_history_model.py")
+
+
+def renderer_digest() -> str:
+    return source_version(RENDERER_FILES)
+
+
+def find_histories(root, pattern="*.txt") -> List[Path]:
+    """Job history files under root, skipping hidden directories (.git, .cache, ...)."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        found.extend(Path(dirpath) / name for name in sorted(filenames) if fnmatch.fnmatch(name, pattern))
+    return found
+
+
+def _load_manifest(renderer: str) -> Dict:
+    try:
+        with open(BATCH_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("renderer") != renderer:
+        return {}
+    return manifest.get("files", {})
+
+
+def _save_manifest(renderer: str, updates: Dict):
+    """Merge this run's entries into the manifest, under a lock so parallel batches keep each other's entries."""
+    from compliance_tracker import _FileLock
+
+    try:
+        BATCH_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+        with _FileLock(BATCH_MANIFEST.with_suffix(".lock")):
+            files = _load_manifest(renderer)
+            files.update(updates)
+            tmp = BATCH_MANIFEST.with_name(f"{BATCH_MANIFEST.name}.{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({"renderer": renderer, "files": files}, f, separators=(',', ':'))
+            os.replace(tmp, BATCH_MANIFEST)
+    except OSError:
+        pass
+
+
+def _batch_job(job: Tuple[str, str, Optional[str], bool]) -> Tuple[str, str, str, int, Optional[str], Optional[str]]:
+    """
+    Convert one file unless its output is current. Runs in a worker process.
+    Returns (input, output, status, input bytes, digest, error) where status
+    is "converted", "skipped" or "failed".
+    """
+    source, target, known_digest, use_cache = job
+    try:
+        size = os.path.getsize(source)
+        digest = source_digest(source)
+        if (known_digest == digest and os.path.exists(target)
+                and os.path.getmtime(target) >= os.path.getmtime(source)):
+            return source, target, "skipped", size, digest, None
+        convert_to_markdown(source, target, use_cache=use_cache, digest=digest, verbose=False)
+        return source, target, "converted", size, digest, None
+    except Exception as e:
+        return source, target, "failed", 0, None, f"{type(e).__name__}: {e}"
+
+
+def convert_directory(root, out_dir=None, pattern="*.txt", jobs=None, force=False, use_cache=True) -> Dict[str, int]:
+    """
+    Convert every job history under root with a process pool. A file is
+    skipped when its .md is newer than it and its SHA-256 matches the one
+    recorded when that .md was written by the current renderer.
+    out_dir mirrors root's layout instead of writing next to each input.
+    """
+    root = Path(root)
+    started = time.perf_counter()
+    renderer = renderer_digest()
+    known = {} if force else _load_manifest(renderer)
+
+    work = []
+    for source in find_histories(root, pattern):
+        target = (Path(out_dir) / source.relative_to(root) if out_dir else source).with_suffix('.md')
+        target.parent.mkdir(parents=True, exist_ok=True)
+        work.append((str(source), str(target), known.get(str(target.resolve())), use_cache))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(work) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            results = list(pool.map(_batch_job, work, chunksize=max(1, len(work) // (jobs * 4))))
+    else:
+        results = [_batch_job(job) for job in work]
+
+    totals = {"converted": 0, "skipped": 0, "failed": 0, "bytes": 0}
+    updates = {}
+    for source, target, status, size, digest, error in results:
+        totals[status] += 1
+        totals["bytes"] += size
+        if error:
+            print(f"❌ {source}: {error}", file=sys.stderr)
+        elif status == "converted":
+            updates[str(Path(target).resolve())] = digest
+    if updates:
+        _save_manifest(renderer, updates)
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    count = len(results)
+    print(f"{'✅' if not totals['failed'] else '⚠️ '} {count} file(s) in {elapsed:.2f}s: "
+          f"{totals['converted']} converted, {totals['skipped']} up to date (cache hits), "
+          f"{totals['failed']} failed")
+    print(f"   {count / elapsed:.1f} files/s, {totals['bytes'] / (1024 * 1024) / elapsed:.1f} MB/s")
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a job history .txt file (or a directory of them) to Markdown.")
+    parser.add_argument("input", help="Job history .txt file, or a directory to convert in batch")
+    parser.add_argument("output", nargs="?",
+                        help='Output .md file, or "-" for stdout (default: input with .md extension); '
+                             'for a directory, the output directory (default: next to each input)')
+    parser.add_argument("--mmap", action="store_true", default=None,
+                        help=f"Memory-map the input (default for files >= {MMAP_THRESHOLD // (1024 * 1024)} MB)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Parse the file even if its model is cached")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Batch mode: worker processes (default: CPU count)")
+    parser.add_argument("--pattern", default="*.txt",
+                        help="Batch mode: file name pattern to convert (default: *.txt)")
+    parser.add_argument("--force", action="store_true",
+                        help="Batch mode: convert every file, even if its .md is up to date")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"Error: File not found: {args.input}")
         sys.exit(1)
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    if os.path.isdir(args.input):
+        totals = convert_directory(args.input, args.output, pattern=args.pattern, jobs=args.jobs,
+                                   force=args.force, use_cache=not args.no_cache)
+        sys.exit(1 if totals["failed"] else 0)
+
+    convert_to_markdown(args.input, args.output, use_mmap=args.mmap, use_cache=not args.no_cache)
 
-    if not os.path.exists(input_file):
-        print(f"Error: File not found: {input_file}")
-        sys.exit(1)
 
-    convert_to_markdown(input_file, output_file)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+diff_job_history.py - Structural Diff Between Job History Versions
+
+Purpose: Reports what changed between two versions of a job history file
+         (positions added or removed; achievements, responsibilities, skills,
+         tools and metrics added, removed or changed; global sections
+         rewritten) and writes a ready-to-paste "vX.Y:" entry for the
+         <!-- Version History: --> block.
+
+         Both files are loaded as job history models (job_history_model.py,
+         from its cache when available) and compared as Merkle trees: the
+         document hashes to one digest per global section and one per
+         position. Equal digests are skipped without looking inside; only
+         positions whose digest differs are hashed section by section, and
+         only differing sections item by item, so the comparison work
+         follows the size of the changes rather than of the documents.
+         Positions are matched by content first, then by company and title,
+         then by id, so renumbering after inserting a job is not reported
+         as a rewrite of every position.
+
+Usage:
+    python scripts/diff_job_history.py job_history_v12.txt job_history_v13.txt
+    python scripts/diff_job_history.py old.txt new.txt --changelog
+    python scripts/diff_job_history.py old.txt new.txt --changelog --version v13.1 --summary "Added Acme role"
+    python scripts/diff_job_history.py old.txt new.txt --json
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import marshal
+import os
+import re
+import sys
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from job_history_model import JobHistory, Position, _pack, as_dict, load_job_history
+
+# Unmatched removed/added items at least this similar are reported as one changed item
+CHANGED_RATIO = 0.6
+
+# Quoted item text is cut to this many characters in reports
+QUOTE_WIDTH = 72
+
+# Position sections in report order: (model field, singular label)
+POSITION_LISTS = (
+    ("core_responsibilities", "responsibility"),
+    ("key_achievements", "achievement"),
+    ("impact_metrics", "metric"),
+    ("hard_skills", "hard skill"),
+    ("soft_skills", "soft skill"),
+    ("tools", "tool"),
+    ("honest_limitations", "limitation"),
+)
+
+# Lists whose entries are names: only additions and removals are meaningful
+NAME_LISTS = {"hard_skills", "soft_skills", "tools"}
+
+GLOBAL_TEXT = (("global_summary", "Global summary"), ("linkedin_about", "LinkedIn about"))
+
+METADATA_LABELS = {
+    "job_title": "job title",
+    "company": "company",
+    "contract_type": "contract type",
+    "start": "start date",
+    "end": "end date",
+    "duration": "duration",
+    "location": "location",
+    "work_arrangement": "work arrangement",
+}
+
+
+# ---------------------------------------------------------------------------
+# Merkle digests
+# ---------------------------------------------------------------------------
+
+def digest(value) -> bytes:
+    """Digest of a model value (dataclass, list or plain value)."""
+    return hashlib.blake2b(marshal.dumps(_pack(value)), digest_size=16).digest()
+
+
+def position_digests(position: Position) -> Dict[str, bytes]:
+    """One digest per position section; only computed for positions whose digest differs."""
+    return {name: digest(getattr(position, name)) for name in position.__slots__ if name != "id"}
+
+
+def document_digests(history: JobHistory) -> Tuple[Dict[str, bytes], List[bytes]]:
+    """({global section: digest}, [position digest]); the id is not part of a position's digest."""
+    sections = {name: digest(getattr(history, name))
+                for name in ("global_summary", "linkedin_about", "education", "certifications")}
+    positions = [digest(_pack(position)[1:]) for position in _positions(history)]
+    return sections, positions
+
+
+def _positions(history: JobHistory) -> List[Position]:
+    position_zero = history.first_position_zero()
+    return ([position_zero] if history.position_zero else []) + history.positions
+
+
+# ---------------------------------------------------------------------------
+# Changes
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class Change:
+    """One difference. scope is "Position N (...)" or a global section name."""
+    scope: str
+    kind: str       # "added", "removed" or "changed"
+    what: str       # "position", "achievement", "hard skill", "end date", ...
+    old: Optional[str] = None
+    new: Optional[str] = None
+
+    def describe(self) -> str:
+        if self.kind == "changed" and self.old is not None and self.new is not None:
+            return f"{self.what}: {_quote(self.old)} → {_quote(self.new)}"
+        return f"{self.kind} {self.what}: {_quote(self.new if self.kind == 'added' else self.old)}"
+
+
+def _quote(text: Optional[str]) -> str:
+    text = " ".join((text or "").split())
+    return f'"{text[:QUOTE_WIDTH - 1]}…"' if len(text) > QUOTE_WIDTH else f'"{text}"'
+
+
+def _label(position: Position) -> str:
+    meta = position.metadata
+    if meta and (meta.job_title or meta.company):
+        return " at ".join(part for part in (meta.job_title, meta.company) if part)
+    return position.title or ""
+
+
+def _scope(position: Position) -> str:
+    label = _label(position)
+    return f"Position {position.id}" + (f" ({label})" if label else "")
+
+
+def _identity(position: Position) -> Optional[Tuple[str, str]]:
+    meta = position.metadata
+    if not meta or not (meta.job_title or meta.company):
+        return None
+    return ((meta.company or "").strip().lower(), (meta.job_title or "").strip().lower())
+
+
+def _item_text(item) -> str:
+    """Text of a list entry; structured achievements read as context/action/result/impact."""
+    if isinstance(item, str):
+        return item
+    if item.text:
+        return item.text
+    return " ".join(part for part in (item.context, item.action, item.result, item.impact) if part)
+
+
+def diff_items(scope: str, what: str, old: Optional[list], new: Optional[list], names: bool = False) -> List[Change]:
+    """
+    Changes between two lists of section entries. Entries present on both
+    sides (by digest, as a multiset) are skipped; of the rest, achievements
+    with the same id and sufficiently similar texts pair up as "changed".
+    """
+    remaining = {}
+    for item in old or []:
+        remaining.setdefault(digest(item), []).append(item)
+    added = []
+    for item in new or []:
+        bucket = remaining.get(digest(item))
+        if bucket:
+            bucket.pop()
+        else:
+            added.append(item)
+    removed = [item for bucket in remaining.values() for item in bucket]
+
+    changes = []
+    if not names:
+        by_id = {item.id: item for item in removed if not isinstance(item, str) and item.id}
+        for item in list(added):
+            previous = by_id.pop(getattr(item, "id", None) or object(), None)
+            if previous is not None:
+                changes.append(Change(scope, "changed", what, _item_text(previous), _item_text(item)))
+                added.remove(item)
+                removed.remove(previous)
+        for item in list(added):
+            text = _item_text(item)
+            best, best_ratio = None, CHANGED_RATIO
+            for candidate in removed:
+                matcher = difflib.SequenceMatcher(None, _item_text(candidate), text, autojunk=False)
+                if matcher.real_quick_ratio() >= best_ratio and matcher.quick_ratio() >= best_ratio:
+                    ratio = matcher.ratio()
+                    if ratio >= best_ratio:
+                        best, best_ratio = candidate, ratio
+            if best is not None:
+                changes.append(Change(scope, "changed", what, _item_text(best), text))
+                added.remove(item)
+                removed.remove(best)
+    changes.extend(Change(scope, "removed", what, old=_item_text(item)) for item in removed)
+    changes.extend(Change(scope, "added", what, new=_item_text(item)) for item in added)
+    return changes
+
+
+def diff_position(old: Position, new: Position) -> List[Change]:
+    """Changes inside one matched position, descending only into sections whose digest differs."""
+    scope = _scope(new)
+    old_digests, new_digests = position_digests(old), position_digests(new)
+    changes = []
+    if old_digests["metadata"] != new_digests["metadata"]:
+        old_meta, new_meta = as_dict(old.metadata) or {}, as_dict(new.metadata) or {}
+        for name, label in METADATA_LABELS.items():
+            if old_meta.get(name) != new_meta.get(name):
+                changes.append(Change(scope, "changed", label, old_meta.get(name) or "", new_meta.get(name) or ""))
+    if old_digests["professional_summary"] != new_digests["professional_summary"]:
+        changes.append(Change(scope, "changed", "professional summary", old.professional_summary or "",
+                              new.professional_summary or ""))
+    for name, what in POSITION_LISTS:
+        if old_digests[name] != new_digests[name]:
+            changes.extend(diff_items(scope, what, getattr(old, name), getattr(new, name), names=name in NAME_LISTS))
+    return changes
+
+
+def match_positions(old: List[Position], new: List[Position],
+                    old_digests: List[bytes], new_digests: List[bytes]) -> Tuple[List[Tuple[Position, Position]],
+                                                                                List[Position], List[Position]]:
+    """
+    (changed pairs, removed, added). Positions with equal digests are
+    unchanged wherever they moved; the rest pair by company and title,
+    then by id.
+    """
+    unchanged = {}
+    for index, value in enumerate(old_digests):
+        unchanged.setdefault(value, []).append(index)
+    left_new = []
+    for index, value in enumerate(new_digests):
+        bucket = unchanged.get(value)
+        if bucket:
+            bucket.pop(0)
+        else:
+            left_new.append(index)
+    left_old = sorted(index for bucket in unchanged.values() for index in bucket)
+
+    pairs = []
+    for key in (_identity, lambda position: position.id):
+        candidates = {}
+        for index in left_old:
+            value = key(old[index])
+            if value is not None:
+                candidates.setdefault(value, index)
+        still_new = []
+        for index in left_new:
+            match = candidates.pop(key(new[index]), None) if key(new[index]) is not None else None
+            if match is None:
+                still_new.append(index)
+            else:
+                pairs.append((old[match], new[index]))
+                left_old.remove(match)
+        left_new = still_new
+    return pairs, [old[index] for index in left_old], [new[index] for index in left_new]
+
+
+def diff_histories(old: JobHistory, new: JobHistory) -> List[Change]:
+    """All changes from old to new, globals first, then positions in new document order."""
+    old_sections, old_position_digests = document_digests(old)
+    new_sections, new_position_digests = document_digests(new)
+    changes = []
+
+    for name, label in GLOBAL_TEXT:
+        if old_sections[name] != new_sections[name]:
+            changes.append(Change(label, "changed", "text", getattr(old, name) or "", getattr(new, name) or ""))
+    if old_sections["education"] != new_sections["education"]:
+        changes.extend(diff_items("Education", "degree",
+                                  [_degree(d) for d in old.education or []], [_degree(d) for d in new.education or []]))
+    if old_sections["certifications"] != new_sections["certifications"]:
+        changes.extend(diff_items("Certifications", "certification",
+                                  [_certification(c) for c in old.certifications or []],
+                                  [_certification(c) for c in new.certifications or []]))
+
+    if old_position_digests != new_position_digests:
+        old_positions, new_positions = _positions(old), _positions(new)
+        pairs, removed, added = match_positions(old_positions, new_positions,
+                                                old_position_digests, new_position_digests)
+        changes.extend(Change(_scope(p), "removed", "position", old=_label(p)) for p in removed)
+        changes.extend(Change(_scope(p), "added", "position", new=_label(p)) for p in added)
+        for old_position, new_position in pairs:
+            changes.extend(diff_position(old_position, new_position))
+    return changes
+
+
+def _degree(degree) -> str:
+    return ", ".join(part for part in (degree.title or degree.type, degree.institution, degree.graduation_date) if part)
+
+
+def _certification(certification) -> str:
+    details = ", ".join(part for part in (certification.issuer, certification.status, certification.date_earned) if part)
+    return f"{certification.name} ({details})" if details else certification.name or ""
+
+
+# ---------------------------------------------------------------------------
+# Changelog
+# ---------------------------------------------------------------------------
+
+def _version_numbers(version: Optional[str]) -> Optional[Tuple[int, int]]:
+    match = re.search(r'(\d+)\.(\d+)', version or "")
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def next_version(old: JobHistory, new: JobHistory, changes: List[Change]) -> str:
+    """
+    The new file's own version when it is ahead of the old one, otherwise
+    the old version bumped: major when positions were added or removed
+    (templates/README.md), minor for anything else.
+    """
+    old_number, new_number = _version_numbers(old.version), _version_numbers(new.version)
+    if new_number and (not old_number or new_number > old_number):
+        return f"v{new_number[0]}.{new_number[1]}"
+    if not old_number:
+        return "vX.Y"
+    if any(change.what == "position" for change in changes):
+        return f"v{old_number[0] + 1}.0"
+    return f"v{old_number[0]}.{old_number[1] + 1}"
+
+
+def _count(n: int, noun: str) -> str:
+    return f"{n} {noun if n == 1 else _plural(noun)}"
+
+
+def _plural(noun: str) -> str:
+    return noun[:-1] + "ies" if noun.endswith("y") else noun + "s"
+
+
+def summarize(changes: List[Change]) -> str:
+    """One-line description for the changelog header."""
+    added = [c for c in changes if c.what == "position" and c.kind == "added"]
+    removed = [c for c in changes if c.what == "position" and c.kind == "removed"]
+    updated = {c.scope for c in changes if c.scope.startswith("Position") and c.what != "position"}
+    globals_ = sorted({c.scope for c in changes if not c.scope.startswith("Position")})
+    parts = []
+    if added:
+        parts.append(f"Added {_count(len(added), 'position')}")
+    if removed:
+        parts.append(f"removed {_count(len(removed), 'position')}")
+    if updated:
+        parts.append(f"updated {_count(len(updated), 'position')}")
+    if globals_:
+        parts.append("revised " + ", ".join(name.lower() for name in globals_))
+    text = "; ".join(parts) or "No content changes"
+    return text[0].upper() + text[1:]
+
+
+def _group_lines(changes: List[Change]) -> Iterable[str]:
+    """Changelog bullets: one per added/removed position, one per kind of change inside a scope."""
+    scopes: Dict[str, List[Change]] = {}
+    for change in changes:
+        scopes.setdefault(change.scope, []).append(change)
+    for scope, items in scopes.items():
+        for change in items:
+            if change.what == "position":
+                yield f"{'Added' if change.kind == 'added' else 'Removed'} {scope}"
+        groups: Dict[Tuple[str, str], List[Change]] = {}
+        for change in items:
+            if change.what != "position":
+                groups.setdefault((change.kind, change.what), []).append(change)
+        parts = []
+        for (kind, what), group in groups.items():
+            if what in {"hard skill", "soft skill", "tool", "certification", "degree"} and kind != "changed":
+                names = ", ".join((c.new if kind == "added" else c.old) or "" for c in group)
+                parts.append(f"{kind} {_plural(what) if len(group) > 1 else what} {names}")
+            elif what in METADATA_LABELS.values():
+                parts.append(f"{what} now {_quote(group[-1].new)}")
+            elif kind == "changed" and len(group) == 1 and group[0].what in {"text", "professional summary"}:
+                parts.append(f"revised {what}" if what != "text" else "revised")
+            else:
+                parts.append(f"{kind} {_count(len(group), what)}")
+        if parts:
+            yield f"{scope}: {'; '.join(parts)}"
+
+
+def changelog(version: str, summary: str, changes: List[Change], when: Optional[date] = None) -> str:
+    """A "vX.Y: Summary (Month Day, Year)" block with one "  - " line per group of changes."""
+    when = when or date.today()
+    lines = [f"{version}: {summary} ({when:%B} {when.day}, {when.year})"]
+    lines.extend(f"  - {line}" for line in _group_lines(changes))
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Structural diff between two job history versions.")
+    parser.add_argument("old", help="Earlier job history .txt")
+    parser.add_argument("new", help="Later job history .txt")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--changelog", action="store_true", help="Print only the version history entry")
+    output.add_argument("--json", action="store_true", help="Print the changes as JSON")
+    parser.add_argument("--version", help="Version for the changelog entry (default: derived from both files)")
+    parser.add_argument("--summary", help="Description for the changelog entry (default: generated)")
+    parser.add_argument("--no-cache", action="store_true", help="Parse files even if their model is cached")
+    args = parser.parse_args()
+
+    missing = [path for path in (args.old, args.new) if not os.path.exists(path)]
+    if missing:
+        print(f"Error: File not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    old = load_job_history(args.old, use_cache=not args.no_cache)
+    new = load_job_history(args.new, use_cache=not args.no_cache)
+    changes = diff_histories(old, new)
+    if not changes:
+        print(f"✅ No structural changes between {args.old} and {args.new}", file=sys.stderr if args.changelog else sys.stdout)
+        return
+    version = args.version or next_version(old, new, changes)
+    entry = changelog(version, args.summary or summarize(changes), changes)
+
+    if args.json:
+        print(json.dumps({"version": version, "changes": [as_dict(c) for c in changes], "changelog": entry},
+                         indent=2, ensure_ascii=False))
+        return
+    if args.changelog:
+        print(entry)
+        return
+
+    print(f"🔍 {args.old} → {args.new}: {len(changes)} change(s)\n")
+    scope = None
+    for change in changes:
+        if change.scope != scope:
+            scope = change.scope
+            print(scope)
+        print(f"  • {change.describe()}")
+    print(f"\n📝 Version history entry:\n\n{entry}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+drift_detector.py - Layer 5: Online Enforcement-Drift Detection
+
+Purpose: Detects when a guardrail starts failing more often for a platform or
+         model. Each logged run updates a constant-size state per
+         (guardrail, platform, model):
+         - fast EWMA of the pass rate (current behaviour)
+         - slow EWMA baseline (long-run behaviour, frozen while alerting)
+         - one-sided CUSUM of the pass-rate drop below the baseline
+         - pass count over a sliding window of the last N runs (bitmask)
+
+         No history is rescanned, so the update is cheap enough to run inline
+         every time compliance is logged.
+
+Usage:
+    python scripts/drift_detector.py status [--alerting]
+    python scripts/drift_detector.py replay     # rebuild state from the full log
+"""
+
+import argparse
+import json
+import os
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from compliance_tracker import LOG_DIR, _FileLock
+
+STATE_FILE = "drift_state.json"
+
+# Detector tuning
+FAST_ALPHA = 0.2          # EWMA weight for the current pass rate
+SLOW_ALPHA = 0.02         # EWMA weight for the baseline
+CUSUM_ALLOWANCE = 0.05    # k: pass-rate drop tolerated before CUSUM accumulates
+CUSUM_THRESHOLD = 4.0     # h: CUSUM level that raises an alert
+WINDOW_SIZE = 50          # sliding window length (runs)
+MIN_RUNS = 20             # no alerts until the baseline has this many runs
+RECOVERY_MARGIN = 0.05    # alert clears when the EWMA is back within this of the baseline
+
+
+@dataclass
+class GuardrailState:
+    """Constant-size detector state for one (guardrail, platform, model)."""
+    runs: int = 0
+    ewma: float = 1.0
+    baseline: float = 1.0
+    cusum: float = 0.0
+    window_bits: int = 0
+    window_len: int = 0
+    alerting: bool = False
+
+    @property
+    def window_rate(self) -> float:
+        return bin(self.window_bits).count("1") / self.window_len if self.window_len else 0.0
+
+    def update(self, passed: bool) -> bool:
+        """Fold in one outcome. Returns True when a new alert is raised."""
+        x = 1.0 if passed else 0.0
+        self.runs += 1
+
+        if self.runs == 1:
+            self.ewma = self.baseline = x
+        else:
+            self.ewma += FAST_ALPHA * (x - self.ewma)
+            if not self.alerting:
+                self.baseline += SLOW_ALPHA * (x - self.baseline)
+
+        self.window_bits = ((self.window_bits << 1) | int(passed)) & ((1 << WINDOW_SIZE) - 1)
+        self.window_len = min(self.window_len + 1, WINDOW_SIZE)
+
+        self.cusum = max(0.0, self.cusum + (self.baseline - x) - CUSUM_ALLOWANCE)
+
+        if self.alerting:
+            if self.ewma >= self.baseline - RECOVERY_MARGIN:
+                self.alerting = False
+                self.cusum = 0.0
+            return False
+
+        if self.runs >= MIN_RUNS and self.cusum > CUSUM_THRESHOLD:
+            self.alerting = True
+            return True
+        return False
+
+
+@dataclass
+class DriftAlert:
+    guardrail: str
+    platform: str
+    model: str
+    ewma: float
+    baseline: float
+    window_rate: float
+    cusum: float
+    runs: int
+
+    def __str__(self):
+        return (f"⚠️  DRIFT ALERT [{self.guardrail}] platform={self.platform} model={self.model}: "
+                f"pass rate {self.ewma:.0%} (baseline {self.baseline:.0%}, "
+                f"last {WINDOW_SIZE} runs {self.window_rate:.0%}, CUSUM {self.cusum:.1f})")
+
+
+class DriftDetector:
+    """Per-guardrail drift state, keyed by (guardrail, platform, model)."""
+
+    def __init__(self, states: Optional[Dict[str, GuardrailState]] = None):
+        self.states = states or {}
+
+    @staticmethod
+    def key(guardrail: str, platform: str, model: str) -> str:
+        return f"{guardrail}|{platform}|{model}"
+
+    def observe(self, entry: Dict) -> List[DriftAlert]:
+        """Update state with one compliance entry; return newly raised alerts."""
+        platform = entry.get("platform") or "unknown"
+        model = entry.get("model") or "unknown"
+
+        # A guardrail ID may cover several checks (e.g. both G12 checks):
+        # the run passes that guardrail only if all of them passed.
+        outcomes = {}
+        for result in entry.get("results", []):
+            guardrail = result.get("guardrail", "?")
+            outcomes[guardrail] = outcomes.get(guardrail, True) and bool(result.get("passed"))
+
+        alerts = []
+        for guardrail, passed in outcomes.items():
+            key = self.key(guardrail, platform, model)
+            state = self.states.setdefault(key, GuardrailState())
+            if state.update(passed):
+                alerts.append(DriftAlert(guardrail, platform, model, round(state.ewma, 4),
+                                         round(state.baseline, 4), round(state.window_rate, 4),
+                                         round(state.cusum, 2), state.runs))
+        return alerts
+
+    def to_dict(self) -> Dict:
+        return {key: asdict(state) for key, state in self.states.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DriftDetector":
+        names = {f.name for f in fields(GuardrailState)}
+        return cls({key: GuardrailState(**{k: v for k, v in s.items() if k in names}) for key, s in data.items()})
+
+
+def _state_path(directory: Path = None) -> Path:
+    return Path(directory or LOG_DIR) / STATE_FILE
+
+
+def load_detector(directory: Path = None) -> DriftDetector:
+    path = _state_path(directory)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return DriftDetector.from_dict(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return DriftDetector()
+
+
+def save_detector(detector: DriftDetector, directory: Path = None):
+    path = _state_path(directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(detector.to_dict(), f, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def observe_entry(entry: Dict, directory: Path = None) -> List[DriftAlert]:
+    """
+    Inline hot-path hook: load state, fold in one entry, save state.
+    Serialized with a lock so concurrent validator runs do not lose updates.
+    Cost depends on the number of tracked keys, not on history length.
+    """
+    directory = Path(directory or LOG_DIR)
+    with _FileLock(directory / ".drift.lock"):
+        detector = load_detector(directory)
+        alerts = detector.observe(entry)
+        save_detector(detector, directory)
+    return alerts
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Enforcement drift detector state and replay.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("status", help="Show per-guardrail drift state")
+    p.add_argument("--alerting", action="store_true", help="Only keys currently in alert")
+    sub.add_parser("replay", help="Rebuild drift state from the full compliance log")
+    args = parser.parse_args(argv)
+
+    if args.command == "replay":
+        from compliance_tracker import get_store
+
+        detector = DriftDetector()
+        alerts = 0
+        for entry in get_store().iter_entries():
+            for alert in detector.observe(entry):
+                alerts += 1
+                print(alert)
+        with _FileLock(LOG_DIR / ".drift.lock"):
+            save_detector(detector)
+        print(f"Replayed state for {len(detector.states)} key(s); {alerts} alert(s) raised.")
+        return
+
+    detector = load_detector()
+    rows = sorted(detector.states.items())
+    if args.alerting:
+        rows = [(k, s) for k, s in rows if s.alerting]
+    if not rows:
+        print("No drift state recorded." if not args.alerting else "No guardrails in alert.")
+        return
+
+    print(f"{'guardrail|platform|model':<40}{'runs':>7}{'ewma':>8}{'base':>8}{'window':>8}{'cusum':>8}  status")
+    for key, s in rows:
+        status = "⚠️ ALERT" if s.alerting else "ok"
+        print(f"{key:<40}{s.runs:>7}{s.ewma:>8.2f}{s.baseline:>8.2f}{s.window_rate:>8.2f}{s.cusum:>8.2f}  {status}")
+
+
+if __name__ == "__main__":
+    main()
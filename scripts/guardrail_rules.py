@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""
+guardrail_rules.py - Single-Pass Rule Engine for the Per-Bullet Guardrails
+
+Purpose: The content guardrails that look at individual bullets (G24, G9
+         and the checks from bo_output-validator.md that had no code: G1,
+         G5, G11, G14, G15, G20, G22, G29, G35, G37) as declarative rules
+         registered under their G-ID:
+
+           RegexRule      every match of a pattern in a bullet is a
+                          violation (optionally filtered by accept())
+           LexiconRule    a RegexRule for a list of literal terms
+           PredicateRule  visit(state, view, matches) per bullet and
+                          finish(state, context) per document
+
+         The patterns of all rules (predicates may contribute one too) are
+         joined into one matcher of zero-width lookahead groups, so each
+         bullet is scanned by a single finditer() that stops wherever any
+         rule matches, and the match is routed to its rule by the group
+         name. Lookaheads consume nothing, so one rule's match never hides
+         another's. Per-bullet features several rules need (marker-free
+         body, words, numbers, verb category) are computed once on a
+         BulletView and shared. Adding a rule adds an alternative to the
+         matcher, not another pass over the output.
+
+         Rules that compare the output with the job history it was
+         generated from (G1, G5, G29) only run when a JobHistory is
+         passed as source. The content rules (G11, G14, G15, G20, G22,
+         G35, G37) only run when content_rules is set
+         (validate_bullets.py --content-rules); without either, the
+         engine checks G24 and G9 as before.
+
+         The time spent in each rule (and in the combined matcher) is
+         recorded in the metrics registry as omr_validator_call_seconds
+         with function="rule:<G-ID>", and can be collected per run with
+         the timings argument (validate_bullets.py --rule-timings).
+
+Usage:
+    from guardrail_rules import run_rules
+    results = run_rules(doc, source=history)   # [(guardrail, description, passed, details)]
+    results = run_rules(doc, content_rules=True)
+
+    python scripts/guardrail_rules.py          # list the registered rules
+"""
+
+import re
+import time
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from lazy_re import lazy_compile
+from validator_metrics import CALL_SECONDS, REGISTRY
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FORMAT_RULES_FILE = REPO_ROOT / "core" / "format-rules.md"
+
+# (guardrail, description, passed, details), as ValidationResult takes them
+RuleResult = Tuple[str, str, bool, str]
+
+# Label for the time spent in the combined matcher itself
+MATCHER_LABEL = "matcher"
+
+# Leading status/category markers ("✓ [Has Metrics] [[Built]]") and trailing
+# annotations ("(128 chars) [Built]") around a bullet's text
+_LEADING_MARKERS_RE = lazy_compile(r"^(?:✓\s*|\[\[?[^\]]*\]\]?\s*)+")
+_TRAILING_MARKERS_RE = lazy_compile(r"(?:\s*(?:\([^()]*\bchars?\b[^()]*\)|\[\[?[^\]]*\]\]?))+\s*$", re.IGNORECASE)
+_WORD_RE = lazy_compile(r"[a-z0-9$%]+(?:['.,-][a-z0-9%]+)*")
+_NUMBER_RE = lazy_compile(r"\d+(?:[.,]\d+)*")
+_STANDARD_ACRONYMS_RE = lazy_compile(r"<standard_acronyms_allowed>(.*?)</standard_acronyms_allowed>", re.DOTALL)
+_ABSENT_SKILL_RE = lazy_compile(
+    r"\b(?:no(?:\s+(?:hands-on|direct|professional|production|prior|formal))?\s+"
+    r"(?:experience|exposure|background|knowledge)\s+(?:with|in|of|using)"
+    r"|never\s+(?:used|worked\s+with)"
+    r"|not\s+(?:experienced|proficient)\s+(?:with|in))\s+(.+)", re.IGNORECASE)
+
+# Words that never make a phrase distinctive (G15) or a bullet similar to an achievement (G29)
+STOPWORDS = frozenset((
+    "a", "an", "and", "as", "at", "by", "for", "from", "in", "into", "of", "on", "or", "over",
+    "per", "the", "to", "with", "via", "that", "this", "while", "across", "within", "their", "its", "our",
+))
+
+# G14: bullets per position, and how many positions may have 5+ (or exactly 4) bullets
+MIN_BULLETS_PER_POSITION = 2
+MAX_POSITIONS_PER_TIER = 2
+
+# G15: a 3-word phrase may appear at most this many times in the output
+PHRASE_REPEAT_LIMIT = 2
+PHRASE_LINES_SHOWN = 5
+
+# G29: share of the smaller content-word set a bullet and a source
+# achievement must have in common to be the same achievement
+ACHIEVEMENT_MATCH_OVERLAP = 0.5
+
+# G37 only applies from this many bullets
+THRESHOLD_MIN_BULLETS = 20
+
+
+# ---------------------------------------------------------------------------
+# Shared per-bullet and per-document features
+# ---------------------------------------------------------------------------
+
+def _numbers(text: str) -> List[str]:
+    """Numbers in text, with thousands separators removed ("1,200" -> "1200")."""
+    numbers = []
+    for token in _NUMBER_RE.findall(text):
+        if "," in token and all(len(group) == 3 for group in token.split(",")[1:]):
+            token = token.replace(",", "")
+        numbers.append(token)
+    return numbers
+
+
+class BulletView:
+    """A bullet plus the features rules read from it, each computed on first use."""
+
+    def __init__(self, bullet, context: "RuleContext"):
+        self.bullet = bullet
+        self.context = context
+
+    @cached_property
+    def body(self) -> str:
+        """The bullet text without leading markers and trailing annotations."""
+        text = _LEADING_MARKERS_RE.sub("", self.bullet.text)
+        return _TRAILING_MARKERS_RE.sub("", text) or text
+
+    @cached_property
+    def words(self) -> List[str]:
+        return _WORD_RE.findall(self.body.lower())
+
+    @cached_property
+    def content_words(self) -> frozenset:
+        return frozenset(word for word in self.words if len(word) > 2 and word not in STOPWORDS)
+
+    @cached_property
+    def numbers(self) -> List[str]:
+        return _numbers(self.body)
+
+    @cached_property
+    def category(self) -> Optional[str]:
+        return self.context.verb_index.classify(self.body)
+
+    def where(self) -> str:
+        return f"Position {self.bullet.position_id}"
+
+
+class SourcePosition:
+    """What the source rules need from one position of the job history."""
+
+    def __init__(self, position):
+        from job_history_model import _pack
+
+        self.numbers = frozenset(_numbers(" ".join(_strings(_pack(position)))))
+        self.limitations = []
+        for limitation in position.honest_limitations or []:
+            match = _ABSENT_SKILL_RE.search(limitation)
+            if match:
+                terms = [t.strip(" .()") for t in re.split(r",|/|\bor\b|\band\b|\(", match.group(1))]
+                terms = [t for t in terms if len(t) > 1]
+                if terms:
+                    pattern = r"(?<!\w)(?:" + "|".join(re.escape(t) for t in terms) + r")(?!\w)"
+                    self.limitations.append((limitation, re.compile(pattern, re.IGNORECASE)))
+        self.achievements = []
+        for achievement in position.key_achievements or []:
+            text = achievement.text or " ".join(
+                part for part in (achievement.context, achievement.action, achievement.result, achievement.impact)
+                if part)
+            metrics = _numbers(achievement.result or achievement.text or "")
+            if metrics:
+                words = frozenset(w for w in _WORD_RE.findall(text.lower()) if len(w) > 2 and w not in STOPWORDS)
+                self.achievements.append((text, words, metrics))
+
+
+def _strings(value) -> Iterable[str]:
+    """Every string in a packed (nested tuple/list) model value."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _strings(item)
+
+
+_standard_acronyms = None
+
+
+def standard_acronyms() -> frozenset:
+    """G20: the <standard_acronyms_allowed> list in core/format-rules.md ("CI/CD" allows CI and CD too)."""
+    global _standard_acronyms
+    if _standard_acronyms is None:
+        try:
+            match = _STANDARD_ACRONYMS_RE.search(FORMAT_RULES_FILE.read_text(encoding="utf-8"))
+        except OSError:
+            match = None
+        allowed = set()
+        for entry in (match.group(1).split(",") if match else []):
+            entry = entry.strip()
+            allowed.add(entry.upper())
+            allowed.update(part.upper() for part in entry.split("/"))
+        _standard_acronyms = frozenset(allowed)
+    return _standard_acronyms
+
+
+class RuleContext:
+    """One document (and optional source job history) being checked."""
+
+    def __init__(self, doc, source=None):
+        self.doc = doc
+        self.source = source
+        self.views = [BulletView(bullet, self) for bullet in doc.bullets]
+
+    @cached_property
+    def verb_index(self):
+        from verb_index import load_verb_index
+        return load_verb_index()
+
+    @cached_property
+    def verb_distribution(self):
+        """Verb categories of all bullets (G9, G37)."""
+        from verb_index import VerbDistribution
+
+        counts = {category: 0 for category in self.verb_index.categories}
+        unclassified = 0
+        for view in self.views:
+            if view.category:
+                counts[view.category] += 1
+            else:
+                unclassified += 1
+        return VerbDistribution(counts=counts, total=len(self.views), unclassified=unclassified)
+
+    @cached_property
+    def source_positions(self) -> Dict[int, SourcePosition]:
+        """Source positions by number; ids that are not numbers are left out."""
+        positions = {}
+        candidates = list(self.source.positions)
+        if self.source.position_zero is not None:
+            candidates.append(self.source.position_zero)
+        for position in candidates:
+            try:
+                positions.setdefault(int(position.id), SourcePosition(position))
+            except ValueError:
+                continue
+        return positions
+
+
+# ---------------------------------------------------------------------------
+# Rule types
+# ---------------------------------------------------------------------------
+
+def _violation_details(checked: int, violations: List[str]) -> Tuple[bool, str]:
+    """Pass/fail and details in the format of the G24 check."""
+    if violations:
+        return False, f"VIOLATIONS: {violations}"
+    return True, f"{checked} bullets checked"
+
+
+class Rule:
+    """
+    A guardrail check. pattern (optional) joins the combined matcher;
+    visit() is called for each bullet it matched in, or for every bullet
+    when every_bullet is set. needs_source rules only run with a source,
+    content rules only with content_rules.
+    """
+    pattern: Optional[str] = None
+    every_bullet = False
+    needs_source = False
+
+    def __init__(self, gid: str, description: str, content: bool = False):
+        self.gid = gid
+        self.description = description
+        self.content = content
+
+    @cached_property
+    def regex(self) -> Optional["re.Pattern"]:
+        return re.compile(self.pattern) if self.pattern else None
+
+    def start(self, context: RuleContext):
+        """Per-document state passed to visit() and finish()."""
+        return []
+
+    def visit(self, state, view: BulletView, matches: List["re.Match"]):
+        pass
+
+    def finish(self, state, context: RuleContext) -> Tuple[bool, str]:
+        return _violation_details(len(context.views), state)
+
+
+class RegexRule(Rule):
+    """
+    Every match of pattern in a bullet's body is a violation, unless
+    accept(matched text) is false. message is a format string for the
+    matched text, or a function of it.
+    """
+
+    def __init__(self, gid: str, description: str, pattern: str,
+                 message: Union[str, Callable[[str], str]] = "'{}'",
+                 accept: Optional[Callable[[str], bool]] = None, content: bool = False):
+        super().__init__(gid, description, content)
+        self.pattern = pattern
+        self.message = message if callable(message) else (lambda text: message.format(text.strip()))
+        self.accept = accept
+
+    def visit(self, state, view, matches):
+        for match in matches:
+            text = match.group()
+            if self.accept is None or self.accept(text):
+                state.append(f"{view.where()}: {self.message(text)} (line {view.bullet.line_no})")
+
+
+class LexiconRule(RegexRule):
+    """
+    A RegexRule for literal terms, matched case-insensitively (and as whole
+    words where a term starts or ends with a word character). terms maps
+    each term to its name in the violation message.
+    """
+
+    def __init__(self, gid: str, description: str, terms: Dict[str, str], anchored: bool = False,
+                 content: bool = False):
+        self.terms = {term.lower(): name for term, name in terms.items()}
+
+        def literal(term):
+            return ((r"\b" if term[0].isalnum() else "") + re.escape(term) +
+                    (r"\b" if term[-1].isalnum() else ""))
+
+        alternatives = "|".join(literal(term) for term in sorted(terms, key=len, reverse=True))
+        pattern = (r"\A" if anchored else "") + f"(?i:{alternatives})"
+        super().__init__(gid, description, pattern,
+                         message=lambda text: f"{self.terms.get(text.lower(), 'term')} '{text.strip()}'",
+                         content=content)
+
+
+class PredicateRule(Rule):
+    """
+    A check written as functions: start(context) -> state,
+    visit(state, view, matches) for every bullet (matches of pattern, if
+    one is given) and finish(state, context) -> (passed, details). By
+    default the state is a list of violations, reported like G24's.
+    """
+
+    def __init__(self, gid: str, description: str, visit: Optional[Callable] = None,
+                 finish: Optional[Callable] = None, start: Optional[Callable] = None,
+                 pattern: Optional[str] = None, needs_source: bool = False, content: bool = False):
+        super().__init__(gid, description, content)
+        self.pattern = pattern
+        self.every_bullet = visit is not None
+        self.needs_source = needs_source
+        self._start, self._visit, self._finish = start, visit, finish
+
+    def start(self, context):
+        return self._start(context) if self._start else []
+
+    def visit(self, state, view, matches):
+        self._visit(state, view, matches)
+
+    def finish(self, state, context):
+        return self._finish(state, context) if self._finish else super().finish(state, context)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class RuleSet:
+    """Rules in result order, with their patterns compiled into one matcher."""
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = list(rules)
+        self._matchers = {}
+
+    def matcher(self, rules: Tuple[Rule, ...]) -> Optional["re.Pattern"]:
+        """
+        One alternation of lookaheads over the rules' patterns, group
+        "r<i>" for rules[i]. Its matches are empty: each is a position
+        where some rule matches, the first of them named by lastgroup.
+        """
+        if rules not in self._matchers:
+            alternatives = [f"(?=(?P<r{i}>{rule.pattern}))" for i, rule in enumerate(rules) if rule.pattern]
+            self._matchers[rules] = re.compile("|".join(alternatives)) if alternatives else None
+        return self._matchers[rules]
+
+    @staticmethod
+    def _scan(matcher: "re.Pattern", rules: Tuple[Rule, ...], body: str) -> Dict[int, List["re.Match"]]:
+        """
+        Each rule's matches in body, as rule.regex.finditer(body) would
+        find them, from one finditer() of the combined matcher. At a
+        position where rules[i] matched first, the rules after it are
+        tried there too; a rule's next match starts after its last one.
+        """
+        hits = {}
+        resume = {}
+        for found in matcher.finditer(body):
+            pos = found.start()
+            first = int(found.lastgroup[1:])
+            for i in range(first, len(rules)):
+                if rules[i].pattern is None or resume.get(i, 0) > pos:
+                    continue
+                match = rules[i].regex.match(body, pos)
+                if match is not None:
+                    hits.setdefault(i, []).append(match)
+                    resume[i] = match.end() if match.end() > pos else pos + 1
+        return hits
+
+    def run(self, doc, source=None, timings: Optional[Dict[str, float]] = None,
+            content_rules: bool = False) -> List[RuleResult]:
+        """
+        Check doc (a BulletDocument) in one pass over its bullets.
+        timings: dict to add seconds per G-ID (and MATCHER_LABEL) to.
+        content_rules: also run the rules registered with content=True.
+        """
+        rules = tuple(rule for rule in self.rules
+                      if (source is not None or not rule.needs_source) and (content_rules or not rule.content))
+        context = RuleContext(doc, source)
+        matcher = self.matcher(rules)
+        clock = time.perf_counter
+        elapsed = [0.0] * len(rules)
+        states = []
+        for i, rule in enumerate(rules):
+            started = clock()
+            states.append(rule.start(context))
+            elapsed[i] += clock() - started
+        every = frozenset(i for i, rule in enumerate(rules) if rule.every_bullet)
+        in_order = sorted(every)
+        matcher_seconds = 0.0
+
+        for view in context.views:
+            hits = {}
+            if matcher is not None:
+                started = clock()
+                hits = self._scan(matcher, rules, view.body)
+                matcher_seconds += clock() - started
+            for i in sorted(every.union(hits)) if hits else in_order:
+                started = clock()
+                rules[i].visit(states[i], view, hits.get(i, ()))
+                elapsed[i] += clock() - started
+
+        results = []
+        for i, rule in enumerate(rules):
+            started = clock()
+            passed, details = rule.finish(states[i], context)
+            elapsed[i] += clock() - started
+            results.append((rule.gid, rule.description, passed, details))
+
+        if REGISTRY.enabled:
+            REGISTRY.observe(CALL_SECONDS, (f"rule:{MATCHER_LABEL}",), matcher_seconds)
+            for rule, seconds in zip(rules, elapsed):
+                REGISTRY.observe(CALL_SECONDS, (f"rule:{rule.gid}",), seconds)
+        if timings is not None:
+            timings[MATCHER_LABEL] = timings.get(MATCHER_LABEL, 0.0) + matcher_seconds
+            for rule, seconds in zip(rules, elapsed):
+                timings[rule.gid] = timings.get(rule.gid, 0.0) + seconds
+        return results
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+def character_limits_rule(min_chars: int = 100, max_chars: int = 210) -> Rule:
+    """G24: every bullet within min_chars-max_chars characters."""
+    def visit(violations, view, matches):
+        count = view.bullet.char_count
+        if count < min_chars or count > max_chars:
+            violations.append(f"Position {view.bullet.position_id}: {count} chars (line {view.bullet.line_no})")
+
+    def finish(violations, context):
+        if not context.views:
+            return False, "No bullets found to validate"
+        return _violation_details(len(context.views), violations)
+
+    return PredicateRule("G24", f"Bullet character limits ({min_chars}-{max_chars})", visit=visit, finish=finish)
+
+
+def verb_diversity_rule(min_categories: int = 3) -> Rule:
+    """G9: at least min_categories verb categories, with the distribution (and G37 shortfalls) reported."""
+    def finish(state, context):
+        distribution = context.verb_distribution
+        categories_used = distribution.categories_used
+        passed = len(categories_used) >= min_categories
+        details = f"Categories used: {categories_used}" + (" (sufficient)" if passed else " (INSUFFICIENT)")
+        if distribution.total:
+            details += f"; Distribution: {distribution.summary()}"
+            if distribution.below_threshold:
+                details += f"; G37 TWEAK: {distribution.below_threshold} below 5%"
+        return passed, details
+
+    return PredicateRule("G9", f"Verb diversity (min {min_categories} categories)", finish=finish)
+
+
+def _metric_traceability_visit(violations, view, matches):
+    facts = view.context.source_positions.get(view.bullet.position_id)
+    if facts is None:
+        violations.append(f"{view.where()}: not in source (line {view.bullet.line_no})")
+        return
+    for number in view.numbers:
+        if number in facts.numbers:
+            continue
+        elsewhere = [p for p, other in view.context.source_positions.items() if number in other.numbers]
+        origin = f" (found in Position {elsewhere[0]})" if elsewhere else ""
+        violations.append(f"{view.where()}: '{number}' not in source Position {view.bullet.position_id}"
+                          f"{origin} (line {view.bullet.line_no})")
+
+
+def _limitation_visit(violations, view, matches):
+    facts = view.context.source_positions.get(view.bullet.position_id)
+    for limitation, pattern in (facts.limitations if facts else ()):
+        found = pattern.search(view.body)
+        if found:
+            violations.append(f"{view.where()}: claims '{found.group()}' despite limitation "
+                              f"'{limitation}' (line {view.bullet.line_no})")
+
+
+def _metric_preservation_visit(violations, view, matches):
+    """G29: the source achievement most like the bullet keeps its metrics in the bullet."""
+    facts = view.context.source_positions.get(view.bullet.position_id)
+    if not facts or not view.content_words:
+        return
+    best, best_overlap = None, 0.0
+    for achievement in facts.achievements:
+        words = achievement[1]
+        if words:
+            overlap = len(view.content_words & words) / min(len(view.content_words), len(words))
+            if overlap > best_overlap:
+                best, best_overlap = achievement, overlap
+    if best is None or best_overlap < ACHIEVEMENT_MATCH_OVERLAP:
+        return
+    missing = [number for number in best[2] if number not in view.numbers]
+    if missing:
+        violations.append(f"{view.where()}: metric(s) {missing} of source achievement "
+                          f"'{best[0][:60]}' missing (line {view.bullet.line_no})")
+
+
+def _currency_or_percent(text: str) -> str:
+    if text.endswith("%"):
+        return f"percentage over 100% '{text}'"
+    return f"currency without '$' '{text}'"
+
+
+def _over_100_percent(text: str) -> bool:
+    return not text.endswith("%") or float(text[:-1].replace(",", "")) > 100
+
+
+_MONEY_NOUNS = r"revenue|savings|budget|costs?|sales|spend(?:ing)?|funding|ARR|profit|contracts?|deals?"
+METRIC_PLAUSIBILITY_PATTERN = (
+    r"\b\d+(?:[.,]\d+)?%"
+    r"|(?<![$\d.,])\b\d+(?:[.,]\d+)*\s?(?:[KMB]|million|billion)\b"
+    rf"(?=\s+(?:(?:in|of|annual|annually|yearly|per\s+year)\s+){{0,2}}(?:{_MONEY_NOUNS})\b)"
+    r"|(?<![$\d.,])\b\d+(?:[.,]\d+)*\s?(?:(?:[KMB]|million|billion)\s?)?(?:USD|dollars)\b"
+)
+
+
+def _phrase_visit(phrases, view, matches):
+    words = view.words
+    for i in range(len(words) - 2):
+        trigram = (words[i], words[i + 1], words[i + 2])
+        if all(word in STOPWORDS for word in trigram):
+            continue
+        phrases.setdefault(trigram, []).append(view.bullet.line_no)
+
+
+def _phrase_finish(phrases, context):
+    repeated = []
+    for trigram, lines in phrases.items():
+        if len(lines) > PHRASE_REPEAT_LIMIT:
+            shown = ", ".join(map(str, lines[:PHRASE_LINES_SHOWN]))
+            more = f", +{len(lines) - PHRASE_LINES_SHOWN} more" if len(lines) > PHRASE_LINES_SHOWN else ""
+            repeated.append(f"'{' '.join(trigram)}' used {len(lines)} times (lines {shown}{more})")
+    return _violation_details(len(context.views), repeated)
+
+
+def _acronym_start(context):
+    return ([], set(standard_acronyms()))
+
+
+def _acronym_visit(state, view, matches):
+    violations, known = state
+    for match in matches:
+        acronym = match.group()
+        if acronym in known:
+            continue
+        known.add(acronym)
+        text, start, end = match.string, match.start(), match.end()
+        if not (text[start - 1:start] == "(" and text[end:end + 1] == ")"):
+            violations.append(f"{view.where()}: acronym '{acronym}' should be spelled out on first use "
+                              f"(line {view.bullet.line_no})")
+
+
+def _acronym_finish(state, context):
+    return _violation_details(len(context.views), state[0])
+
+
+def _density_visit(sequence, view, matches):
+    sequence.append(view.bullet)
+
+
+def _density_finish(bullets, context):
+    """G14: 2+ bullets per position, at most two positions with 5 (or 4) bullets, positions not split."""
+    if not bullets:
+        return False, "No bullets found to validate"
+    counts, violations, previous = {}, [], None
+    for bullet in bullets:
+        if bullet.position_id != previous and bullet.position_id in counts:
+            violations.append(f"Position {bullet.position_id}: bullets split by another position "
+                              f"(line {bullet.line_no})")
+        counts[bullet.position_id] = counts.get(bullet.position_id, 0) + 1
+        previous = bullet.position_id
+    for position_id, count in counts.items():
+        if count < MIN_BULLETS_PER_POSITION:
+            violations.append(f"Position {position_id}: {count} bullet(s), minimum {MIN_BULLETS_PER_POSITION}")
+    tiers = (("5+", [p for p, n in counts.items() if n >= 5]), ("4", [p for p, n in counts.items() if n == 4]))
+    for label, heavy in tiers:
+        if len(heavy) > MAX_POSITIONS_PER_TIER:
+            violations.append(f"{len(heavy)} positions with {label} bullets {heavy}, maximum {MAX_POSITIONS_PER_TIER}")
+    if violations:
+        return False, f"VIOLATIONS: {violations}"
+    return True, "Bullets per position: " + ", ".join(f"P{p}={n}" for p, n in counts.items())
+
+
+def _threshold_finish(state, context):
+    """G37 is advisory (a TWEAK, as in G9's details): it always passes and reports the shortfall."""
+    distribution = context.verb_distribution
+    if distribution.total < THRESHOLD_MIN_BULLETS:
+        return True, f"{distribution.total} bullets (applies from {THRESHOLD_MIN_BULLETS})"
+    details = f"Distribution: {distribution.summary()}"
+    if distribution.below_threshold:
+        return True, f"TWEAK: {distribution.below_threshold} below 5%; {details}"
+    return True, details
+
+
+RULES = RuleSet([
+    character_limits_rule(),
+    verb_diversity_rule(),
+    PredicateRule("G1", "Metrics traceable to the same source position",
+                  visit=_metric_traceability_visit, needs_source=True),
+    PredicateRule("G5", "No claims contradicting honest limitations",
+                  visit=_limitation_visit, needs_source=True),
+    RegexRule("G11", "Metric plausibility (percent <= 100, currency with $)",
+              METRIC_PLAUSIBILITY_PATTERN, message=_currency_or_percent, accept=_over_100_percent, content=True),
+    PredicateRule("G14", "Bullet density and sequence per position", visit=_density_visit, finish=_density_finish,
+                  content=True),
+    PredicateRule("G15", f"Phrase uniqueness (3-word phrases at most {PHRASE_REPEAT_LIMIT}x)",
+                  visit=_phrase_visit, finish=_phrase_finish, start=lambda context: {}, content=True),
+    PredicateRule("G20", "Non-standard acronyms expanded on first use",
+                  visit=_acronym_visit, finish=_acronym_finish, start=_acronym_start,
+                  pattern=r"\b[A-Z]{2,5}(?=s?\b)", content=True),
+    LexiconRule("G22", "No em dashes", {"—": "em dash"}, content=True),
+    PredicateRule("G29", "Source achievement metrics preserved",
+                  visit=_metric_preservation_visit, needs_source=True),
+    RegexRule("G35", "Bullets open with a past-tense action verb",
+              r"\A(?i:[a-z]+ing\b|responsible\s+for\b|worked\s+on\b)", message="opens with '{}'", content=True),
+    PredicateRule("G37", "Verb categories at least 5% each (20+ bullets, advisory)", finish=_threshold_finish,
+                  content=True),
+])
+
+
+def run_rules(doc, source=None, rules: Optional[RuleSet] = None,
+              timings: Optional[Dict[str, float]] = None, content_rules: bool = False) -> List[RuleResult]:
+    """
+    Run the registered rules (or another RuleSet) over a BulletDocument.
+    source: the JobHistory the bullets were generated from; without it the
+    source rules (G1, G5, G29) are left out.
+    content_rules: also run the content rules (G11, G14, G15, G20, G22, G35, G37).
+    """
+    return (rules or RULES).run(doc, source, timings, content_rules)
+
+
+def source_fingerprint(source) -> str:
+    """SHA-256 of a JobHistory's fields, for cache keys of results computed against it."""
+    import hashlib
+    import marshal
+    from job_history_model import _pack
+
+    return hashlib.sha256(marshal.dumps(_pack(source))).hexdigest()
+
+
+def main():
+    for rule in RULES.rules:
+        kind = type(rule).__name__
+        extra = " (needs --source)" if rule.needs_source else " (--content-rules)" if rule.content else ""
+        print(f"{rule.gid:<5} {kind:<14} {rule.description}{extra}")
+
+
+if __name__ == "__main__":
+    main()
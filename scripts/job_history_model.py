@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+"""
+job_history_model.py - Typed Job History Model Shared by the Validator and Converter
+
+Purpose: One parse of a job history .txt file into a compact object model:
+         slotted dataclasses for the file header, the global sections
+         (Degree, Certification) and every Position (Metadata,
+         Achievement with context/action/result/impact, bullet lists).
+         validate_job_history.py and convert_job_history_to_md.py both
+         build it from the same section tree (job_history_scanner.py), so
+         they agree on edge cases: the legacy <job_metadata> tag is read as
+         <metadata>, a section only counts once its closing tag is found,
+         and the version history is the first comment starting with
+         "Version History:".
+
+         A parsed model is cached in the shared parse cache
+         (parse_cache.py), keyed by the SHA-256 of the source file, as
+         marshal-encoded tuples (data only, nothing executable on load).
+         After `validate_job_history.py file.txt` the converter loads the
+         model instead of parsing the file again.
+
+Usage:
+    python scripts/job_history_model.py job_history.txt    # summary of the parsed model
+"""
+
+import hashlib
+import itertools
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from job_history_scanner import Element, SectionTree, TreeBuilder, scan
+from job_history_schema import LEGACY_NAMES
+from lazy_re import lazy_compile
+from parse_cache import get_cache
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Bump when a dataclass gains, loses or reorders a field
+MODEL_VERSION = 2
+
+# Parse cache namespace for models
+CACHE_TOOL = "job_history_model"
+
+# Global sections held by JobHistory (<about> is the older name of
+# <linkedin_about_narrative>)
+GLOBAL_SECTIONS = ('global_professional_summary', 'linkedin_about_narrative', 'about',
+                   'education', 'certifications')
+
+_TITLE_RE = lazy_compile(r'COMPREHENSIVE JOB HISTORY SUMMARIES - VERSION(?: (.*))?')
+_FORMAT_RE = lazy_compile(r'Format: (.*)')
+_UPDATED_RE = lazy_compile(r'Last Updated:[ \t]*(.*)')
+_TOTAL_JOBS_RE = lazy_compile(r'Total Jobs:[ \t]*(.*)')
+_POSITION_TITLE_RE = lazy_compile(r'POSITION \d+: (.+)')
+
+# Everything the position index records, in one alternation: headers
+# ("JOB POSITION N:" / "POSITION N:", any case), <position id="N"> tags,
+# and the markers where an unwrapped Position 0 ends.
+_INDEX_PATTERN = (r'(?i:(JOB )?POSITION (\d+):)'
+                  r'|<position id="(\d+)">'
+                  r'|(?i:==(?=\s*POSITION 1)|</impact_metrics>|</hard_skills_demonstrated>)')
+_INDEX_RE = lazy_compile(_INDEX_PATTERN)
+_INDEX_RE_BYTES = lazy_compile(_INDEX_PATTERN.encode('ascii'))
+
+
+def _bullet_re(section: str) -> "re.Pattern":
+    return lazy_compile(r'- (.+?)(?=\n    -|\n  </%s>|$)' % section, re.DOTALL)
+
+
+_BULLET_RES = {name: _bullet_re(name) for name in (
+    'core_responsibilities', 'key_achievements', 'hard_skills_demonstrated',
+    'soft_skills_demonstrated', 'impact_metrics', 'tools_technologies', 'honest_limitations')}
+
+
+# ---------------------------------------------------------------------------
+# Model
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class Degree:
+    type: str
+    title: Optional[str] = None
+    institution: Optional[str] = None
+    location: Optional[str] = None
+    graduation_date: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Certification:
+    status: str
+    name: Optional[str] = None
+    issuer: Optional[str] = None
+    date_earned: Optional[str] = None
+    expiration: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Achievement:
+    """A structured achievement (id, context/action/result/impact) or a plain bullet (text)."""
+    id: Optional[str] = None
+    context: Optional[str] = None
+    action: Optional[str] = None
+    result: Optional[str] = None
+    impact: Optional[str] = None
+    text: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Metadata:
+    job_title: Optional[str] = None
+    company: Optional[str] = None
+    contract_type: Optional[str] = None
+    start: Optional[str] = None  # start/end are read from <dates> only
+    end: Optional[str] = None
+    duration: Optional[str] = None
+    location: Optional[str] = None
+    work_arrangement: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Position:
+    """
+    One position. A None section was absent (or never closed); an empty
+    list means the section was there without bullets.
+    """
+    id: str
+    title: Optional[str] = None  # from the "POSITION N: ..." header
+    metadata: Optional[Metadata] = None
+    professional_summary: Optional[str] = None
+    core_responsibilities: Optional[List[str]] = None
+    key_achievements: Optional[List[Achievement]] = None
+    hard_skills: Optional[List[str]] = None
+    soft_skills: Optional[List[str]] = None
+    impact_metrics: Optional[List[str]] = None
+    tools: Optional[List[str]] = None
+    honest_limitations: Optional[List[str]] = None
+
+
+@dataclass(slots=True)
+class JobHistory:
+    """
+    A whole file. version is the text after "VERSION" in the title line
+    ("" when the title has none, None when the title is missing).
+    positions are the <position> elements in document order (Position 0
+    included when it is wrapped); position_zero is an unwrapped
+    "JOB POSITION 0:" block, parsed from its header to its last section.
+    """
+    version: Optional[str] = None
+    format: Optional[str] = None
+    last_updated: Optional[str] = None
+    total_jobs: Optional[str] = None
+    version_history: Optional[str] = None
+    global_summary: Optional[str] = None
+    linkedin_about: Optional[str] = None
+    education: Optional[List[Degree]] = None
+    certifications: Optional[List[Certification]] = None
+    position_zero: Optional[Position] = None
+    positions: List[Position] = field(default_factory=list)
+
+    def first_position_zero(self) -> Optional[Position]:
+        """Position 0, wrapped or not."""
+        if self.position_zero is not None:
+            return self.position_zero
+        return next((p for p in self.positions if p.id == "0"), None)
+
+
+# ---------------------------------------------------------------------------
+# Building the model from a section tree
+# ---------------------------------------------------------------------------
+
+# Sections parsed on their own: a position's content is never looked up
+# inside them (an unclosed <position> holds the positions after it, and a
+# streaming scan may already have detached them)
+_OWN_SECTIONS = frozenset(('position',) + GLOBAL_SECTIONS)
+
+
+def _first_descendants(container: Element) -> Dict[str, Element]:
+    """
+    The first closed descendant of each tag name (legacy names mapped to the
+    current ones), in one walk that does not look inside nested sections.
+    """
+    found = {}
+    stack = list(reversed(container.children))
+    while stack:
+        element = stack.pop()
+        if element.closed:
+            found.setdefault(LEGACY_NAMES.get(element.name, element.name), element)
+        if element.children and element.name not in _OWN_SECTIONS:
+            stack.extend(reversed(element.children))
+    return found
+
+
+def _text(tree: SectionTree, found: Dict[str, Element], name: str, strip: bool = False) -> Optional[str]:
+    element = found.get(name)
+    if element is None:
+        return None
+    text = tree.inner_text(element)
+    return text.strip() if strip else text
+
+
+def _bullets(tree: SectionTree, element: Element, section: str) -> List[str]:
+    return _BULLET_RES[section].findall(tree.inner_text(element).strip())
+
+
+def metadata_from_element(tree: SectionTree, element: Element) -> Metadata:
+    found = _first_descendants(element)
+    dates = found.get('dates')
+    in_dates = _first_descendants(dates) if dates is not None else {}
+    return Metadata(
+        job_title=_text(tree, found, 'job_title'),
+        company=_text(tree, found, 'company'),
+        contract_type=_text(tree, found, 'contract_type'),
+        start=_text(tree, in_dates, 'start'),
+        end=_text(tree, in_dates, 'end'),
+        duration=_text(tree, found, 'duration'),
+        location=_text(tree, found, 'location'),
+        work_arrangement=_text(tree, found, 'work_arrangement'),
+    )
+
+
+def _achievement(tree: SectionTree, element: Element) -> Achievement:
+    found = _first_descendants(element)
+    return Achievement(id=element.attrs.get('id'),
+                       context=_text(tree, found, 'context', strip=True),
+                       action=_text(tree, found, 'action', strip=True),
+                       result=_text(tree, found, 'result', strip=True),
+                       impact=_text(tree, found, 'impact', strip=True))
+
+
+def achievements_from_element(tree: SectionTree, element: Element) -> List[Achievement]:
+    """Structured <achievement id="N"> entries if there are any, otherwise the bullets."""
+    structured = [_achievement(tree, child) for child in element.iter()
+                  if child.name == 'achievement' and child.closed and (child.attrs.get('id') or '').isdigit()]
+    if structured:
+        return structured
+    return [Achievement(text=bullet.strip().replace('\n    ', ' '))
+            for bullet in _bullets(tree, element, 'key_achievements')]
+
+
+def position_from_element(tree: SectionTree, element: Element, header: str = "",
+                          position_id: Optional[str] = None) -> Position:
+    """
+    Position for a <position> element (or any element holding a position's
+    sections, such as the root of a scanned unwrapped Position 0).
+    header: text before the tag, searched first for "POSITION N: title".
+    """
+    if position_id is None:
+        position_id = element.attrs.get('id', '') if element.raw_attrs is not None else ''
+    title = _POSITION_TITLE_RE.search(header) or _POSITION_TITLE_RE.search(tree.element_text(element))
+    position = Position(id=position_id, title=title.group(1) if title else None)
+
+    found = _first_descendants(element)
+
+    if 'metadata' in found:
+        position.metadata = metadata_from_element(tree, found['metadata'])
+    if 'professional_summary' in found:
+        position.professional_summary = tree.inner_text(found['professional_summary']).strip()
+    if 'core_responsibilities' in found:
+        position.core_responsibilities = [b.strip().replace('\n    ', ' ') for b in
+                                          _bullets(tree, found['core_responsibilities'], 'core_responsibilities')]
+    if 'key_achievements' in found:
+        position.key_achievements = achievements_from_element(tree, found['key_achievements'])
+    if 'hard_skills_demonstrated' in found:
+        position.hard_skills = [b.strip() for b in
+                                _bullets(tree, found['hard_skills_demonstrated'], 'hard_skills_demonstrated')]
+    if 'soft_skills_demonstrated' in found:
+        position.soft_skills = [b.strip() for b in
+                                _bullets(tree, found['soft_skills_demonstrated'], 'soft_skills_demonstrated')]
+    if 'impact_metrics' in found:
+        position.impact_metrics = [b.strip() for b in _bullets(tree, found['impact_metrics'], 'impact_metrics')]
+    if 'tools_technologies' in found:
+        tools = found['tools_technologies']
+        bullets = _bullets(tree, tools, 'tools_technologies')
+        if bullets:
+            position.tools = [b.strip() for b in bullets]
+        else:
+            # Comma/semicolon separated list
+            position.tools = [t.strip() for t in re.split(r'[,;]\s*|\n', tree.inner_text(tools).strip()) if t.strip()]
+    if 'honest_limitations' in found:
+        position.honest_limitations = [b.strip().replace('\n    ', ' ') for b in
+                                       _bullets(tree, found['honest_limitations'], 'honest_limitations')]
+    return position
+
+
+def degrees_from_element(tree: SectionTree, element: Element) -> List[Degree]:
+    degrees = []
+    for degree in element.iter():
+        if degree.name == 'degree' and degree.closed:
+            found = _first_descendants(degree)
+            degrees.append(Degree(type=degree.attrs.get('type', ''),
+                                  title=_text(tree, found, 'title'),
+                                  institution=_text(tree, found, 'institution'),
+                                  location=_text(tree, found, 'location'),
+                                  graduation_date=_text(tree, found, 'graduation_date')))
+    return degrees
+
+
+def certifications_from_element(tree: SectionTree, element: Element) -> List[Certification]:
+    certifications = []
+    for cert in element.iter():
+        if cert.name == 'certification' and cert.closed:
+            found = _first_descendants(cert)
+            certifications.append(Certification(status=cert.attrs.get('status', ''),
+                                                name=_text(tree, found, 'name'),
+                                                issuer=_text(tree, found, 'issuer'),
+                                                date_earned=_text(tree, found, 'date_earned'),
+                                                expiration=_text(tree, found, 'expiration')))
+    return certifications
+
+
+# Global section -> JobHistory field
+_GLOBAL_FIELDS = {
+    'global_professional_summary': 'global_summary',
+    'linkedin_about_narrative': 'linkedin_about',
+    'about': 'linkedin_about',
+    'education': 'education',
+    'certifications': 'certifications',
+}
+
+
+def section_value(tree: SectionTree, element: Element):
+    """Parsed content of a global section: its text, or its Degree / Certification list."""
+    if element.name == 'education':
+        return degrees_from_element(tree, element)
+    if element.name == 'certifications':
+        return certifications_from_element(tree, element)
+    return tree.inner_text(element).strip()
+
+
+def read_header(history: JobHistory, preamble: str, comments: Iterator[str]) -> JobHistory:
+    """Fill the header fields from the preamble and the comments in it."""
+    title = _TITLE_RE.search(preamble)
+    if title:
+        history.version = title.group(1) or ""
+    for attr, pattern in (('format', _FORMAT_RE), ('last_updated', _UPDATED_RE), ('total_jobs', _TOTAL_JOBS_RE)):
+        m = pattern.search(preamble)
+        setattr(history, attr, m.group(1).strip() if m else None)
+    for comment in comments:
+        comment = comment.lstrip()
+        if comment.startswith('Version History:'):
+            history.version_history = comment[len('Version History:'):].strip()
+            break
+    return history
+
+
+class PositionIndex:
+    """
+    Offsets of "POSITION N:" headers, <position id="N"> tags and unwrapped
+    Position 0 end markers, collected in a single regex pass over str or
+    bytes content.
+    """
+
+    __slots__ = ("headers", "opens", "p0_ends")
+
+    def __init__(self, content):
+        self.headers = {}   # id -> [(start, end, has "JOB " prefix)], in document order
+        self.opens = {}     # id -> [tag start], in document order
+        self.p0_ends = []   # where an unwrapped Position 0 ends
+        is_bytes = not isinstance(content, str)
+        for m in (_INDEX_RE_BYTES if is_bytes else _INDEX_RE).finditer(content):
+            job, header_id, open_id = m.groups()
+            if header_id is not None:
+                header_id = header_id.decode('ascii') if is_bytes else header_id
+                self.headers.setdefault(header_id, []).append((m.start(), m.end(), job is not None))
+            elif open_id is not None:
+                open_id = open_id.decode('ascii') if is_bytes else open_id
+                self.opens.setdefault(open_id, []).append(m.start())
+            else:
+                self.p0_ends.append(m.start())
+
+    def header(self, position_id) -> Optional[Tuple[int, int]]:
+        """
+        Span of a position's header text: from the first "POSITION N:" that
+        is followed by a <position id="N"> tag, up to that tag.
+        """
+        found = self.headers.get(position_id)
+        tags = self.opens.get(position_id)
+        if not found or not tags:
+            return None
+        start, end, _ = found[0]
+        i = bisect_left(tags, end)
+        return (start, tags[i]) if i < len(tags) else None
+
+    def first_header(self, position_id) -> Optional[int]:
+        """Start of the first "POSITION N:" header, whether or not a tag follows."""
+        found = self.headers.get(position_id)
+        return found[0][0] if found else None
+
+    def position_zero(self) -> Optional[Tuple[int, int]]:
+        """Span of Position 0 from its "JOB POSITION 0:" header to the first end marker after it."""
+        for start, end, job in self.headers.get("0", ()):
+            if job:
+                i = bisect_left(self.p0_ends, end)
+                return (start, self.p0_ends[i]) if i < len(self.p0_ends) else None
+        return None
+
+
+def position_zero_from_text(content, index: Optional[PositionIndex] = None) -> Optional[Position]:
+    """
+    Unwrapped Position 0 of str or bytes content: the text from its
+    "JOB POSITION 0:" header to the first end marker, scanned on its own.
+    index: PositionIndex of content (built if not given).
+    """
+    span = (index or PositionIndex(content)).position_zero()
+    if span is None:
+        return None
+    text = content[span[0]:span[1]]
+    if not isinstance(text, str):
+        text = text.decode('utf-8', errors='replace')
+    tree = scan(text)
+    return position_from_element(tree, tree.root, text, position_id="0")
+
+
+def header_start(section_ends: List[int], start: int) -> int:
+    """
+    Where the text holding a position's "POSITION N:" header begins: the end
+    of the last section that closed before the position opened.
+    section_ends: ends of the sections seen so far, in closing order.
+    """
+    i = bisect_right(section_ends, start)
+    return section_ends[i - 1] if i else 0
+
+
+def position_header(tree: SectionTree, element: Element, gap_start: int) -> str:
+    """The "POSITION N: ..." header text between gap_start and a position's tag ("" if none)."""
+    gap = tree.text(gap_start, element.start)
+    start = PositionIndex(gap).first_header(element.attrs.get('id', ''))
+    return gap[start:] if start is not None else ""
+
+
+class HistoryBuilder:
+    """
+    Builds a JobHistory from sections as a TreeBuilder completes them.
+    add() takes each yielded element (top-level elements and the named
+    sections, in closing order) and returns its Position for <position>
+    elements. With retain=False positions are returned but not kept, so
+    streaming callers hold one position at a time.
+    """
+
+    def __init__(self, tree: SectionTree, start: int = 0, retain: bool = True):
+        self.tree = tree
+        self.retain = retain
+        self.history = JobHistory()
+        self.section_ends = [start]
+        self._header_read = False
+        self._narrative_found = False
+
+    def header(self) -> JobHistory:
+        """The history with its header fields read (once the preamble is complete)."""
+        if not self._header_read:
+            self._header_read = True
+            read_header(self.history, self.tree.preamble(), self.tree.comment_texts())
+        return self.history
+
+    def add(self, element: Element, tree: Optional[SectionTree] = None) -> Optional[Position]:
+        """
+        Record one completed section. tree: the tree element belongs to
+        (default: the builder's; global sections may come from a scanned slice).
+        """
+        tree = tree or self.tree
+        position = None
+        if not element.closed:
+            pass
+        elif element.name == 'position':
+            gap_start = header_start(self.section_ends, element.start)
+            position = position_from_element(tree, element, position_header(tree, element, gap_start))
+            if self.retain:
+                self.history.positions.append(position)
+        elif element.name in _GLOBAL_FIELDS:
+            self.add_section(element.name, section_value(tree, element))
+        if tree is self.tree:
+            self.section_ends.append(element.end)
+        return position
+
+    def add_section(self, name: str, value):
+        """
+        Set a global section from its section_value(). The first of each
+        wins, and <linkedin_about_narrative> wins over the older <about>.
+        """
+        history = self.history
+        if name == 'linkedin_about_narrative':
+            if not self._narrative_found:
+                self._narrative_found = True
+                history.linkedin_about = value
+        elif name == 'about':
+            if not self._narrative_found and history.linkedin_about is None:
+                history.linkedin_about = value
+        elif getattr(history, _GLOBAL_FIELDS[name]) is None:
+            setattr(history, _GLOBAL_FIELDS[name], value)
+
+    def sections(self) -> List[Tuple[str, object]]:
+        """(section name, value) of the global sections set so far, to replay with add_section()."""
+        history = self.history
+        found = []
+        if history.global_summary is not None:
+            found.append(('global_professional_summary', history.global_summary))
+        if history.linkedin_about is not None:
+            found.append(('linkedin_about_narrative' if self._narrative_found else 'about', history.linkedin_about))
+        if history.education is not None:
+            found.append(('education', history.education))
+        if history.certifications is not None:
+            found.append(('certifications', history.certifications))
+        return found
+
+    def finish(self, content=None) -> JobHistory:
+        """The completed history; content (str or bytes) is searched for an unwrapped Position 0."""
+        history = self.header()
+        if content is not None and history.first_position_zero() is None:
+            history.position_zero = position_zero_from_text(content)
+        return history
+
+
+def parse_job_history(content) -> JobHistory:
+    """Parse job history text (str, bytes or mmap) into a JobHistory."""
+    builder = TreeBuilder(content, sections=('position',) + GLOBAL_SECTIONS)
+    history = HistoryBuilder(builder.tree)
+    for element in itertools.chain(builder.feed(), builder.finish()):
+        history.add(element)
+    return history.finish(content)
+
+
+# ---------------------------------------------------------------------------
+# Binary cache
+# ---------------------------------------------------------------------------
+
+def _pack(obj):
+    """Dataclass (or list of them) -> nested tuples of plain values."""
+    if isinstance(obj, list):
+        return [_pack(item) for item in obj]
+    if hasattr(obj, '__slots__'):
+        return tuple(_pack(getattr(obj, name)) for name in obj.__slots__)
+    return obj
+
+
+def as_dict(obj):
+    """Dataclass (or list of them) -> nested dicts and lists, like dataclasses.asdict without the deep copy."""
+    if isinstance(obj, list):
+        return [as_dict(item) for item in obj]
+    if hasattr(obj, '__slots__'):
+        return {name: as_dict(getattr(obj, name)) for name in obj.__slots__}
+    return obj
+
+
+def _unpack_position(data) -> Position:
+    (position_id, title, metadata, summary, responsibilities, achievements,
+     hard_skills, soft_skills, metrics, tools, limitations) = data
+    return Position(position_id, title, Metadata(*metadata) if metadata is not None else None, summary,
+                    responsibilities,
+                    [Achievement(*a) for a in achievements] if achievements is not None else None,
+                    hard_skills, soft_skills, metrics, tools, limitations)
+
+
+def _unpack(data) -> JobHistory:
+    (version, fmt, last_updated, total_jobs, version_history, global_summary, linkedin_about,
+     education, certifications, position_zero, positions) = data
+    return JobHistory(version, fmt, last_updated, total_jobs, version_history, global_summary, linkedin_about,
+                      [Degree(*d) for d in education] if education is not None else None,
+                      [Certification(*c) for c in certifications] if certifications is not None else None,
+                      _unpack_position(position_zero) if position_zero is not None else None,
+                      [_unpack_position(p) for p in positions])
+
+
+def source_digest(path) -> str:
+    """SHA-256 of a file's bytes, the model cache key."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cached(digest: str) -> Optional[JobHistory]:
+    """The cached model for a source digest; None if absent, from another model version or corrupt."""
+    data = get_cache().get(CACHE_TOOL, MODEL_VERSION, digest)
+    if data is None:
+        return None
+    try:
+        return _unpack(data)
+    except (ValueError, TypeError):
+        return None
+
+
+def save_cached(digest: str, history: JobHistory):
+    get_cache().put(CACHE_TOOL, MODEL_VERSION, digest, _pack(history))
+
+
+def read_text(path) -> str:
+    """File text as open(path, 'r') returns it (UTF-8, universal newlines)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def load_job_history(path, use_cache: bool = True, digest: Optional[str] = None) -> JobHistory:
+    """
+    The model of a job history file, from the cache when the file's hash matches.
+    digest: the file's source_digest() when the caller already computed it.
+    """
+    if not use_cache:
+        return parse_job_history(read_text(path))
+    digest = digest or source_digest(path)
+    history = load_cached(digest)
+    if history is None:
+        history = parse_job_history(read_text(path))
+        save_cached(digest, history)
+    return history
+
+
+def main():
+    if len(sys.argv) != 2 or sys.argv[1] in ("-h", "--help"):
+        print("Usage: python job_history_model.py <job_history.txt>")
+        sys.exit(0 if sys.argv[1:] in (["-h"], ["--help"]) else 1)
+    history = load_job_history(sys.argv[1])
+    p0 = history.first_position_zero()
+    print(f"Version: {history.version}")
+    print(f"Education: {len(history.education or [])} degree(s), "
+          f"certifications: {len(history.certifications or [])}")
+    print(f"Positions: {len(history.positions)}" + (" (plus unwrapped Position 0)" if history.position_zero else ""))
+    for position in ([p0] if history.position_zero else []) + history.positions:
+        achievements = len(position.key_achievements or [])
+        print(f"  [{position.id}] {position.title or '-'}: {achievements} achievement(s)")
+
+
+if __name__ == "__main__":
+    main()
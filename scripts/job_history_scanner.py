@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+job_history_scanner.py - Single-Pass Tag Scanner for Job History Files
+
+Purpose: Linear-time tokenizer for the XML-like job history format. One regex
+         scan emits open/close/self-close/comment/text events with offsets,
+         and a nesting stack turns them into a lightweight element tree.
+         Validators query the tree instead of re-searching the file, and
+         nesting errors carry line and column numbers.
+
+         The format is not strict XML (free text, '<' in prose, unescaped
+         '&'), so the scanner only recognises well-formed tag syntax and
+         treats everything else as text.
+
+         Sources may be str or bytes (including an mmap of the file), and
+         TreeBuilder can stream completed sections from a file that is still
+         being written (follow_sections), so very large archives are checked
+         without being decoded or held in memory.
+
+Usage:
+    from job_history_scanner import scan
+    tree = scan(text)
+    for position in tree.find_all("position"):
+        print(position.attrs.get("id"), tree.line_col(position.start))
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from lazy_re import lazy_compile
+
+Source = Union[str, bytes]  # or any bytes-like buffer, e.g. an mmap
+
+# Event kinds
+OPEN = "open"
+CLOSE = "close"
+SELF_CLOSE = "self_close"
+COMMENT = "comment"
+TEXT = "text"
+
+# Groups: 1 = '/' for closing tags, 2 = tag name, 3 = raw attributes
+# (ending in '/' for self-closing tags). Comments match with no groups set.
+_TAG_PATTERN = r'<(/?)([A-Za-z_][\w:.-]*)([^<>]*)>|<!--.*?-->'
+_ATTR_PATTERN = r'''([A-Za-z_][\w:.-]*)\s*=\s*(?:"([^"]*)"|'([^']*)')'''
+
+_TAG_RE = lazy_compile(_TAG_PATTERN, re.DOTALL)
+_TAG_RE_BYTES = lazy_compile(_TAG_PATTERN.encode('ascii'), re.DOTALL)
+_ATTR_RE = lazy_compile(_ATTR_PATTERN)
+_ATTR_RE_BYTES = lazy_compile(_ATTR_PATTERN.encode('ascii'))
+
+
+def iter_events(source: Source, start: int = 0, end: int = None) -> Iterator[Tuple]:
+    """
+    Tokenize source[start:end] in one pass.
+    Yields (kind, name, start, end, attrs) tuples; offsets index into source
+    (characters for str, bytes for bytes). name is None for text and
+    comments; attrs is the raw attribute string of open/self-close tags.
+    """
+    is_bytes = not isinstance(source, str)
+    tag_re = _TAG_RE_BYTES if is_bytes else _TAG_RE
+    end = len(source) if end is None else end
+    pos = start
+
+    for m in tag_re.finditer(source, start, end):
+        if m.start() > pos:
+            yield TEXT, None, pos, m.start(), None
+        slash, name, raw_attrs = m.groups()
+        if name is None:
+            yield COMMENT, None, m.start(), m.end(), None
+        else:
+            if is_bytes:
+                name = name.decode('ascii')
+            if slash:
+                kind = CLOSE
+            elif raw_attrs.endswith(b'/' if is_bytes else '/'):
+                kind = SELF_CLOSE
+            else:
+                kind = OPEN
+            yield kind, name, m.start(), m.end(), raw_attrs
+        pos = m.end()
+
+    if pos < end:
+        yield TEXT, None, pos, end, None
+
+
+def parse_attrs(raw) -> Dict[str, str]:
+    """Attribute string (str or bytes) to a dict of str values."""
+    if not raw:
+        return {}
+    if not isinstance(raw, str):
+        return {m.group(1).decode('ascii'): (m.group(2) if m.group(2) is not None else m.group(3)).decode('utf-8', 'replace')
+                for m in _ATTR_RE_BYTES.finditer(raw)}
+    return {m.group(1): m.group(2) if m.group(2) is not None else m.group(3) for m in _ATTR_RE.finditer(raw)}
+
+
+class Element:
+    """
+    One tag in the section tree. start/end span the whole element
+    (open tag through close tag); inner_start/inner_end span its content.
+    """
+
+    __slots__ = ("name", "raw_attrs", "start", "end", "inner_start", "inner_end", "children", "parent", "closed")
+
+    def __init__(self, name: str, raw_attrs, start: int, inner_start: int, parent: "Element" = None):
+        self.name = name
+        self.raw_attrs = raw_attrs
+        self.start = start
+        self.inner_start = inner_start
+        self.inner_end = inner_start
+        self.end = inner_start
+        self.children: List["Element"] = []
+        self.parent = parent
+        self.closed = False
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        return parse_attrs(self.raw_attrs)
+
+    def child(self, name: str) -> Optional["Element"]:
+        for element in self.children:
+            if element.name == name:
+                return element
+        return None
+
+    def find(self, name: str) -> Optional["Element"]:
+        """First descendant with this tag name (depth-first, document order)."""
+        for element in self.iter():
+            if element is not self and element.name == name:
+                return element
+        return None
+
+    def iter(self) -> Iterator["Element"]:
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element.children))
+
+    def __repr__(self):
+        return f"<Element {self.name} [{self.start}:{self.end}] children={len(self.children)}>"
+
+
+class ScanError:
+    """Nesting problem found while building the tree."""
+
+    __slots__ = ("message", "offset")
+
+    def __init__(self, message: str, offset: int):
+        self.message = message
+        self.offset = offset
+
+
+class SectionTree:
+    """Result of scan(): element tree, comments, name index and nesting errors."""
+
+    def __init__(self, source: Source, root: Element, comments: List[Tuple[int, int]],
+                 index: Dict[str, List[Element]], errors: List[ScanError]):
+        self.source = source
+        self.root = root
+        self.comments = comments
+        self.index = index
+        self.errors = errors
+        self.first_start = None  # offset of the first top-level element
+        self._line_checkpoints = [0]
+
+    def find_all(self, name: str) -> List[Element]:
+        """Every element with this tag name, in document order."""
+        return self.index.get(name, [])
+
+    def text(self, start: int, end: int) -> str:
+        """Decoded source slice; for bytes/mmap sources only this slice is decoded."""
+        chunk = self.source[start:end]
+        return chunk if isinstance(chunk, str) else chunk.decode('utf-8', 'replace')
+
+    def inner_text(self, element: Element) -> str:
+        return self.text(element.inner_start, element.inner_end)
+
+    def element_text(self, element: Element) -> str:
+        return self.text(element.start, element.end)
+
+    def comment_texts(self) -> Iterator[str]:
+        """Comment bodies without the <!-- --> delimiters."""
+        for start, end in self.comments:
+            yield self.text(start + 4, end - 3)
+
+    def preamble(self) -> str:
+        """Text before the first element (file header, version history, format lines)."""
+        return self.text(0, len(self.source) if self.first_start is None else self.first_start)
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """
+        1-based (line, column) of an offset. Newline counts are kept per
+        LINE_CHECKPOINT-sized block and extended only as far as needed, so
+        this works on huge or still-growing sources with little memory.
+        """
+        newline = "\n" if isinstance(self.source, str) else b"\n"
+        checkpoints = self._line_checkpoints
+        block = offset // LINE_CHECKPOINT
+        while len(checkpoints) <= block:
+            k = len(checkpoints) - 1
+            checkpoints.append(checkpoints[-1] + self.source[k * LINE_CHECKPOINT:(k + 1) * LINE_CHECKPOINT].count(newline))
+        line = checkpoints[block] + self.source[block * LINE_CHECKPOINT:offset].count(newline) + 1
+        return line, offset - (self.source.rfind(newline, 0, offset) + 1) + 1
+
+    def location(self, offset: int) -> str:
+        line, col = self.line_col(offset)
+        return f"line {line}, col {col}"
+
+
+# Block size for the line-number index
+LINE_CHECKPOINT = 1 << 16
+
+
+class TreeBuilder:
+    """
+    Single-pass, resumable section-tree builder.
+
+    feed() consumes source[pos:end] and may be called again as the source
+    grows (a file still being written); the nesting stack carries over.
+    finish() closes whatever is still open.
+
+    With `sections`, feed() and finish() yield each completed top-level
+    element, and each element named in `sections` at any depth, as soon as
+    it closes. With detach=True yielded elements are dropped from the tree
+    and no name index or post-preamble comments are kept, so memory is
+    bounded by the currently open elements instead of the file size.
+    """
+
+    def __init__(self, source: Source, start: int = 0, sections=None, detach: bool = False):
+        self.root = Element("#document", None, start, start)
+        self.tree = SectionTree(source, self.root, [], {}, [])
+        self.stack = [self.root]
+        self.pos = start
+        self.sections = frozenset(sections) if sections is not None else None
+        self.detach = detach
+
+    def feed(self, end: int = None, source: Source = None) -> Iterator[Element]:
+        """Scan up to `end` (default: end of source). source replaces a remapped, grown source."""
+        tree = self.tree
+        if source is not None:
+            tree.source = source
+        source = tree.source
+        end = len(source) if end is None else end
+
+        is_bytes = not isinstance(source, str)
+        tag_re = _TAG_RE_BYTES if is_bytes else _TAG_RE
+        self_close = b'/' if is_bytes else '/'
+        root = self.root
+        stack = self.stack
+        top = stack[-1]
+        comments = tree.comments
+        index = None if self.detach else tree.index
+        errors = tree.errors
+        sections = self.sections
+        streaming = sections is not None
+
+        m = None
+        for m in tag_re.finditer(source, self.pos, end):
+            slash, name, raw_attrs = m.groups()
+            if name is None:
+                if index is not None or tree.first_start is None:
+                    comments.append(m.span())
+                continue
+            if is_bytes:
+                name = name.decode('ascii')
+
+            if slash:
+                if top.name == name:
+                    top.inner_end, top.end, top.closed = m.start(), m.end(), True
+                    closed = stack.pop()
+                    top = stack[-1]
+                    if streaming and (top is root or name in sections):
+                        yield self._emit(m, closed)
+                    continue
+                # Close an ancestor: everything opened inside it was left unclosed
+                for depth in range(len(stack) - 2, 0, -1):
+                    if stack[depth].name == name:
+                        break
+                else:
+                    errors.append(ScanError(f"Closing tag </{name}> has no matching <{name}>", m.start()))
+                    continue
+                while len(stack) > depth + 1:
+                    unclosed = stack.pop()
+                    unclosed.inner_end = unclosed.end = m.start()
+                    errors.append(ScanError(f"<{unclosed.name}> is not closed before </{name}>", unclosed.start))
+                    if streaming and unclosed.name in sections:
+                        yield self._emit(m, unclosed)
+                top = stack[-1]
+                top.inner_end, top.end, top.closed = m.start(), m.end(), True
+                closed = stack.pop()
+                top = stack[-1]
+                if streaming and (top is root or name in sections):
+                    yield self._emit(m, closed)
+                continue
+
+            element = Element(name, raw_attrs, m.start(), m.end(), top)
+            if top is root and tree.first_start is None:
+                tree.first_start = m.start()
+            top.children.append(element)
+            if index is not None:
+                same_name = index.get(name)
+                if same_name is None:
+                    index[name] = [element]
+                else:
+                    same_name.append(element)
+            if raw_attrs.endswith(self_close):
+                element.closed = True
+                element.end = m.end()
+                if streaming and (top is root or name in sections):
+                    yield self._emit(m, element)
+            else:
+                stack.append(element)
+                top = element
+
+        if m is not None:
+            self.pos = m.end()
+
+    def finish(self, end: int = None) -> Iterator[Element]:
+        """Close elements still open at end of input (reported as nesting errors)."""
+        source_end = len(self.tree.source) if end is None else end
+        stack = self.stack
+        while len(stack) > 1:
+            unclosed = stack.pop()
+            unclosed.inner_end = unclosed.end = source_end
+            self.tree.errors.append(ScanError(f"<{unclosed.name}> is never closed", unclosed.start))
+            if self.sections is not None and (len(stack) == 1 or unclosed.name in self.sections):
+                yield self._emit(None, unclosed)
+        self.root.inner_end = self.root.end = source_end
+
+    def _emit(self, m, element: Element) -> Element:
+        """Hand a completed element to the consumer (pos is current while it runs)."""
+        if m is not None:
+            self.pos = m.end()
+        if self.detach:
+            siblings = element.parent.children
+            if siblings and siblings[-1] is element:
+                siblings.pop()
+        return element
+
+
+def scan(source: Source, start: int = 0, end: int = None) -> SectionTree:
+    """Build the full section tree for source[start:end] with a single tokenizer pass."""
+    builder = TreeBuilder(source, start)
+    for _ in builder.feed(end):
+        pass
+    for _ in builder.finish(end):
+        pass
+    return builder.tree
+
+
+def safe_end(source: Source, start: int, end: int) -> int:
+    """
+    End offset that is safe to scan in a file still being written: stops
+    before a trailing comment whose '-->' has not arrived yet, so tags inside
+    it are not mistaken for document tags. (Partial tags never match.)
+    """
+    opener, closer = ("<!--", "-->") if isinstance(source, str) else (b"<!--", b"-->")
+    cut = source.rfind(opener, start, end)
+    if cut != -1 and source.find(closer, cut + 4, end) == -1:
+        return cut
+    return end
+
+
+def follow_sections(path, sections, poll_interval: float = 0.5, idle_timeout: float = 5.0,
+                    detach: bool = True) -> Iterator[Tuple[TreeBuilder, Element]]:
+    """
+    Stream sections from a file that may still be growing, reading it through
+    mmap. Yields (builder, element) as sections complete; ends once the file
+    has not grown for idle_timeout seconds, then closes anything still open.
+    builder.tree.source stays valid (mapped) while iterating.
+    """
+    import mmap
+    import os
+    import time
+
+    with open(path, 'rb') as f:
+        builder = None
+        mapped = None
+        size = 0
+        idle_since = time.monotonic()
+        while True:
+            new_size = os.fstat(f.fileno()).st_size
+            if new_size > size:
+                size = new_size
+                idle_since = time.monotonic()
+                previous, mapped = mapped, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if builder is None:
+                    builder = TreeBuilder(mapped, sections=sections, detach=detach)
+                for element in builder.feed(safe_end(mapped, builder.pos, size), source=mapped):
+                    yield builder, element
+                if previous is not None:
+                    previous.close()
+            elif time.monotonic() - idle_since >= idle_timeout:
+                break
+            else:
+                time.sleep(poll_interval)
+
+    # The last mapping stays open (it outlives the file handle) so callers can
+    # still decode slices for reporting; it is released with the builder.
+    if builder is None:
+        builder = TreeBuilder(b"", sections=sections, detach=detach)
+    else:
+        for element in builder.feed(size):
+            yield builder, element
+    for element in builder.finish(size):
+        yield builder, element
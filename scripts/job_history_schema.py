@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+job_history_schema.py - Job History Schema Compiled from the XML Template
+
+Purpose: Compiles templates/job_history_template.xml into a validation
+         automaton: for every element, its ordered child elements (required
+         or optional, single or repeatable) and its attributes (number,
+         enumeration or free text). Validators walk a document's section tree
+         against it, so a schema change is a template edit, not a code edit.
+
+         Template conventions (written as comments, so the structure LLMs copy
+         is unchanged):
+         - <!-- Optional ... --> directly before an element makes it optional;
+           if the comment also mentions "repeat", the element is repeatable.
+         - <!-- Repeat ... --> directly after an element makes it repeatable.
+         - Attribute placeholders: "[N]" is a number, "[a|b|c]" an
+           enumeration, any other "[...]" free text, a bare value a literal.
+
+         The compiled schema is cached in .cache/omr/ and rebuilt only when
+         the template changes (mtime/size first, then content hash).
+
+Usage:
+    python scripts/job_history_schema.py    # print the compiled schema
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from job_history_scanner import SectionTree, parse_attrs, scan
+from lazy_re import lazy_compile
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE_FILE = REPO_ROOT / "templates" / "job_history_template.xml"
+CACHE_FILE = REPO_ROOT / ".cache" / "omr" / "job_history_schema.json"
+
+# Bump when the compiled layout changes
+SCHEMA_VERSION = 1
+
+ERROR = "error"
+WARNING = "warning"
+
+# Older tag names still accepted (with a warning) as the template's name
+LEGACY_NAMES = {'job_metadata': 'metadata'}
+
+_COMMENT_RE = lazy_compile(r'<!--(.*?)-->', re.DOTALL)
+_ENUM_RE = lazy_compile(r'^\[([^\[\]|]+(?:\|[^\[\]|]+)+)\]$')
+
+
+class AttributeSpec:
+    """Allowed values of one attribute: kind is 'number', 'enum' or 'text'."""
+
+    __slots__ = ("name", "kind", "values")
+
+    def __init__(self, name: str, kind: str, values: List[str] = None):
+        self.name = name
+        self.kind = kind
+        self.values = values or []
+
+    @classmethod
+    def from_placeholder(cls, name: str, placeholder: str) -> "AttributeSpec":
+        if placeholder == "[N]":
+            return cls(name, "number")
+        enum = _ENUM_RE.match(placeholder)
+        if enum:
+            return cls(name, "enum", [v.strip() for v in enum.group(1).split('|')])
+        if placeholder.startswith('[') and placeholder.endswith(']'):
+            return cls(name, "text")
+        return cls(name, "enum", [placeholder])
+
+    def problem(self, value: Optional[str]) -> Optional[str]:
+        """Why value is not allowed, or None."""
+        if value is None or not value.strip():
+            return f"missing '{self.name}' attribute"
+        if self.kind == "number" and not value.isdigit():
+            return f"'{self.name}' must be a number (got '{value}')"
+        if self.kind == "enum" and value not in self.values:
+            return f"'{self.name}' must be one of {'|'.join(self.values)} (got '{value}')"
+        return None
+
+
+class ElementSpec:
+    """
+    One state of the automaton. children are in template order; a document
+    element's children must be a subsequence of them (repeats allowed where
+    marked), with every required child present.
+    """
+
+    __slots__ = ("name", "required", "repeatable", "attrs", "children", "child_index")
+
+    def __init__(self, name: str, required: bool = True, repeatable: bool = False,
+                 attrs: Dict[str, AttributeSpec] = None, children: List["ElementSpec"] = None):
+        self.name = name
+        self.required = required
+        self.repeatable = repeatable
+        self.attrs = attrs or {}
+        self.children = children or []
+        self.child_index = {child.name: i for i, child in enumerate(self.children)}
+
+    def child(self, name: str) -> Optional["ElementSpec"]:
+        i = self.child_index.get(name)
+        return None if i is None else self.children[i]
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "required": self.required,
+            "repeatable": self.repeatable,
+            "attrs": {n: [a.kind, a.values] for n, a in self.attrs.items()},
+            "children": [c.to_dict() for c in self.children],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ElementSpec":
+        return cls(data["name"], data["required"], data["repeatable"],
+                   {n: AttributeSpec(n, kind, values) for n, (kind, values) in data["attrs"].items()},
+                   [cls.from_dict(c) for c in data["children"]])
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+def _adjacent_comments(gap: str) -> Optional[List[str]]:
+    """Comment bodies in a gap between elements, or None if the gap has other text."""
+    if _COMMENT_RE.sub('', gap).strip():
+        return None
+    return [c.strip() for c in _COMMENT_RE.findall(gap)]
+
+
+def compile_template(text: str) -> ElementSpec:
+    """Compile template text into the root ElementSpec ('#document')."""
+    tree = scan(text)
+    if tree.errors:
+        line, col = tree.line_col(tree.errors[0].offset)
+        raise ValueError(f"Template is not well nested (line {line}, col {col}): {tree.errors[0].message}")
+
+    def build(element, required=True, repeatable=False) -> ElementSpec:
+        children = []
+        previous_end = element.inner_start
+        for i, child in enumerate(element.children):
+            before = _adjacent_comments(text[previous_end:child.start]) or []
+            next_start = element.children[i + 1].start if i + 1 < len(element.children) else element.inner_end
+            after = _adjacent_comments(text[child.end:next_start]) or []
+            previous_end = child.end
+
+            note = before[-1].lower() if before else ""
+            optional = note.startswith("optional")
+            repeats = (optional and "repeat" in note) or (bool(after) and after[0].lower().startswith("repeat"))
+
+            if child.name in {c.name for c in children}:
+                continue  # a second sample of the same element adds nothing
+            children.append(build(child, required=not optional, repeatable=repeats))
+
+        attrs = {name: AttributeSpec.from_placeholder(name, value)
+                 for name, value in parse_attrs(element.raw_attrs).items()}
+        return ElementSpec(element.name, required, repeatable, attrs, children)
+
+    return build(tree.root)
+
+
+def _source_stamp(path: Path) -> Dict:
+    stat = path.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build_schema(template: Path = TEMPLATE_FILE, cache: Optional[Path] = CACHE_FILE) -> ElementSpec:
+    """
+    Load the compiled schema from cache when the template is unchanged,
+    otherwise compile it and refresh the cache. The cache is trusted when
+    mtime and size match; if only the mtime moved, the content hash decides.
+    """
+    stamp = _source_stamp(template)
+    cached = None
+    if cache is not None and cache.exists():
+        try:
+            with open(cache, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = None
+    if cached and cached.get("version") != SCHEMA_VERSION:
+        cached = None
+
+    if cached and cached["source"]["size"] == stamp["size"]:
+        if cached["source"]["mtime_ns"] == stamp["mtime_ns"]:
+            return ElementSpec.from_dict(cached["schema"])
+        digest = _sha256(template)
+        if cached["source"]["sha256"] == digest:
+            cached["source"].update(stamp)
+            _write_cache(cache, cached)
+            return ElementSpec.from_dict(cached["schema"])
+
+    schema = compile_template(template.read_text(encoding='utf-8'))
+    if cache is not None:
+        _write_cache(cache, {
+            "version": SCHEMA_VERSION,
+            "source": dict(stamp, sha256=_sha256(template)),
+            "schema": schema.to_dict(),
+        })
+    return schema
+
+
+def _write_cache(cache: Path, data: Dict):
+    """Atomically replace the cache file; a read-only tree just skips caching."""
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+
+
+_loaded_schema = None
+
+
+def load_schema() -> ElementSpec:
+    """Process-wide schema for the default template, compiled (or loaded from cache) on first use."""
+    global _loaded_schema
+    if _loaded_schema is None:
+        _loaded_schema = build_schema()
+    return _loaded_schema
+
+
+# ---------------------------------------------------------------------------
+# Validation walk
+# ---------------------------------------------------------------------------
+
+Report = Callable[[str, str], None]
+
+
+def check_element(tree: SectionTree, element, spec: ElementSpec, where: Callable[[], str],
+                  report: Report, severity: str = WARNING, recurse: bool = True):
+    """
+    Walk one document element against its spec: attributes, then children
+    (missing required, unexpected, duplicated, out of template order).
+    Missing required children and bad attributes are reported with
+    `severity`; everything below this level is reported as a warning.
+    Attributes are skipped when element is a scanned fragment's root
+    rather than the element itself.
+    """
+    attrs = element.attrs if element.name == spec.name else None
+    for attr in spec.attrs.values() if attrs is not None else ():
+        problem = attr.problem(attrs.get(attr.name))
+        if problem:
+            report(severity, f"{where()}: <{element.name}> {problem}")
+
+    seen = set()
+    last_index = -1
+    for child in element.children:
+        name = child.name
+        index = spec.child_index.get(name)
+        if index is None and name in LEGACY_NAMES:
+            name = LEGACY_NAMES[name]
+            index = spec.child_index.get(name)
+            if index is not None:
+                report(WARNING, f"{where()}: <{child.name}> is a legacy name, use <{name}> "
+                                f"({tree.location(child.start)})")
+        if index is None:
+            report(WARNING, f"{where()}: Unexpected <{child.name}> in <{element.name}> "
+                            f"({tree.location(child.start)})")
+            continue
+        child_spec = spec.children[index]
+        if name in seen and not child_spec.repeatable:
+            report(WARNING, f"{where()}: Duplicate <{name}> in <{element.name}> "
+                            f"({tree.location(child.start)})")
+        elif index < last_index:
+            report(WARNING, f"{where()}: <{name}> is out of template order in <{element.name}> "
+                            f"(should come before <{spec.children[last_index].name}>)")
+        seen.add(name)
+        last_index = max(last_index, index)
+
+        if recurse and child.closed:
+            check_element(tree, child, child_spec, where, report, WARNING)
+
+    for child_spec in spec.children:
+        if child_spec.required and child_spec.name not in seen:
+            if severity == ERROR:
+                report(ERROR, f"{where()}: Missing required section '{child_spec.name}'")
+            else:
+                report(WARNING, f"{where()}: Missing '{child_spec.name}' in <{element.name}>")
+
+
+def describe(spec: ElementSpec, depth: int = 0) -> List[str]:
+    """Indented, human-readable listing of the schema."""
+    flags = ("" if spec.required else "?") + ("*" if spec.repeatable else "")
+    attrs = " ".join(f"{a.name}={a.kind}" + (f"({'|'.join(a.values)})" if a.values else "")
+                     for a in spec.attrs.values())
+    lines = [f"{'  ' * depth}<{spec.name}>{flags}" + (f" [{attrs}]" if attrs else "")]
+    for child in spec.children:
+        lines.extend(describe(child, depth + 1))
+    return lines
+
+
+def main():
+    if sys.argv[1:2] in (["-h"], ["--help"]):
+        print("Usage: python job_history_schema.py [template.xml]")
+        return
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else TEMPLATE_FILE
+    print("\n".join(describe(build_schema(path, cache=CACHE_FILE if path == TEMPLATE_FILE else None))))
+    print("\n? = optional, * = repeatable")
+
+
+if __name__ == "__main__":
+    main()
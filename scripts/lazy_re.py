@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+lazy_re.py - Regular Expressions Compiled on First Use
+
+Purpose: lazy_compile() is a drop-in for re.compile() at module level. The
+         pattern is compiled the first time one of its attributes is used
+         (match, search, finditer, pattern, ...), so importing a script to
+         run one subcommand does not pay for every regex the module
+         defines. After the first use the compiled pattern's methods are
+         stored on the instance, and calls cost the same as on a compiled
+         pattern.
+
+         Only use it where the pattern is used through its methods and
+         attributes; the re module functions (re.match(pattern, ...)) need
+         a real compiled pattern.
+
+Usage:
+    from lazy_re import lazy_compile
+    BULLET_RE = lazy_compile(r"^[\\s]*[•\\-\\*]\\s*(.+)$")
+"""
+
+import re
+
+# Attributes copied from the compiled pattern on first use
+_PATTERN_ATTRS = ("match", "search", "fullmatch", "finditer", "findall", "sub", "subn", "split",
+                  "pattern", "flags", "groups", "groupindex", "scanner")
+
+
+class LazyPattern:
+    """re.compile(pattern, flags), deferred until an attribute is first looked up."""
+
+    def __init__(self, pattern, flags: int = 0):
+        self._source = (pattern, flags)
+
+    def compiled(self) -> "re.Pattern":
+        pattern = re.compile(*self._source)
+        for name in _PATTERN_ATTRS:
+            self.__dict__[name] = getattr(pattern, name)
+        self.__dict__["compiled"] = lambda: pattern
+        return pattern
+
+    def __getattr__(self, name):
+        # Only reached for attributes not yet on the instance, i.e. before the first compile
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.compiled(), name)
+
+    def __repr__(self):
+        return f"lazy_compile({self._source[0]!r}, {self._source[1]!r})"
+
+
+def lazy_compile(pattern, flags: int = 0) -> LazyPattern:
+    return LazyPattern(pattern, flags)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+omr.py - One Command Line for the Project Scripts
+
+Purpose: A single entry point for the validators, converters and trackers.
+         Each subcommand runs the existing script's main() with the rest of
+         the command line, and the script's module (with everything it
+         imports) is loaded only when its subcommand runs, so
+         `omr.py validate-bullets` never pays for openpyxl or the job
+         history parser. This module itself imports nothing beyond what
+         the interpreter has already loaded.
+
+         `omr.py startup` measures each subcommand's import cost with
+         `python -X importtime` and compares it to STARTUP_BUDGET_MS;
+         with --check it exits 1 when a command is over budget.
+         tests/test_startup_budget.py runs the same measurement under
+         pytest.
+
+Usage:
+    python scripts/omr.py <command> [args...]
+    python scripts/omr.py <command> --help
+    python scripts/omr.py startup [--check] [--runs N] [command ...]
+
+    ln -s "$PWD/scripts/omr.py" ~/.local/bin/omr      # then: omr validate-bullets output.txt
+"""
+
+import os
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PLANS_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), "docs", "plans")
+
+# command -> (directory, module, summary); the module's main() reads sys.argv
+COMMANDS = {
+    "validate-bullets": (SCRIPTS_DIR, "validate_bullets", "Check bullet generation output against the guardrails"),
+    "stream-validate": (SCRIPTS_DIR, "stream_validator", "Validate bullet output incrementally from stdin"),
+    "validate-job-history": (SCRIPTS_DIR, "validate_job_history", "Validate a job history .txt against the template"),
+    "convert-job-history": (SCRIPTS_DIR, "convert_job_history_to_md", "Convert job history .txt (or a directory) to Markdown"),
+    "render-job-history": (SCRIPTS_DIR, "render_job_history", "Render job history to Markdown, JSON, HTML and LLM text"),
+    "diff-job-history": (SCRIPTS_DIR, "diff_job_history", "Structural diff and changelog entry between two versions"),
+    "watch-job-history": (SCRIPTS_DIR, "watch_job_history", "Re-validate and re-convert a job history on every save"),
+    "job-history-model": (SCRIPTS_DIR, "job_history_model", "Summarize the parsed job history model"),
+    "job-history-schema": (SCRIPTS_DIR, "job_history_schema", "Show the schema compiled from the XML template"),
+    "compliance": (SCRIPTS_DIR, "compliance_tracker", "Log guardrail results (JSON on stdin) to the compliance log"),
+    "compliance-analytics": (SCRIPTS_DIR, "compliance_analytics", "Query the compliance log"),
+    "drift": (SCRIPTS_DIR, "drift_detector", "Enforcement drift state and replay"),
+    "validator-server": (SCRIPTS_DIR, "validator_server", "Serve validation over a local socket"),
+    "parse-cache": (SCRIPTS_DIR, "parse_cache", "Show, trim or clear the shared parse cache"),
+    "requirements-excel": (PLANS_DIR, "convert_requirements_to_excel", "Export requirements.md to .xlsx and .csv"),
+    "traceability": (PLANS_DIR, "requirements_traceability", "Requirements traceability index and coverage queries"),
+}
+
+# Import cost budget per command in milliseconds (-X importtime, best of --runs),
+# about 1.5x the slowest best-of-5 measured on a single-core runner;
+# tests/test_startup_budget.py holds every command to its budget. "omr" is
+# the dispatcher itself
+STARTUP_BUDGET_MS = {
+    "omr": 2,
+    "validate-bullets": 75,
+    "stream-validate": 75,
+    "validate-job-history": 120,
+    "convert-job-history": 120,
+    "render-job-history": 125,
+    "diff-job-history": 130,
+    "watch-job-history": 120,
+    "job-history-model": 105,
+    "job-history-schema": 65,
+    "compliance": 65,
+    "compliance-analytics": 80,
+    "drift": 100,
+    "validator-server": 190,
+    "parse-cache": 55,
+    "requirements-excel": 45,
+    "traceability": 75,
+}
+
+
+def load(command: str):
+    """Import the module behind a command (and nothing else)."""
+    directory, module, _ = COMMANDS[command]
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    return __import__(module)
+
+
+def run(command: str, args) -> int:
+    module = load(command)
+    sys.argv = [f"{os.path.basename(sys.argv[0])} {command}", *args]
+    result = module.main()
+    return result if isinstance(result, int) else 0
+
+
+def usage(out=sys.stdout):
+    width = max(len(name) for name in COMMANDS)
+    print("usage: omr.py <command> [args...]   (omr.py <command> --help for its options)\n", file=out)
+    print("commands:", file=out)
+    for name, (_, _, summary) in COMMANDS.items():
+        print(f"  {name:<{width}}  {summary}", file=out)
+    print(f"  {'startup':<{width}}  Measure each command's import time against its budget", file=out)
+
+
+# ---------------------------------------------------------------------------
+# Startup benchmark
+# ---------------------------------------------------------------------------
+
+# Budgets are for warm starts, so let the measured interpreters write bytecode
+_BYTECODE_ENV = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+
+
+def _import_cost_us(statement: str) -> int:
+    """
+    Microseconds spent importing modules for statement, from -X importtime:
+    the cumulative time of each top-level import, minus the modules a bare
+    interpreter imports anyway.
+    """
+    import subprocess
+
+    def top_level(code):
+        done = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True,
+                              text=True, cwd=SCRIPTS_DIR, env=_BYTECODE_ENV, check=True)
+        costs = {}
+        for line in done.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|", 2)
+            if not name.startswith("  "):
+                costs[name.strip()] = int(cumulative)
+        return costs
+
+    baseline = top_level("pass")
+    return sum(us for name, us in top_level(statement).items() if name not in baseline)
+
+
+def measure_startup(commands, runs: int = 5):
+    """
+    [(command, best ms, budget ms)]; "omr" measures the dispatcher alone.
+    A first, discarded run per command writes any stale .pyc files, so the
+    samples measure warm starts rather than recompiling edited modules; the
+    fastest of the runs counts, since other load on the machine only ever
+    adds time.
+    """
+    results = []
+    for command in commands:
+        statement = "import omr" if command == "omr" else f"import omr; omr.load({command!r})"
+        _import_cost_us(statement)
+        samples = [_import_cost_us(statement) / 1000 for _ in range(runs)]
+        results.append((command, min(samples), STARTUP_BUDGET_MS.get(command)))
+    return results
+
+
+def startup(args) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="omr.py startup",
+                                     description="Measure subcommand import time against STARTUP_BUDGET_MS.")
+    parser.add_argument("commands", nargs="*", help="Commands to measure (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command; the fastest counts (default: 5)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any command is over its budget")
+    options = parser.parse_args(args)
+
+    unknown = [name for name in options.commands if name != "omr" and name not in COMMANDS]
+    if unknown:
+        parser.error(f"unknown command(s): {', '.join(unknown)}")
+    commands = options.commands or ["omr", *COMMANDS]
+
+    over = 0
+    width = max(len(name) for name in commands)
+    for command, ms, budget in measure_startup(commands, options.runs):
+        status = "  " if budget is None else ("✅" if ms <= budget else "❌")
+        over += budget is not None and ms > budget
+        limit = f"/ {budget} ms" if budget is not None else ""
+        print(f"{status} {command:<{width}}  {ms:7.1f} ms {limit}")
+    if over:
+        print(f"\n{over} command(s) over their startup budget")
+    return 1 if over and options.check else 0
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        usage()
+        return 0
+    command, args = argv[0], argv[1:]
+    if command == "startup":
+        return startup(args)
+    if command not in COMMANDS:
+        print(f"omr.py: unknown command '{command}'\n", file=sys.stderr)
+        usage(sys.stderr)
+        return 2
+    return run(command, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
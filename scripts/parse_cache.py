@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+parse_cache.py - Persistent Parse and Verdict Cache Shared by the Tools
+
+Purpose: One on-disk cache in .cache/omr/parse/ for what the validators and
+         converters compute from an input: the parsed job history model,
+         the job history validator's report, the rendered Markdown and the
+         bullet guardrail results. Whichever tool sees an input first stores
+         its result; every later run on the same input (by the same or
+         another tool) costs a hash and one small file read.
+
+         An entry is keyed by the SHA-256 of the input (for bullet output,
+         of the sanitized text) and the version of the tool that produced it.
+         Versions are either a constant the tool bumps (MODEL_VERSION) or a
+         hash of the source files the result depends on (source_version()),
+         so editing a check or the template invalidates its entries without
+         anyone remembering to bump a number.
+
+         Entries are marshal-encoded plain values (tuples, lists, str, int,
+         bool, None; nothing executable on load) behind a small header, and
+         are written to a temporary file and renamed into place, so readers
+         in other processes see a whole entry or none. Hits refresh the
+         entry's mtime; when a write takes the cache over its size cap
+         (OMR_PARSE_CACHE_MB, default 64), the least recently used entries
+         are deleted under a lock until it is back to 80% of the cap.
+
+Usage:
+    python scripts/parse_cache.py            # entries and size per tool
+    python scripts/parse_cache.py --evict    # enforce the size cap now
+    python scripts/parse_cache.py --clear    # delete every entry
+"""
+
+import hashlib
+import marshal
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = REPO_ROOT / ".cache" / "omr" / "parse"
+
+DEFAULT_MAX_BYTES = int(float(os.getenv("OMR_PARSE_CACHE_MB", "64")) * 1024 * 1024)
+
+# Eviction stops once the cache is at this fraction of the cap, so a full
+# cache is not rescanned on every write
+EVICT_TO = 0.8
+
+# A hit only rewrites the entry's mtime when it is older than this, so
+# repeated hits do not turn every read into a metadata write
+TOUCH_INTERVAL = 60.0
+
+# Leftover temporary files (from a killed writer) older than this are removed
+STALE_TMP_SECONDS = 3600.0
+
+_MAGIC = b"OMRC"
+_HEADER = struct.Struct("<4sH")
+_FORMAT_VERSION = 1
+_MARSHAL_FORMAT = 4
+_SUFFIX = ".bin"
+
+
+class ParseCache:
+    """
+    Namespaced, size-capped cache of plain values. get()/put() take the
+    tool name, the tool's version string and the input digest.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def path(self, tool: str, version, digest: str) -> Path:
+        key = hashlib.sha256(f"{version}\0{digest}".encode('utf-8')).hexdigest()
+        return self.directory / tool / f"{key}{_SUFFIX}"
+
+    def get(self, tool: str, version, digest: str):
+        """The stored value, or None when absent, from another format or corrupt."""
+        path = self.path(tool, version, digest)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+                mtime = os.fstat(f.fileno()).st_mtime
+        except OSError:
+            return None
+        if len(data) < _HEADER.size or _HEADER.unpack_from(data) != (_MAGIC, _FORMAT_VERSION):
+            return None
+        try:
+            value = marshal.loads(data[_HEADER.size:])
+        except (EOFError, ValueError, TypeError):
+            return None
+        if time.time() - mtime > TOUCH_INTERVAL:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return value
+
+    def put(self, tool: str, version, digest: str, value):
+        """
+        Atomically store value (marshal-able plain data). A read-only tree
+        just skips caching.
+        """
+        path = self.path(tool, version, digest)
+        try:
+            data = _HEADER.pack(_MAGIC, _FORMAT_VERSION) + marshal.dumps(value, _MARSHAL_FORMAT)
+        except ValueError:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+            self._added(len(data))
+        except OSError:
+            pass
+
+    # -----------------------------------------------------------------------
+    # Size cap
+    # -----------------------------------------------------------------------
+
+    def _added(self, size: int):
+        """Evict after a write when the size recorded in .size says the cap is exceeded."""
+        total = self._read_size() + size
+        if total > self.max_bytes:
+            self.evict()
+        else:
+            self._write_size(total)
+
+    def _read_size(self) -> int:
+        try:
+            return int((self.directory / ".size").read_text())
+        except (OSError, ValueError):
+            return 0
+
+    def _write_size(self, total: int):
+        # Advisory only: concurrent writers may lose each other's updates,
+        # and the next eviction rescans the directory anyway
+        tmp = self.directory / f".size.{os.getpid()}.tmp"
+        try:
+            tmp.write_text(str(total))
+            os.replace(tmp, self.directory / ".size")
+        except OSError:
+            pass
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every entry; removes stale temporary files on the way."""
+        found = []
+        now = time.time()
+        try:
+            tools = [entry for entry in os.scandir(self.directory) if entry.is_dir()]
+        except OSError:
+            return found
+        for tool in tools:
+            try:
+                files = list(os.scandir(tool.path))
+            except OSError:
+                continue
+            for entry in files:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if entry.name.endswith(_SUFFIX):
+                    found.append((stat.st_mtime, stat.st_size, entry.path))
+                elif entry.name.endswith(".tmp") and now - stat.st_mtime > STALE_TMP_SECONDS:
+                    _unlink(entry.path)
+        return found
+
+    def evict(self, target: Optional[int] = None) -> int:
+        """
+        Delete least recently used entries until the cache holds at most
+        target bytes (default: EVICT_TO of the cap). Returns the number removed.
+        """
+        from compliance_tracker import _FileLock
+
+        if target is None:
+            target = int(self.max_bytes * EVICT_TO)
+        removed = 0
+        try:
+            with _FileLock(self.directory / ".lock"):
+                entries = self.entries()
+                total = sum(size for _, size, _ in entries)
+                if total > target:
+                    entries.sort()
+                    for _, size, path in entries:
+                        if total <= target:
+                            break
+                        if _unlink(path):
+                            removed += 1
+                        total -= size
+                self._write_size(total)
+        except OSError:
+            pass
+        return removed
+
+    def clear(self) -> int:
+        return self.evict(target=0)
+
+    def stats(self) -> Dict[str, Tuple[int, int]]:
+        """tool -> (entries, bytes)."""
+        totals = {}
+        for _, size, path in self.entries():
+            tool = os.path.basename(os.path.dirname(path))
+            count, total = totals.get(tool, (0, 0))
+            totals[tool] = (count + 1, total + size)
+        return totals
+
+
+def _unlink(path) -> bool:
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
+
+
+_default_cache = None
+
+
+def get_cache() -> ParseCache:
+    """Process-wide cache for the default directory."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ParseCache()
+    return _default_cache
+
+
+_source_versions = {}
+
+
+def source_version(paths: Iterable[Path], *extra) -> str:
+    """
+    Version string for results that depend on these files (tool sources,
+    templates, data files): a hash of their contents, plus any extra values.
+    Computed once per process.
+    """
+    key = (tuple(str(path) for path in paths), extra)
+    if key not in _source_versions:
+        digest = hashlib.sha256(repr(extra).encode('utf-8'))
+        for path in key[0]:
+            try:
+                digest.update(Path(path).read_bytes())
+            except OSError:
+                digest.update(b"\0missing\0" + path.encode('utf-8'))
+        _source_versions[key] = digest.hexdigest()
+    return _source_versions[key]
+
+
+def text_digest(text: str) -> str:
+    """SHA-256 of text as UTF-8, the cache key for in-memory input."""
+    return hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or trim the shared parse cache (.cache/omr/parse/).")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--evict", action="store_true", help="Delete least recently used entries down to the cap")
+    action.add_argument("--clear", action="store_true", help="Delete every entry")
+    args = parser.parse_args()
+
+    cache = get_cache()
+    if args.clear:
+        print(f"Removed {cache.clear()} entries")
+        return
+    if args.evict:
+        print(f"Removed {cache.evict()} entries")
+
+    stats = cache.stats()
+    total = sum(size for _, size in stats.values())
+    print(f"{cache.directory}  ({total / 1024 / 1024:.1f} of {cache.max_bytes / 1024 / 1024:.0f} MB)")
+    for tool, (count, size) in sorted(stats.items()):
+        print(f"  {tool:<24} {count:>6} entries  {size / 1024:>10.1f} KB")
+    if not stats:
+        print("  (empty)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
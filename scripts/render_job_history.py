@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+render_job_history.py - One Parse, Many Output Formats
+
+Purpose: Renders a job history .txt file to several formats in one run:
+         Markdown (identical to convert_job_history_to_md.py), JSON for the
+         GUI, a standalone HTML preview, and compact plain text for LLM
+         prompt context. The file is parsed once into the job history model
+         (job_history_model.py, loaded from its cache when available) and
+         every position is handed to each emitter in turn, so all outputs
+         are written side by side while the positions stream past; large
+         files (--mmap) are never held in memory as a whole.
+
+         Emitters are classes in EMITTERS: head() for the document start,
+         position() per position (Position 0 first), tail() to close. Each
+         yields text fragments; adding a format is adding a class.
+
+Usage:
+    python scripts/render_job_history.py job_history.txt                  # all formats
+    python scripts/render_job_history.py job_history.txt --format json,llm
+    python scripts/render_job_history.py histories/*.txt --out-dir build/
+"""
+
+import argparse
+import html
+import itertools
+import json
+import mmap
+import os
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from convert_job_history_to_md import (
+    MMAP_THRESHOLD,
+    WRITE_BUFFER,
+    document_positions,
+    iter_document,
+    mapped_parts,
+    render_position,
+)
+from job_history_model import JobHistory, Position, as_dict, load_job_history
+
+
+# ---------------------------------------------------------------------------
+# Emitters
+# ---------------------------------------------------------------------------
+
+class Emitter:
+    """One output format. A new instance is used for every output file."""
+
+    name = ""
+    suffix = ""
+
+    def head(self, history: JobHistory) -> Iterator[str]:
+        return iter(())
+
+    def position(self, position: Position) -> Iterator[str]:
+        return iter(())
+
+    def tail(self) -> Iterator[str]:
+        return iter(())
+
+
+class MarkdownEmitter(Emitter):
+    """The Markdown written by convert_job_history_to_md.py."""
+
+    name = "md"
+    suffix = ".md"
+
+    def head(self, history):
+        return iter_document(history, (), ())
+
+    def position(self, position):
+        return render_position(position)
+
+
+class JsonEmitter(Emitter):
+    """The model as JSON: header and global fields, then "positions" (one per line)."""
+
+    name = "json"
+    suffix = ".json"
+
+    def __init__(self):
+        self.count = 0
+
+    def head(self, history):
+        fields = as_dict(history)
+        del fields['position_zero'], fields['positions']
+        yield "{"
+        for key, value in fields.items():
+            yield f"{json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}, "
+        yield '"positions": ['
+
+    def position(self, position):
+        yield ",\n  " if self.count else "\n  "
+        self.count += 1
+        yield json.dumps(as_dict(position), ensure_ascii=False)
+
+    def tail(self):
+        yield "\n]}\n" if self.count else "]}\n"
+
+
+_HTML_STYLE = """body{font-family:system-ui,sans-serif;max-width:60rem;margin:2rem auto;padding:0 1rem;line-height:1.5;color:#222}
+h1{border-bottom:2px solid #333}section.position{border-top:1px solid #ccc;margin-top:2rem}
+table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:.25rem .5rem;text-align:left}
+.meta{color:#555}pre{white-space:pre-wrap;background:#f6f6f6;padding:.5rem}"""
+
+
+def _esc(text) -> str:
+    return html.escape(str(text))
+
+
+def _html_list(items: Iterable[str]) -> Iterator[str]:
+    yield "<ul>\n"
+    for item in items:
+        yield f"<li>{_esc(item)}</li>\n"
+    yield "</ul>\n"
+
+
+class HtmlEmitter(Emitter):
+    """A standalone HTML preview page."""
+
+    name = "html"
+    suffix = ".html"
+
+    def head(self, history):
+        title = f"Job History {history.version}" if history.version else "Job History"
+        yield (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+               f'<title>{_esc(title)}</title>\n<style>\n{_HTML_STYLE}\n</style>\n</head>\n<body>\n<main>\n')
+        yield f"<h1>Comprehensive Job History Summaries</h1>\n<p class=\"meta\">Version {_esc(history.version or '-')}"
+        if history.last_updated is not None:
+            yield f" · Last updated {_esc(history.last_updated)}"
+        yield "</p>\n"
+        if history.version_history is not None:
+            yield f"<h2>Version History</h2>\n<pre>{_esc(history.version_history)}</pre>\n"
+        if history.global_summary is not None:
+            yield f"<h2>Global Professional Summary</h2>\n<p>{_esc(history.global_summary)}</p>\n"
+        if history.linkedin_about is not None:
+            yield f"<h2>LinkedIn About Narrative</h2>\n<p>{_esc(history.linkedin_about)}</p>\n"
+        if history.education is not None:
+            yield "<h2>Education</h2>\n"
+            yield from _html_list(", ".join(part for part in (d.title, d.institution, d.location) if part)
+                                  for d in history.education if d.title is not None)
+        if history.certifications is not None:
+            yield "<h2>Certifications</h2>\n"
+            yield from _html_list(", ".join(part for part in (c.name, c.issuer, c.date_earned) if part)
+                                  + ("" if c.status == "active" else f" ({c.status})")
+                                  for c in history.certifications if c.name is not None)
+
+    def position(self, position):
+        title = position.title if position.title is not None else f"Position {position.id}"
+        yield f'<section class="position" id="position-{_esc(position.id)}">\n'
+        yield f"<h2>Position {_esc(position.id)}: {_esc(title)}</h2>\n"
+        metadata = position.metadata
+        if metadata is not None:
+            parts = [metadata.job_title, metadata.company,
+                     f"{metadata.start} – {metadata.end}" if metadata.start is not None and metadata.end is not None
+                     else None,
+                     metadata.duration]
+            yield f'<p class="meta">{_esc(" · ".join(p for p in parts if p))}</p>\n'
+        if position.professional_summary is not None:
+            yield f"<p>{_esc(position.professional_summary)}</p>\n"
+        if position.core_responsibilities is not None:
+            yield "<h3>Core Responsibilities</h3>\n"
+            yield from _html_list(position.core_responsibilities)
+        if position.key_achievements is not None:
+            yield "<h3>Key Achievements</h3>\n<ul>\n"
+            for achievement in position.key_achievements:
+                if achievement.text is not None:
+                    yield f"<li>{_esc(achievement.text)}</li>\n"
+                    continue
+                yield f"<li><strong>Achievement #{_esc(achievement.id)}</strong><dl>\n"
+                for label in ('context', 'action', 'result', 'impact'):
+                    value = getattr(achievement, label)
+                    if value is not None:
+                        yield f"<dt>{label.title()}</dt><dd>{_esc(value)}</dd>\n"
+                yield "</dl></li>\n"
+            yield "</ul>\n"
+        for heading, items in (("Hard Skills Demonstrated", position.hard_skills),
+                               ("Soft Skills Demonstrated", position.soft_skills),
+                               ("Tools &amp; Technologies", position.tools)):
+            if items is not None:
+                yield f"<h3>{heading}</h3>\n"
+                yield from _html_list(items)
+        if position.impact_metrics is not None:
+            yield "<h3>Impact Metrics</h3>\n<table>\n<tr><th>Metric</th><th>Value</th></tr>\n"
+            for metric in position.impact_metrics:
+                name, value = metric.split(':', 1) if ':' in metric else ("Achievement", metric)
+                yield f"<tr><td>{_esc(name.strip())}</td><td>{_esc(value.strip())}</td></tr>\n"
+            yield "</table>\n"
+        yield "</section>\n"
+
+    def tail(self):
+        yield "</main>\n</body>\n</html>\n"
+
+
+def _flat(text: str) -> str:
+    """Text on one line with runs of whitespace collapsed."""
+    return " ".join(text.split())
+
+
+class LlmContextEmitter(Emitter):
+    """
+    Compact plain text for LLM prompt context: one labelled line per field,
+    no markup, version history and LinkedIn narrative left out.
+    """
+
+    name = "llm"
+    suffix = ".llm.txt"
+
+    def head(self, history):
+        yield f"JOB HISTORY {history.version or ''}".rstrip() + "\n"
+        if history.global_summary is not None:
+            yield f"Summary: {_flat(history.global_summary)}\n"
+        if history.education:
+            yield "Education: " + "; ".join(
+                _flat(", ".join(part for part in (d.title, d.institution) if part))
+                for d in history.education if d.title is not None) + "\n"
+        if history.certifications:
+            yield "Certifications: " + "; ".join(
+                _flat(c.name) + (f" ({_flat(c.issuer)})" if c.issuer else "")
+                for c in history.certifications if c.name is not None) + "\n"
+
+    def position(self, position):
+        metadata = position.metadata
+        line = [f"\n[P{position.id}]"]
+        if metadata is not None and metadata.job_title is not None:
+            line.append(_flat(metadata.job_title))
+        elif position.title is not None:
+            line.append(_flat(position.title))
+        if metadata is not None:
+            if metadata.company is not None:
+                line.append(f"| {_flat(metadata.company)}")
+            if metadata.start is not None and metadata.end is not None:
+                line.append(f"| {_flat(metadata.start)} - {_flat(metadata.end)}")
+            if metadata.duration is not None:
+                line.append(f"({_flat(metadata.duration)})")
+        yield " ".join(line) + "\n"
+        if position.professional_summary is not None:
+            yield f"Summary: {_flat(position.professional_summary)}\n"
+        if position.core_responsibilities:
+            yield "Responsibilities: " + "; ".join(_flat(b) for b in position.core_responsibilities) + "\n"
+        if position.key_achievements:
+            yield "Achievements:\n"
+            for achievement in position.key_achievements:
+                if achievement.text is not None:
+                    yield f"- {_flat(achievement.text)}\n"
+                else:
+                    parts = [_flat(getattr(achievement, label)) for label in ('context', 'action', 'result')
+                             if getattr(achievement, label)]
+                    impact = f" (impact: {_flat(achievement.impact)})" if achievement.impact else ""
+                    yield f"- {' -> '.join(parts)}{impact}\n"
+        for label, items in (("Hard skills", position.hard_skills), ("Soft skills", position.soft_skills),
+                             ("Tools", position.tools)):
+            if items:
+                yield f"{label}: " + ", ".join(_flat(item) for item in items) + "\n"
+        if position.impact_metrics:
+            yield "Metrics: " + "; ".join(_flat(m) for m in position.impact_metrics) + "\n"
+
+
+EMITTERS: Dict[str, type] = {cls.name: cls for cls in (MarkdownEmitter, JsonEmitter, HtmlEmitter, LlmContextEmitter)}
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+def render(history: JobHistory, position_zero: Optional[Position], positions: Iterable[Position],
+           sinks: List[Tuple[Emitter, TextIO]]):
+    """
+    Stream one parsed document to every (emitter, output) pair: all heads,
+    then each position to every emitter as it arrives, then all tails.
+    positions: the document's positions (Position 0 and unnumbered ones
+    are skipped, as in the Markdown).
+    """
+    for emitter, out in sinks:
+        out.writelines(emitter.head(history))
+    for position in itertools.chain([position_zero] if position_zero else [], document_positions(positions)):
+        for emitter, out in sinks:
+            out.writelines(emitter.position(position))
+    for emitter, out in sinks:
+        out.writelines(emitter.tail())
+
+
+@contextmanager
+def open_parts(input_path, use_mmap: Optional[bool] = None, use_cache: bool = True):
+    """
+    (history, Position 0, positions) of a job history file. Mapped files
+    stream their positions, so consume them inside the with block.
+    """
+    if use_mmap is None:
+        use_mmap = os.path.getsize(input_path) >= MMAP_THRESHOLD
+    if use_mmap and os.path.getsize(input_path) > 0:
+        with open(input_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield mapped_parts(data)
+        return
+    history = load_job_history(input_path, use_cache=use_cache)
+    yield history, history.first_position_zero(), history.positions
+
+
+def output_path(input_path, emitter: type, out_dir=None) -> Path:
+    """input.txt -> input<suffix>, next to the input or in out_dir."""
+    path = Path(input_path)
+    target = path.with_name(path.stem + emitter.suffix)
+    return Path(out_dir) / target.name if out_dir is not None else target
+
+
+def render_file(input_path, formats: Iterable[str] = tuple(EMITTERS), out_dir=None,
+                use_mmap: Optional[bool] = None, use_cache: bool = True) -> Dict[str, Path]:
+    """Render one job history file to each format in one parse; returns {format: output path}."""
+    outputs = {name: output_path(input_path, EMITTERS[name], out_dir) for name in formats}
+    with ExitStack() as stack:
+        sinks = [(EMITTERS[name](), stack.enter_context(open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER)))
+                 for name, path in outputs.items()]
+        history, position_zero, positions = stack.enter_context(open_parts(input_path, use_mmap, use_cache))
+        render(history, position_zero, positions, sinks)
+    return outputs
+
+
+def _formats(value: str) -> List[str]:
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in EMITTERS]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(f"unknown format(s): {', '.join(unknown) or value!r} "
+                                         f"(choose from {', '.join(EMITTERS)})")
+    return list(dict.fromkeys(names))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render job history .txt files to several formats in one parse.")
+    parser.add_argument("inputs", nargs="+", help="Job history .txt file(s)")
+    parser.add_argument("--format", type=_formats, default=list(EMITTERS),
+                        help=f"Comma-separated formats (default: all of {','.join(EMITTERS)})")
+    parser.add_argument("--out-dir", help="Write outputs here instead of next to each input")
+    parser.add_argument("--mmap", action="store_true", default=None,
+                        help=f"Memory-map the inputs (default for files >= {MMAP_THRESHOLD // (1024 * 1024)} MB)")
+    parser.add_argument("--no-cache", action="store_true", help="Parse files even if their model is cached")
+    args = parser.parse_args()
+
+    missing = [path for path in args.inputs if not os.path.exists(path)]
+    if missing:
+        print(f"Error: File not found: {', '.join(missing)}")
+        sys.exit(1)
+    if args.out_dir:
+        Path(args.out_dir).mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    for input_path in args.inputs:
+        outputs = render_file(input_path, args.format, args.out_dir, use_mmap=args.mmap, use_cache=not args.no_cache)
+        print(f"✅ Rendered {input_path} -> {', '.join(str(path) for path in outputs.values())}")
+    if len(args.inputs) > 1:
+        print(f"   {len(args.inputs)} files x {len(args.format)} formats in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
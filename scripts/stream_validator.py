@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+stream_validator.py - Incremental Guardrail Validation for Streaming LLM Output
+
+Purpose: Validates bullet generation output while it is still being generated.
+         Text chunks are fed as tokens arrive; guardrail failures are reported
+         as soon as they are decidable so the caller can cancel the generation
+         and retry instead of paying for the full completion.
+
+Early (fail-fast) verdicts:
+    G40-Stage1 - first bullet appears before the Budget Allocation Table
+    G12        - a newly mentioned position breaks ascending order
+    G24        - a completed bullet is outside the character limits
+
+When the stream ends, close() returns exactly what validate_output() returns
+for the full (sanitized) text, so streaming and batch verdicts always agree.
+
+Usage:
+    ollama run model "..." | python scripts/stream_validator.py
+    (exits 1 as soon as a guardrail fails, closing the pipe)
+
+Exit Codes:
+    0 = All validations passed
+    1 = One or more validations failed
+
+Context: ENFORCEMENT_STRUCTURAL_SOLUTIONS.md - Solution B1 (streaming variant)
+"""
+
+import re
+import sys
+from typing import Iterable, List, Tuple
+
+from lazy_re import lazy_compile
+from validate_bullets import (
+    BUDGET_TABLE_RE,
+    POSITION_MENTION_RE,
+    ValidationResult,
+    sanitize_input,
+    scan_line,
+    validate_output,
+)
+
+# Suffix of the scanned text that could still grow into a position mention
+# once more text arrives (e.g. "Posit", "Position #", "P12 ").
+_PARTIAL_MENTION_RE = lazy_compile(
+    r"(?:P(?:o(?:s(?:i(?:t(?:i(?:o(?:n\s*#?\d*)?)?)?)?)?)?)?|P\d+\s*)\Z",
+    re.IGNORECASE,
+)
+
+
+class StreamingValidator:
+    """
+    Incremental validator fed with text chunks.
+
+    Parser state (current position, first mentions, checkpoint status) is
+    kept between chunks; only complete lines are interpreted, so a verdict
+    never depends on where the chunk boundaries fall.
+    """
+
+    def __init__(self, sanitize: bool = True, min_chars: int = 100, max_chars: int = 210):
+        self.sanitize = sanitize
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+
+        self.lines = []
+        self.verdicts = []
+        self._pending = ""
+        self._closed = False
+
+        # Line-level parser state (mirrors parse_document)
+        self._current_position = -1
+        self._first_bullet_seen = False
+
+        # Position mention state
+        self._mention_carry = ""
+        self._mentioned = set()
+        self._last_mention = None
+
+        # Guardrails already decided early (report each only once)
+        self._decided = set()
+
+    @property
+    def failed(self) -> bool:
+        """True once any guardrail has failed; the generation can be aborted."""
+        return any(not v.passed for v in self.verdicts)
+
+    def feed(self, chunk: str) -> List[ValidationResult]:
+        """
+        Feed the next chunk of generated text.
+        Returns the verdicts that became decidable with this chunk.
+        """
+        if self._closed:
+            raise ValueError("StreamingValidator is closed")
+
+        self._pending += chunk
+        if '\n' not in chunk:
+            return []
+
+        *complete, self._pending = self._pending.split('\n')
+        new_verdicts = []
+        for line in complete:
+            new_verdicts.extend(self._process_line(line))
+        return new_verdicts
+
+    def close(self) -> List[ValidationResult]:
+        """
+        End the stream and return the final verdict for the full text.
+        Identical to validate_output(sanitize_input(full_text)).
+        """
+        if not self._closed:
+            self._closed = True
+            line = self._pending
+            self._pending = ""
+            self.lines.append(sanitize_input(line) if self.sanitize else line)
+        return validate_output('\n'.join(self.lines))
+
+    def _process_line(self, line: str) -> List[ValidationResult]:
+        if self.sanitize:
+            line = sanitize_input(line)
+        self.lines.append(line)
+        line_no = len(self.lines)
+
+        verdicts = self._scan_mentions(line + '\n', line_no)
+
+        header_position, bullet_text = scan_line(line)
+        if header_position is not None:
+            self._current_position = header_position
+        elif bullet_text is not None and self._current_position >= 0 and len(bullet_text) > 20:
+            verdicts.extend(self._check_bullet(bullet_text, line_no))
+
+        self.verdicts.extend(verdicts)
+        return verdicts
+
+    def _check_bullet(self, bullet_text: str, line_no: int) -> List[ValidationResult]:
+        verdicts = []
+
+        # G40-Stage1: the table must already be present when the first bullet lands
+        if not self._first_bullet_seen:
+            self._first_bullet_seen = True
+            if not BUDGET_TABLE_RE.search('\n'.join(self.lines)):
+                verdicts.append(self._decide(
+                    "G40-Stage1", "Budget Allocation Table present",
+                    f"NOT FOUND before first bullet at line {line_no} - Stage 1 checkpoint missing"
+                ))
+
+        # G24: a completed bullet's length is final
+        char_count = len(bullet_text)
+        if char_count < self.min_chars or char_count > self.max_chars:
+            verdicts.append(self._decide(
+                "G24", f"Bullet character limits ({self.min_chars}-{self.max_chars})",
+                f"VIOLATION: Position {self._current_position}: {char_count} chars (line {line_no})"
+            ))
+
+        return [v for v in verdicts if v is not None]
+
+    def _scan_mentions(self, text: str, line_no: int) -> List[ValidationResult]:
+        """
+        G12: track first mentions of each position across line boundaries.
+        Any suffix that could still become a mention is carried over.
+        """
+        buffer = self._mention_carry + text
+        verdicts = []
+        end = 0
+
+        for match in POSITION_MENTION_RE.finditer(buffer):
+            end = match.end()
+            position_id = int(match.group(1) or match.group(2))
+            if position_id in self._mentioned:
+                continue
+            self._mentioned.add(position_id)
+            if self._last_mention is not None and position_id < self._last_mention:
+                verdicts.append(self._decide(
+                    "G12", "Positions in chronological order",
+                    f"WRONG - Position {position_id} first mentioned after Position "
+                    f"{self._last_mention} (line {line_no})"
+                ))
+            self._last_mention = position_id
+
+        partial = _PARTIAL_MENTION_RE.search(buffer, end)
+        self._mention_carry = buffer[partial.start():] if partial else ""
+        return [v for v in verdicts if v is not None]
+
+    def _decide(self, guardrail: str, description: str, details: str):
+        if guardrail in self._decided:
+            return None
+        self._decided.add(guardrail)
+        return ValidationResult(guardrail=guardrail, description=description, passed=False, details=details)
+
+
+def validate_stream(chunks: Iterable[str], stop_on_failure: bool = True) -> Tuple[List[ValidationResult], bool]:
+    """
+    Validate an iterable of text chunks (e.g. a token stream).
+    Returns (results, aborted). When stop_on_failure is set, iteration stops
+    at the first failing verdict and results holds the early verdicts only;
+    otherwise results is the full final verdict.
+    """
+    validator = StreamingValidator()
+    for chunk in chunks:
+        validator.feed(chunk)
+        if stop_on_failure and validator.failed:
+            return list(validator.verdicts), True
+    return validator.close(), False
+
+
+def main():
+    """Main entry point: validate stdin as it streams in."""
+    from validate_bullets import print_results
+
+    def stdin_chunks():
+        while True:
+            chunk = sys.stdin.readline()
+            if not chunk:
+                return
+            yield chunk
+
+    results, aborted = validate_stream(stdin_chunks())
+    if aborted:
+        print("\nSTREAM ABORTED: guardrail failure detected before end of generation")
+    all_passed = print_results(results)
+
+    sys.exit(0 if all_passed and not aborted else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,25 @@ Purpose: Validates LLM-generated bullet output against project guardrails.
 Usage:
     python scripts/validate_bullets.py [input_file]
     cat output.txt | python scripts/validate_bullets.py
+    python scripts/validate_bullets.py --batch outputs/ 'runs/**/*.md' @manifest.txt \
+        [--workers N] [--report report.json]
+    python scripts/validate_bullets.py output.txt --metrics-file metrics/omr.prom
+    python scripts/validate_bullets.py output.txt --no-cache
+    python scripts/validate_bullets.py output.txt --source job_history.txt [--rule-timings]
+    python scripts/validate_bullets.py output.txt --content-rules
+
+Results are stored in the shared parse cache (parse_cache.py) under the hash
+of the sanitized output, so re-validating unchanged output only hashes it.
+The per-bullet guardrails are rules of the single-pass engine in
+guardrail_rules.py; --source adds the checks against the job history the
+bullets were generated from (G1, G5, G29), --content-rules adds the
+content checks (G11, G14, G15, G20, G22, G35 and the advisory G37), and
+--rule-timings prints the time spent in each rule.
 
 Exit Codes:
     0 = All validations passed
     1 = One or more validations failed
+    2 = Batch mode only: one or more files could not be read
 
 Created: 2026-01-30
 Context: ENFORCEMENT_STRUCTURAL_SOLUTIONS.md - Solution B1
@@ -20,12 +35,88 @@ Context: ENFORCEMENT_STRUCTURAL_SOLUTIONS.md - Solution B1
 import sys
 import re
 import unicodedata
-import json
 import os
-from typing import List, Tuple, Dict
+import threading
+from bisect import bisect_right
+from typing import List, NamedTuple, Tuple, Dict, Optional, Union
 from dataclasses import dataclass
 
+from lazy_re import lazy_compile
+from validator_metrics import REGISTRY, instrument, record_guardrail_results, write_metrics_file
+
+
+# ---------------------------------------------------------------------------
+# Layer 0 sanitizer engine
+#
+# ASCII input is handled with a precomputed str.translate deletion table.
+# For other input, code points are classified (keep / delete) once per
+# distinct character and remembered; two compiled character-class regexes
+# then find unclassified and deletable characters at C speed, so clean text
+# costs a couple of scans and dirty text one str.replace per distinct
+# offending character.
+# ---------------------------------------------------------------------------
+
+# Zero-width and other hidden characters (all category Cf, listed for clarity)
+# U+200B: Zero Width Space
+# U+200C: Zero Width Non-Joiner
+# U+200D: Zero Width Joiner
+# U+FEFF: Byte Order Mark
+HIDDEN_CHARS = ['\u200b', '\u200c', '\u200d', '\ufeff']
+
+# Control characters that are kept
+ALLOWED_CONTROL_CHARS = frozenset('\n\t\r')
+
+# Chunk size (characters) for sanitize_chunks() on huge inputs
+SANITIZE_CHUNK_SIZE = 1 << 20
+
+_ASCII_DELETE_TABLE = {
+    cp: None for cp in list(range(0x00, 0x20)) + [0x7F]
+    if chr(cp) not in ALLOWED_CONTROL_CHARS
+}
+
+_classify_lock = threading.Lock()
+_known_chars = {chr(cp) for cp in range(0x00, 0xA0)} | set(HIDDEN_CHARS)
+_delete_chars = (
+    {chr(cp) for cp in list(range(0x00, 0x20)) + list(range(0x7F, 0xA0))} - ALLOWED_CONTROL_CHARS
+) | set(HIDDEN_CHARS)
+
+
+def _char_class(chars, negate: bool = False) -> "re.Pattern":
+    """Compile a set of characters into a single range-compressed character class."""
+    ranges = []
+    for cp in sorted(map(ord, chars)):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    body = "".join(
+        re.escape(chr(lo)) if lo == hi else f"{re.escape(chr(lo))}-{re.escape(chr(hi))}"
+        for lo, hi in ranges
+    )
+    return lazy_compile(f"[{'^' if negate else ''}{body}]")
+
+
+_unknown_re = _char_class(_known_chars, negate=True)
+_delete_re = _char_class(_delete_chars)
+
+
+def _classify_new_chars(text: str):
+    """Classify characters not seen before; category C (bar \\n \\t \\r) is deleted."""
+    global _unknown_re, _delete_re
 
+    with _classify_lock:
+        unseen = set(_unknown_re.findall(text))
+        if not unseen:
+            return
+        for ch in unseen:
+            if unicodedata.category(ch)[0] == "C" and ch not in ALLOWED_CONTROL_CHARS:
+                _delete_chars.add(ch)
+        _known_chars.update(unseen)
+        _delete_re = _char_class(_delete_chars)
+        _unknown_re = _char_class(_known_chars, negate=True)
+
+
+@instrument("sanitize_input")
 def sanitize_input(text: str) -> str:
     """
     Layer 0: Input Sanitization & Normalization (arXiv 2504.11168)
@@ -33,25 +124,81 @@ def sanitize_input(text: str) -> str:
     2. Strip zero-width characters (U+200B, U+200C, U+200D)
     3. Strip other suspicious non-printable characters
     """
-    # Normalize Unicode characters
-    text = unicodedata.normalize('NFKC', text)
+    # Pure ASCII is already NFKC-normalized and can only contain ASCII controls
+    if text.isascii():
+        return text.translate(_ASCII_DELETE_TABLE)
+
+    # Normalize Unicode characters (skipped when already normalized)
+    if not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
+
+    if _unknown_re.search(text):
+        _classify_new_chars(text)
+
+    # Strip hidden and non-printable characters (except \n, \t, \r):
+    # one str.replace per distinct offending character, resuming the search
+    # where the previous one matched since nothing before it is deletable.
+    match = _delete_re.search(text)
+    while match:
+        text = text.replace(match.group(), '')
+        match = _delete_re.search(text, match.start())
+    return text
 
-    # Strip zero-width characters and other hidden control chars
-    # U+200B: Zero Width Space
-    # U+200C: Zero Width Non-Joiner
-    # U+200D: Zero Width Joiner
-    # U+FEFF: Byte Order Mark
-    hidden_chars = ['\u200b', '\u200c', '\u200d', '\ufeff']
-    for char in hidden_chars:
-        text = text.replace(char, '')
 
-    # Strip non-printable characters (except common ones like \n, \t)
-    text = "".join(ch for ch in text if unicodedata.category(ch)[0] != "C" or ch in ['\n', '\t', '\r'])
+_HANGUL_VT_RE = lazy_compile('[\u1161-\u1175\u11a8-\u11c2]')
 
-    return text
+
+def _nfkc_boundary(text: str, end: int) -> int:
+    """
+    The last index i in (0, end] where NFKC(text[:i]) + NFKC(text[i:]) equals
+    NFKC(text), or 0 if there is none: text[i] must be a starter that neither
+    composes with the character before it nor decomposes to a non-starter or
+    to a Hangul vowel/trailing jamo (which compose with the syllable before).
+    Nothing composes with an ASCII character, so those are taken as is.
+    """
+    for i in range(min(end, len(text) - 1), 0, -1):
+        ch = text[i]
+        if ch.isascii():
+            return i
+        if unicodedata.combining(ch):
+            continue
+        normalized = unicodedata.normalize('NFKC', ch)
+        if normalized and (unicodedata.combining(normalized[0]) or _HANGUL_VT_RE.match(normalized)):
+            continue
+        prev = text[i - 1]
+        if unicodedata.normalize('NFKC', prev + ch) == unicodedata.normalize('NFKC', prev) + normalized:
+            return i
+    return 0
 
 
-@dataclass
+def sanitize_chunks(chunks, chunk_size: int = SANITIZE_CHUNK_SIZE):
+    """
+    Chunked sanitizer for huge inputs (e.g. an open file or a token stream).
+    Yields sanitized pieces of at most chunk_size characters whose
+    concatenation equals sanitize_input() of the concatenated input. Input
+    is cut at the last newline of each chunk_size window, or, in a window
+    without one, before the last character NFKC cannot join to what
+    precedes it (_nfkc_boundary), so normalization never straddles a cut.
+    Only a window consisting entirely of combining marks is carried over
+    whole into the next one.
+    """
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        start = 0
+        while len(pending) - start > chunk_size:
+            end = start + chunk_size
+            cut = pending.rfind('\n', start, end) + 1
+            if not cut:
+                cut = _nfkc_boundary(pending[start:end + 1], chunk_size)
+                if not cut:
+                    break
+                cut += start
+            yield sanitize_input(pending[start:cut])
+            start = cut
+        pending = pending[start:]
+    if pending:
+        yield sanitize_input(pending)
 
 
 @dataclass
@@ -63,79 +210,268 @@ class ValidationResult:
     details: str
 
 
-def check_budget_allocation_table(text: str) -> ValidationResult:
+# ---------------------------------------------------------------------------
+# Document model
+#
+# The LLM output is parsed exactly once into a BulletDocument. Every check_*
+# function reads from that model instead of re-splitting and re-scanning the
+# text. The check_* functions still accept raw text for backward compatibility
+# and parse it on the fly in that case.
+# ---------------------------------------------------------------------------
+
+BUDGET_TABLE_PATTERNS = [
+    r"Budget Allocation Table",
+    r"Position\s*\|.*Recency",
+    r"Position\s*\|.*Bullets",
+    r"\|\s*Position\s*\|.*\|.*Est.*Words",
+]
+
+RECONCILIATION_TABLE_PATTERNS = [
+    r"Final Reconciliation",
+    r"Reconciliation Table",
+    r"Guardrail Health Check",
+    r"\|\s*Requirement\s*\|.*Actual",
+    r"\|\s*Check\s*\|.*Value\s*\|.*Pass",
+]
+
+PER_BULLET_GATE_PATTERNS = [
+    r"Character\s*Count.*\d+",
+    r"char[s]?.*\d+",
+    r"\d+\s*chars",
+    r"Verb\s*Category",
+    r"\[Built\]|\[Lead\]|\[Managed\]|\[Improved\]|\[Collaborate\]",
+    r"Stage 2",
+    r"Per-Bullet",
+]
+
+
+def _compile_any(patterns: List[str]) -> "re.Pattern":
+    """Combine alternative patterns into one regex (first match wins)."""
+    return lazy_compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+BUDGET_TABLE_RE = _compile_any(BUDGET_TABLE_PATTERNS)
+RECONCILIATION_TABLE_RE = _compile_any(RECONCILIATION_TABLE_PATTERNS)
+PER_BULLET_GATE_RES = [lazy_compile(p, re.IGNORECASE) for p in PER_BULLET_GATE_PATTERNS]
+
+# Union of the position mention patterns:
+#   Position\s+(\d+), Position\s*#?(\d+), \*\*Position\s+(\d+)  -> first branch
+#   P(\d+)\s*[-:]                                               -> second branch
+POSITION_MENTION_RE = lazy_compile(r"Position\s*#?(\d+)|P(\d+)\s*[-:]", re.IGNORECASE)
+POSITION_HEADER_RE = lazy_compile(r"Position\s+(\d+)", re.IGNORECASE)
+BULLET_RE = lazy_compile(r"^[\s]*[•\-\*]\s*(.+)$")
+
+
+class PositionMention(NamedTuple):
+    """First mention of a position number in the output."""
+    position_id: int
+    line_no: int
+
+
+class Bullet(NamedTuple):
+    """A bullet point attributed to the most recent position header."""
+    position_id: int
+    text: str
+    line_no: int
+    char_count: int
+    word_count: int
+    first_word: str
+
+
+class Table(NamedTuple):
+    """A contiguous block of markdown table rows."""
+    start_line: int
+    end_line: int
+    header: str
+
+
+class BulletDocument(NamedTuple):
+    """
+    Immutable, single-pass parse of an LLM bullet generation output.
+    Line numbers are 1-based; a checkpoint value of 0 means "not found".
+    """
+    text: str
+    positions: Tuple[PositionMention, ...]
+    bullets: Tuple[Bullet, ...]
+    tables: Tuple[Table, ...]
+    budget_table_line: int
+    reconciliation_table_line: int
+    per_bullet_gate_indicators: Tuple[str, ...]
+
+    @property
+    def position_ids(self) -> List[int]:
+        """Distinct position numbers, sorted ascending."""
+        return sorted(p.position_id for p in self.positions)
+
+    @property
+    def word_count(self) -> int:
+        return sum(b.word_count for b in self.bullets)
+
+
+def _line_number(line_starts: List[int], offset: int) -> int:
+    """Map a character offset to a 1-based line number."""
+    return bisect_right(line_starts, offset)
+
+
+def scan_line(line: str) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Classify a single output line.
+    Returns (position_id, None) for a position header, (None, bullet_text)
+    for a bullet point, or (None, None) for anything else.
+    """
+    pos_match = POSITION_HEADER_RE.search(line)
+    if pos_match:
+        return int(pos_match.group(1)), None
+
+    bullet_match = BULLET_RE.match(line)
+    if bullet_match:
+        return None, bullet_match.group(1).strip()
+
+    return None, None
+
+
+@instrument("parse_document")
+def parse_document(text: str) -> BulletDocument:
+    """
+    Parse LLM output into a BulletDocument in a single pass over its lines,
+    plus one regex scan per checkpoint family over the full text.
+    """
+    lines = text.split('\n')
+    line_starts = []
+    bullets = []
+    tables = []
+    current_position = -1
+    table_start = 0
+    offset = 0
+
+    for line_no, line in enumerate(lines, 1):
+        line_starts.append(offset)
+        offset += len(line) + 1
+
+        # Markdown tables: group consecutive rows starting with '|'
+        if line.lstrip().startswith('|'):
+            if not table_start:
+                table_start = line_no
+        elif table_start:
+            tables.append(Table(table_start, line_no - 1, lines[table_start - 1].strip()))
+            table_start = 0
+
+        header_position, bullet_text = scan_line(line)
+        if header_position is not None:
+            current_position = header_position
+            continue
+
+        if bullet_text is not None and current_position >= 0:
+            if len(bullet_text) > 20:  # Filter out short non-bullets
+                words = bullet_text.lower().split()
+                bullets.append(Bullet(
+                    position_id=current_position,
+                    text=bullet_text,
+                    line_no=line_no,
+                    char_count=len(bullet_text),
+                    word_count=len(words),
+                    first_word=words[0] if words else "",
+                ))
+
+    if table_start:
+        tables.append(Table(table_start, len(lines), lines[table_start - 1].strip()))
+
+    # Position mentions may span a line break (e.g. "Position\n3"), so they
+    # are matched against the full text and mapped back to line numbers.
+    positions = {}
+    for match in POSITION_MENTION_RE.finditer(text):
+        position_id = int(match.group(1) or match.group(2))
+        if position_id not in positions:
+            positions[position_id] = PositionMention(
+                position_id, _line_number(line_starts, match.start())
+            )
+
+    def first_line(pattern: "re.Pattern") -> int:
+        match = pattern.search(text)
+        return _line_number(line_starts, match.start()) if match else 0
+
+    return BulletDocument(
+        text=text,
+        positions=tuple(positions.values()),
+        bullets=tuple(bullets),
+        tables=tuple(tables),
+        budget_table_line=first_line(BUDGET_TABLE_RE),
+        reconciliation_table_line=first_line(RECONCILIATION_TABLE_RE),
+        per_bullet_gate_indicators=tuple(
+            p.pattern for p in PER_BULLET_GATE_RES if p.search(text)
+        ),
+    )
+
+
+DocumentOrText = Union[BulletDocument, str]
+
+
+def _as_document(source: DocumentOrText) -> BulletDocument:
+    """Accept either a parsed document or raw text."""
+    if isinstance(source, BulletDocument):
+        return source
+    return parse_document(source)
+
+
+@instrument("check_budget_allocation_table")
+def check_budget_allocation_table(source: DocumentOrText) -> ValidationResult:
     """
     G40-Stage1: Verify Budget Allocation Table is present.
     This is the Stage 1 checkpoint - must appear BEFORE bullets.
     """
-    # Look for common patterns indicating budget allocation table
-    patterns = [
-        r"Budget Allocation Table",
-        r"Position\s*\|.*Recency",
-        r"Position\s*\|.*Bullets",
-        r"\|\s*Position\s*\|.*\|.*Est.*Words",
-    ]
-
-    found = any(re.search(p, text, re.IGNORECASE) for p in patterns)
+    doc = _as_document(source)
+    found = doc.budget_table_line > 0
+    first_bullet_line = doc.bullets[0].line_no if doc.bullets else 0
+
+    if not found:
+        passed, details = False, "NOT FOUND - Stage 1 checkpoint missing"
+    elif first_bullet_line and first_bullet_line < doc.budget_table_line:
+        passed = False
+        details = (f"Found at line {doc.budget_table_line}, AFTER first bullet at line "
+                   f"{first_bullet_line} - Stage 1 checkpoint must precede bullets")
+    else:
+        passed, details = True, f"Found (line {doc.budget_table_line})"
 
     return ValidationResult(
         guardrail="G40-Stage1",
         description="Budget Allocation Table present",
-        passed=found,
-        details="Found" if found else "NOT FOUND - Stage 1 checkpoint missing"
+        passed=passed,
+        details=details
     )
 
 
-def check_final_reconciliation_table(text: str) -> ValidationResult:
+@instrument("check_final_reconciliation_table")
+def check_final_reconciliation_table(source: DocumentOrText) -> ValidationResult:
     """
     G40-Stage3: Verify Final Reconciliation Table is present.
     This is the Stage 3 checkpoint - must appear AFTER bullets.
     """
-    patterns = [
-        r"Final Reconciliation",
-        r"Reconciliation Table",
-        r"Guardrail Health Check",
-        r"\|\s*Requirement\s*\|.*Actual",
-        r"\|\s*Check\s*\|.*Value\s*\|.*Pass",
-    ]
-
-    found = any(re.search(p, text, re.IGNORECASE) for p in patterns)
+    doc = _as_document(source)
+    found = doc.reconciliation_table_line > 0
 
     return ValidationResult(
         guardrail="G40-Stage3",
         description="Final Reconciliation Table present",
         passed=found,
-        details="Found" if found else "NOT FOUND - Stage 3 checkpoint missing"
+        details=f"Found (line {doc.reconciliation_table_line})" if found else "NOT FOUND - Stage 3 checkpoint missing"
     )
 
 
-def extract_positions(text: str) -> List[int]:
+def extract_positions(source: DocumentOrText) -> List[int]:
     """
     Extract position numbers mentioned in the output.
     Returns list of position IDs found.
     """
-    # Look for various position header patterns
-    patterns = [
-        r"Position\s+(\d+)",
-        r"P(\d+)\s*[-:]",
-        r"Position\s*#?(\d+)",
-        r"\*\*Position\s+(\d+)",
-    ]
-
-    positions = set()
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        positions.update(int(m) for m in matches)
+    return _as_document(source).position_ids
 
-    return sorted(list(positions))
 
-
-def check_position_count(text: str, expected_min: int = 5) -> ValidationResult:
+@instrument("check_position_count")
+def check_position_count(source: DocumentOrText, expected_min: int = 5) -> ValidationResult:
     """
     G12: Verify minimum number of positions are included.
     Default expects at least 5 positions (adjustable based on recency thresholds).
     """
-    positions = extract_positions(text)
+    positions = extract_positions(source)
     passed = len(positions) >= expected_min
 
     return ValidationResult(
@@ -146,12 +482,15 @@ def check_position_count(text: str, expected_min: int = 5) -> ValidationResult:
     )
 
 
-def check_chronological_order(text: str) -> ValidationResult:
+@instrument("check_chronological_order")
+def check_chronological_order(source: DocumentOrText) -> ValidationResult:
     """
     G12: Verify positions appear in chronological order (0, 1, 2, 3...).
     Position 0 should be first (most recent), increasing order thereafter.
+    Order is taken from the first mention of each position in the output.
     """
-    positions = extract_positions(text)
+    doc = _as_document(source)
+    positions = [p.position_id for p in doc.positions]
 
     if not positions:
         return ValidationResult(
@@ -164,85 +503,56 @@ def check_chronological_order(text: str) -> ValidationResult:
     # Check if sorted in ascending order (Position 0 first, then 1, 2, 3...)
     is_sorted = positions == sorted(positions)
 
+    details = f"Order: {positions}"
+    if is_sorted:
+        details += " (correct)"
+    else:
+        first_bad = next(
+            cur for prev, cur in zip(doc.positions, doc.positions[1:])
+            if cur.position_id < prev.position_id
+        )
+        details += (f" (WRONG - should be ascending; Position {first_bad.position_id}"
+                    f" out of order at line {first_bad.line_no})")
+
     return ValidationResult(
         guardrail="G12",
         description="Positions in chronological order",
         passed=is_sorted,
-        details=f"Order: {positions}" + (" (correct)" if is_sorted else " (WRONG - should be ascending)")
+        details=details
     )
 
 
-def extract_bullets(text: str) -> List[Tuple[int, str]]:
+def extract_bullets(source: DocumentOrText) -> List[Tuple[int, str]]:
     """
     Extract bullet points from text.
     Returns list of (position_id, bullet_text) tuples.
     """
-    bullets = []
-    current_position = -1
-
-    lines = text.split('\n')
-    for line in lines:
-        # Check for position header
-        pos_match = re.search(r'Position\s+(\d+)', line, re.IGNORECASE)
-        if pos_match:
-            current_position = int(pos_match.group(1))
-            continue
-
-        # Check for bullet point
-        bullet_match = re.match(r'^[\s]*[•\-\*]\s*(.+)$', line)
-        if bullet_match and current_position >= 0:
-            bullet_text = bullet_match.group(1).strip()
-            if len(bullet_text) > 20:  # Filter out short non-bullets
-                bullets.append((current_position, bullet_text))
-
-    return bullets
+    return [(b.position_id, b.text) for b in _as_document(source).bullets]
 
 
-def check_bullet_character_limits(text: str, min_chars: int = 100, max_chars: int = 210) -> ValidationResult:
+@instrument("check_bullet_character_limits")
+def check_bullet_character_limits(source: DocumentOrText, min_chars: int = 100, max_chars: int = 210) -> ValidationResult:
     """
     G24: Verify each bullet is within character limits (100-210 chars).
     """
-    bullets = extract_bullets(text)
-
-    if not bullets:
-        return ValidationResult(
-            guardrail="G24",
-            description=f"Bullet character limits ({min_chars}-{max_chars})",
-            passed=False,
-            details="No bullets found to validate"
-        )
-
-    violations = []
-    for pos_id, bullet in bullets:
-        char_count = len(bullet)
-        if char_count < min_chars or char_count > max_chars:
-            violations.append(f"Position {pos_id}: {char_count} chars")
-
-    passed = len(violations) == 0
+    from guardrail_rules import RuleSet, character_limits_rule
 
-    return ValidationResult(
-        guardrail="G24",
-        description=f"Bullet character limits ({min_chars}-{max_chars})",
-        passed=passed,
-        details=f"{len(bullets)} bullets checked" if passed else f"VIOLATIONS: {violations}"
-    )
+    return _run_rules(source, RuleSet([character_limits_rule(min_chars, max_chars)]))[0]
 
 
-def estimate_word_count(text: str) -> int:
+def estimate_word_count(source: DocumentOrText) -> int:
     """
     Estimate word count of bullet content (excluding headers and tables).
     """
-    # Extract just the bullet text
-    bullets = extract_bullets(text)
-    all_bullet_text = ' '.join(bullet for _, bullet in bullets)
-    return len(all_bullet_text.split())
+    return _as_document(source).word_count
 
 
-def check_word_count(text: str, min_words: int = 350, max_words: int = 500) -> ValidationResult:
+@instrument("check_word_count")
+def check_word_count(source: DocumentOrText, min_words: int = 350, max_words: int = 500) -> ValidationResult:
     """
     G8: Verify total word count is within budget (350-500 words).
     """
-    word_count = estimate_word_count(text)
+    word_count = estimate_word_count(source)
     passed = min_words <= word_count <= max_words
 
     return ValidationResult(
@@ -253,22 +563,13 @@ def check_word_count(text: str, min_words: int = 350, max_words: int = 500) -> V
     )
 
 
-def check_per_bullet_gates(text: str) -> ValidationResult:
+@instrument("check_per_bullet_gates")
+def check_per_bullet_gates(source: DocumentOrText) -> ValidationResult:
     """
     G40-Stage2: Check if per-bullet validation gates are visible.
     Look for evidence of Stage 2 checkpoint execution.
     """
-    patterns = [
-        r"Character\s*Count.*\d+",
-        r"char[s]?.*\d+",
-        r"\d+\s*chars",
-        r"Verb\s*Category",
-        r"\[Built\]|\[Lead\]|\[Managed\]|\[Improved\]|\[Collaborate\]",
-        r"Stage 2",
-        r"Per-Bullet",
-    ]
-
-    evidence_count = sum(1 for p in patterns if re.search(p, text, re.IGNORECASE))
+    evidence_count = len(_as_document(source).per_bullet_gate_indicators)
     passed = evidence_count >= 2  # Require at least 2 types of evidence
 
     return ValidationResult(
@@ -279,65 +580,106 @@ def check_per_bullet_gates(text: str) -> ValidationResult:
     )
 
 
-def check_verb_diversity(text: str, min_categories: int = 3) -> ValidationResult:
+@instrument("check_verb_diversity")
+def check_verb_diversity(source: DocumentOrText, min_categories: int = 3) -> ValidationResult:
     """
     G9: Check for verb category diversity across bullets.
     Should use at least 3 different verb categories.
+    Verbs are classified with the compiled index built from
+    core/verb-categories.md; the per-category distribution is reported,
+    with categories under 5% of bullets flagged per G37.
     """
-    verb_categories = {
-        'Built': ['built', 'created', 'developed', 'designed', 'engineered', 'architected', 'constructed', 'established', 'pioneered'],
-        'Lead': ['led', 'directed', 'managed', 'oversaw', 'supervised', 'coordinated', 'guided', 'mentored', 'spearheaded'],
-        'Managed': ['managed', 'administered', 'operated', 'maintained', 'organized', 'facilitated', 'executed', 'conducted'],
-        'Improved': ['improved', 'enhanced', 'optimized', 'streamlined', 'accelerated', 'reduced', 'increased', 'transformed'],
-        'Collaborate': ['collaborated', 'partnered', 'worked', 'supported', 'assisted', 'contributed', 'aligned', 'interfaced'],
-    }
-
-    bullets = extract_bullets(text)
-    categories_used = set()
-
-    for _, bullet in bullets:
-        bullet_lower = bullet.lower()
-        first_word = bullet_lower.split()[0] if bullet_lower.split() else ""
-
-        for category, verbs in verb_categories.items():
-            if any(verb in first_word for verb in verbs):
-                categories_used.add(category)
-
-    passed = len(categories_used) >= min_categories
-
-    return ValidationResult(
-        guardrail="G9",
-        description=f"Verb diversity (min {min_categories} categories)",
-        passed=passed,
-        details=f"Categories used: {list(categories_used)}" + (" (sufficient)" if passed else " (INSUFFICIENT)")
-    )
-
-
-def validate_output(text: str) -> List[ValidationResult]:
+    from guardrail_rules import RuleSet, verb_diversity_rule
+
+    return _run_rules(source, RuleSet([verb_diversity_rule(min_categories)]))[0]
+
+
+def _run_rules(source: DocumentOrText, rules=None, history=None,
+               timings: Optional[Dict[str, float]] = None, content_rules: bool = False) -> List[ValidationResult]:
+    """Per-bullet guardrails from the rule engine (guardrail_rules.py), in one pass over the bullets."""
+    from guardrail_rules import run_rules
+
+    return [ValidationResult(*result)
+            for result in run_rules(_as_document(source), history, rules=rules, timings=timings,
+                                    content_rules=content_rules)]
+
+
+# Parse cache namespace for results, and the files the results depend on
+CACHE_TOOL = "validate_output"
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.dirname(_SCRIPTS_DIR)
+RESULT_SOURCES = (
+    os.path.abspath(__file__),
+    *(os.path.join(_SCRIPTS_DIR, name) for name in (
+        "guardrail_rules.py", "verb_index.py", "lazy_re.py",
+        # --source: the job history model and the template it is compiled from
+        "job_history_model.py", "job_history_scanner.py", "job_history_schema.py",
+    )),
+    os.path.join(_REPO_ROOT, "templates", "job_history_template.xml"),
+    os.path.join(_REPO_ROOT, "core", "verb-categories.md"),
+    os.path.join(_REPO_ROOT, "core", "format-rules.md"),
+)
+
+
+@instrument("validate_output")
+def validate_output(text: str, platform: Optional[str] = None, use_cache: bool = False,
+                    history=None, timings: Optional[Dict[str, float]] = None,
+                    content_rules: bool = False) -> List[ValidationResult]:
     """
     Run all validation checks on the provided text.
+    The text is parsed once; every check reads the shared document model,
+    and the per-bullet guardrails run in a single pass of the rule engine.
+    Pass/fail counts are recorded in the metrics registry under `platform`
+    (default: OPTIMIZE_PLATFORM).
+    use_cache: return the results stored in the parse cache for this exact
+               (sanitized) text, and store them otherwise.
+    history: the JobHistory the bullets were generated from; enables the
+             source checks (G1, G5, G29).
+    timings: dict to add seconds per rule to (bypasses the cache).
+    content_rules: also run the content checks (G11, G14, G15, G20, G22,
+                   G35, G37).
     Returns list of ValidationResult objects.
     """
+    use_cache = use_cache and timings is None
+    if use_cache:
+        from parse_cache import get_cache, source_version, text_digest
+
+        version, digest = source_version(RESULT_SOURCES), text_digest(text)
+        if history is not None:
+            from guardrail_rules import source_fingerprint
+            digest = text_digest(f"{digest}\0{source_fingerprint(history)}")
+        if content_rules:
+            digest = text_digest(f"{digest}\0content-rules")
+        cached = get_cache().get(CACHE_TOOL, version, digest)
+        if cached is not None:
+            results = [ValidationResult(*result) for result in cached]
+            record_guardrail_results(results, platform)
+            return results
+
+    doc = parse_document(text)
     results = []
 
     # Stage 1 checkpoint
-    results.append(check_budget_allocation_table(text))
+    results.append(check_budget_allocation_table(doc))
 
     # Position coverage and order
-    results.append(check_position_count(text))
-    results.append(check_chronological_order(text))
+    results.append(check_position_count(doc))
+    results.append(check_chronological_order(doc))
 
-    # Stage 2 checkpoints
-    results.append(check_per_bullet_gates(text))
-    results.append(check_bullet_character_limits(text))
-    results.append(check_verb_diversity(text))
+    # Stage 2 checkpoints; per-bullet guardrails (G24, G9, ...) from the rule engine
+    results.append(check_per_bullet_gates(doc))
+    results.extend(_run_rules(doc, history=history, timings=timings, content_rules=content_rules))
 
     # Word count budget
-    results.append(check_word_count(text))
+    results.append(check_word_count(doc))
 
     # Stage 3 checkpoint
-    results.append(check_final_reconciliation_table(text))
+    results.append(check_final_reconciliation_table(doc))
 
+    if use_cache:
+        get_cache().put(CACHE_TOOL, version, digest,
+                        [(r.guardrail, r.description, r.passed, r.details) for r in results])
+    record_guardrail_results(results, platform)
     return results
 
 
@@ -357,45 +699,20 @@ def convert_results_to_json(results: List[ValidationResult]) -> List[Dict]:
     ]
 
 
-def log_compliance(results_json: List[Dict], platform: str = "unknown"):
+def log_compliance(results_json: List[Dict], platform: str = "unknown", model: Optional[str] = None):
     """
     Layer 5: Compliance Tracking & Observability
     Logs per-guardrail Pass/Fail status to detect enforcement drift over time.
+    Entries go to the append-only store in compliance_tracker.py; drift
+    alerts raised by the run are printed after the summary line.
     """
-    from datetime import datetime
-
-    log_file = "docs/governance/compliance_logs.json"
+    from compliance_tracker import get_store, record_compliance
 
-    log_entry = {
-        "timestamp": datetime.isoformat(datetime.now()),
-        "platform": platform,
-        "results": results_json,
-        "summary": {
-            "total": len(results_json),
-            "passed": sum(1 for r in results_json if r["passed"]),
-            "rate": round(sum(1 for r in results_json if r["passed"]) / len(results_json) * 100, 2) if results_json else 0
-        }
-    }
-
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
-
-    # Load existing logs
-    data = []
-    if os.path.exists(log_file):
-        try:
-            with open(log_file, 'r') as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            pass
-
-    data.append(log_entry)
-
-    # Write back
-    with open(log_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    entry, alerts = record_compliance(results_json, platform, model)
 
-    print(f"  Compliance logged: {log_entry['summary']['rate']}% pass rate to docs/governance/compliance_logs.json")
+    print(f"  Compliance logged: {entry['summary']['rate']}% pass rate to {get_store().directory}/")
+    for alert in alerts:
+        print(f"  {alert}")
 
 
 def print_results(results: List[ValidationResult]) -> bool:
@@ -433,11 +750,308 @@ def print_results(results: List[ValidationResult]) -> bool:
     return all_passed
 
 
+# ---------------------------------------------------------------------------
+# Batch mode
+#
+# Validates many output files in one interpreter: inputs are fanned out to a
+# process pool in chunks, with a bounded number of chunks in flight so memory
+# stays flat regardless of batch size. Workers return compact per-file
+# summaries; only the aggregate is kept in the parent.
+# ---------------------------------------------------------------------------
+
+BATCH_CHUNK_SIZE = 16
+BATCH_MAX_IN_FLIGHT_PER_WORKER = 2
+
+
+def collect_batch_inputs(targets: List[str], pattern: str = "*.txt") -> List[str]:
+    """
+    Expand batch targets into a sorted, de-duplicated list of files.
+    A target may be a directory (searched recursively for `pattern`),
+    a glob, a manifest file prefixed with '@' (one path per line,
+    '#' comments allowed), or a plain file path.
+    """
+    import glob
+    from pathlib import Path
+
+    paths = set()
+    for target in targets:
+        if target.startswith('@'):
+            manifest = Path(target[1:])
+            with open(manifest, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        entry = Path(line)
+                        if not entry.is_absolute():
+                            entry = manifest.parent / entry
+                        paths.add(str(entry))
+        elif os.path.isdir(target):
+            paths.update(str(p) for p in Path(target).rglob(pattern) if p.is_file())
+        elif glob.has_magic(target):
+            paths.update(p for p in glob.glob(target, recursive=True) if os.path.isfile(p))
+        else:
+            paths.add(target)
+
+    return sorted(paths)
+
+
+def _validate_file(path: str, use_cache: bool = True, history=None, content_rules: bool = False) -> Dict:
+    """Validate a single file and return a compact, picklable summary."""
+    import time
+
+    start = time.perf_counter()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return {"file": path, "error": f"Error reading file: {e}", "seconds": 0.0}
+
+    if not text.strip():
+        return {"file": path, "error": "Empty input", "seconds": 0.0}
+
+    results = validate_output(sanitize_input(text), use_cache=use_cache, history=history,
+                              content_rules=content_rules)
+    return {
+        "file": path,
+        "passed": all(r.passed for r in results),
+        "failed": [f"{r.guardrail} {r.description}" for r in results if not r.passed],
+        "checks": [(r.guardrail, r.description, r.passed) for r in results],
+        "bytes": len(text.encode('utf-8')),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _validate_chunk(paths: List[str], use_cache: bool = True, history=None,
+                    content_rules: bool = False) -> Tuple[List[Dict], Dict]:
+    """
+    Process pool task: validate a chunk of files. Also returns the metrics
+    recorded for the chunk so the parent can merge them into its registry.
+    """
+    summaries = [_validate_file(path, use_cache, history, content_rules) for path in paths]
+    return summaries, REGISTRY.snapshot(reset=True)
+
+
+def validate_batch(paths: List[str], workers: int = None, chunk_size: int = BATCH_CHUNK_SIZE,
+                   slowest: int = 10, use_cache: bool = True, history=None, content_rules: bool = False) -> Dict:
+    """
+    Validate many files across a process pool and aggregate the results.
+    Returns a report dict with per-file status, per-guardrail failure
+    counts and the slowest files. Per-file rows are sorted by path so the
+    report is deterministic regardless of completion order. With use_cache,
+    files validated before take their results from the parse cache. history
+    (a JobHistory) is the source every file is checked against;
+    content_rules adds the content checks for every file.
+    """
+    import heapq
+    import time
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    workers = workers or os.cpu_count() or 1
+    chunks = (paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size))
+    max_in_flight = workers * BATCH_MAX_IN_FLIGHT_PER_WORKER
+
+    files = []
+    guardrail_totals = {}
+    slowest_heap = []
+    start = time.perf_counter()
+
+    def absorb(summary: Dict):
+        files.append({k: summary[k] for k in ("file", "passed", "failed", "error", "seconds") if k in summary})
+        for guardrail, description, passed in summary.get("checks", []):
+            counts = guardrail_totals.setdefault((guardrail, description), [0, 0])
+            counts[0] += 1
+            counts[1] += 0 if passed else 1
+        entry = (summary["seconds"], summary["file"])
+        if len(slowest_heap) < slowest:
+            heapq.heappush(slowest_heap, entry)
+        elif slowest:
+            heapq.heappushpop(slowest_heap, entry)
+
+    def absorb_chunk(summaries: List[Dict], metrics: Dict):
+        for summary in summaries:
+            absorb(summary)
+        REGISTRY.merge(metrics)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = set()
+        for chunk in chunks:
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    absorb_chunk(*future.result())
+            in_flight.add(pool.submit(_validate_chunk, chunk, use_cache, history, content_rules))
+        for future in in_flight:
+            absorb_chunk(*future.result())
+
+    files.sort(key=lambda f: f["file"])
+    guardrails = [
+        {"guardrail": g, "description": d, "checked": total, "failed": failed}
+        for (g, d), (total, failed) in sorted(guardrail_totals.items())
+    ]
+
+    return {
+        "files": files,
+        "guardrails": guardrails,
+        "slowest": [{"file": f, "seconds": round(s, 6)} for s, f in sorted(slowest_heap, reverse=True)],
+        "summary": {
+            "total": len(files),
+            "passed": sum(1 for f in files if f.get("passed")),
+            "failed": sum(1 for f in files if f.get("passed") is False),
+            "errors": sum(1 for f in files if "error" in f),
+            "seconds": round(time.perf_counter() - start, 3),
+        },
+    }
+
+
+def batch_exit_code(report: Dict) -> int:
+    """
+    Exit code for a batch run:
+        0 = every file passed
+        1 = at least one file failed validation
+        2 = at least one file could not be read (takes precedence)
+    """
+    summary = report["summary"]
+    if summary["errors"]:
+        return 2
+    return 1 if summary["failed"] else 0
+
+
+def batch_compliance_results(report: Dict) -> List[Dict]:
+    """Collapse a batch report into one compliance entry's results list."""
+    return [
+        {
+            "guardrail": g["guardrail"],
+            "passed": g["failed"] == 0,
+            "description": g["description"],
+            "details": f"{g['failed']}/{g['checked']} files failed"
+        }
+        for g in report["guardrails"]
+    ]
+
+
+def print_batch_report(report: Dict):
+    """Print a batch summary: failing files, guardrail failures, slowest files."""
+    summary = report["summary"]
+
+    print("\n" + "=" * 70)
+    print("BULLET GENERATION BATCH VALIDATION REPORT")
+    print("=" * 70)
+
+    failing = [f for f in report["files"] if not f.get("passed")]
+    if failing:
+        print(f"\nFAILING FILES ({len(failing)}):")
+        for f in failing:
+            reason = f.get("error") or ", ".join(f["failed"])
+            print(f"  ❌ {f['file']}: {reason}")
+
+    print("\nGUARDRAIL FAILURES:")
+    for g in report["guardrails"]:
+        print(f"  [{g['guardrail']}] {g['description']}: {g['failed']}/{g['checked']} failed")
+
+    if report["slowest"]:
+        print("\nSLOWEST FILES:")
+        for s in report["slowest"]:
+            print(f"  {s['seconds'] * 1000:.1f} ms  {s['file']}")
+
+    print("\n" + "=" * 70)
+    print(f"FILES: {summary['total']}  PASSED: {summary['passed']}  "
+          f"FAILED: {summary['failed']}  ERRORS: {summary['errors']}  "
+          f"({summary['seconds']}s)")
+    print("=" * 70 + "\n")
+
+
+def load_source(path: Optional[str]):
+    """The JobHistory model of --source (None without one)."""
+    if not path:
+        return None
+    from job_history_model import load_job_history
+
+    try:
+        return load_job_history(path)
+    except OSError as e:
+        print(f"Error reading source: {e}")
+        sys.exit(2)
+
+
+def print_rule_timings(timings: Dict[str, float]):
+    """Per-rule time of the rule engine, slowest first."""
+    total = sum(timings.values()) or 1.0
+    print("RULE TIMINGS:")
+    for label, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"  {label:<8} {seconds * 1000:8.3f} ms  {seconds / total * 100:5.1f}%")
+    print()
+
+
+def run_batch(args) -> int:
+    """Batch entry point: validate, report, log compliance once."""
+    import json
+
+    paths = collect_batch_inputs(args.batch, pattern=args.pattern)
+    if not paths:
+        print("Error: No input files matched")
+        return 2
+
+    report = validate_batch(paths, workers=args.workers, slowest=args.slowest, use_cache=not args.no_cache,
+                            history=load_source(args.source), content_rules=args.content_rules)
+    print_batch_report(report)
+
+    if args.report:
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"  Batch report written to {args.report}")
+
+    # Auto-invoke compliance tracker (Layer 5) - one entry per batch
+    results_json = batch_compliance_results(report)
+    if results_json:
+        platform = os.getenv("OPTIMIZE_PLATFORM", "unknown")
+        log_compliance(results_json, platform=platform, model=os.getenv("OPTIMIZE_MODEL"))
+
+    return batch_exit_code(report)
+
+
+def parse_args(argv: List[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Validate LLM-generated bullet output against project guardrails."
+    )
+    parser.add_argument("input_file", nargs="?", help="Output file to validate (default: stdin)")
+    parser.add_argument("--batch", nargs="+", metavar="TARGET",
+                        help="Directories, globs, files or @manifest files to validate in one run")
+    parser.add_argument("--pattern", default="*.txt",
+                        help="File pattern used when a batch target is a directory (default: *.txt)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for batch mode (default: CPU count)")
+    parser.add_argument("--report", help="Write the aggregated batch report as JSON to this path")
+    parser.add_argument("--slowest", type=int, default=10,
+                        help="Number of slowest files to list in the batch report (default: 10)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Validate even if this exact output was validated before")
+    parser.add_argument("--source", metavar="JOB_HISTORY",
+                        help="Job history .txt the bullets were generated from (enables G1, G5, G29)")
+    parser.add_argument("--content-rules", action="store_true",
+                        help="Also check G11, G14, G15, G20, G22, G35 and the advisory G37")
+    parser.add_argument("--rule-timings", action="store_true",
+                        help="Print the time spent in each guardrail rule (validates without the cache)")
+    parser.add_argument("--metrics-file", default=os.getenv("OMR_METRICS_FILE"),
+                        help="Write OpenMetrics latency/guardrail metrics to this textfile "
+                             "(default: $OMR_METRICS_FILE)")
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point."""
+    args = parse_args()
+
+    if args.batch:
+        exit_code = run_batch(args)
+        write_metrics_file(args.metrics_file)
+        sys.exit(exit_code)
+
     # Read input from file or stdin
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
+    if args.input_file:
+        input_file = args.input_file
         try:
             with open(input_file, 'r', encoding='utf-8') as f:
                 text = f.read()
@@ -461,15 +1075,20 @@ def main():
     text = sanitize_input(text)
 
     # Run validation
-    results = validate_output(text)
+    timings = {} if args.rule_timings else None
+    results = validate_output(text, use_cache=not args.no_cache, history=load_source(args.source), timings=timings,
+                              content_rules=args.content_rules)
 
     # Print results
     all_passed = print_results(results)
+    if timings is not None:
+        print_rule_timings(timings)
 
     # Auto-invoke compliance tracker (Layer 5)
     results_json = convert_results_to_json(results)
     platform = os.getenv("OPTIMIZE_PLATFORM", "unknown")
-    log_compliance(results_json, platform=platform)
+    log_compliance(results_json, platform=platform, model=os.getenv("OPTIMIZE_MODEL"))
+    write_metrics_file(args.metrics_file)
 
     sys.exit(0 if all_passed else 1)
 
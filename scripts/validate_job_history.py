@@ -8,166 +8,322 @@ Checks for:
 - Complete sections
 - Consistent structure across positions
 
+The file is tokenized once (job_history_scanner.py); every check queries the
+resulting section tree, and nesting errors report line and column. Required
+and optional sections, attributes and ordering come from the schema compiled
+from templates/job_history_template.xml (job_history_schema.py).
+
+While checking, the sections are parsed into the job history model shared
+with convert_job_history_to_md.py (job_history_model.py); the CLI caches it
+so a conversion right after validation loads it instead of re-parsing. The
+report itself is cached too (parse_cache.py), keyed by the file's hash and
+the validator, schema and template sources, so validating an unchanged file
+again only hashes it.
+
+Large files (MMAP_THRESHOLD and up, or --mmap) are memory-mapped and checked
+as bytes, one section at a time: each section is validated as soon as its
+closing tag is scanned and then discarded, and only the slices needed for
+checks and reports are decoded. --follow validates a file that is still
+being written, finishing once it stops growing.
+
 Usage:
     python validate_job_history.py <job_history_file.txt>
+    python validate_job_history.py <archive.txt> --mmap
+    python validate_job_history.py <archive.txt> --follow [--idle-timeout 5]
+    python validate_job_history.py <job_history_file.txt> --no-cache
+    OMR_METRICS_FILE=metrics/omr.prom python validate_job_history.py <file>
 """
 
+import argparse
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
+from typing import Optional
+
+from job_history_model import GLOBAL_SECTIONS, HistoryBuilder, position_from_element, save_cached, source_digest
+from job_history_scanner import TreeBuilder, follow_sections, scan
+from job_history_schema import ERROR, TEMPLATE_FILE, check_element, load_schema
+from parse_cache import get_cache, source_version
+from validator_metrics import instrument, record_job_history_result, write_metrics_file
+
+# Files at least this large are memory-mapped instead of read into a str
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# Parse cache namespace for reports, and the files a report depends on
+CACHE_TOOL = "validate_job_history"
+REPORT_SOURCES = tuple(Path(__file__).resolve().parent / name for name in (
+    "validate_job_history.py", "job_history_schema.py", "job_history_scanner.py", "job_history_model.py",
+    "lazy_re.py",
+)) + (TEMPLATE_FILE,)
 
 
 class JobHistoryValidator:
     """Validates job history XML structure."""
 
-    REQUIRED_GLOBAL_SECTIONS = [
-        'education',
-        'certifications',
-        'master_skills_inventory'
-    ]
-
-    REQUIRED_POSITION_SECTIONS = [
-        'metadata',
-        'professional_summary',
-        'core_responsibilities',
-        'key_achievements',
-        'hard_skills_demonstrated',
-        'impact_metrics'
-    ]
-
-    OPTIONAL_POSITION_SECTIONS = [
-        'soft_skills_demonstrated',
-        'tools_technologies',
-        'industry_domain',
-        'methodology',
-        'strategic_decisions',
-        'team_scope',
-        'honest_limitations'
-    ]
-
-    def __init__(self, file_path):
+    def __init__(self, file_path, content=None, schema=None, use_mmap=None):
+        """
+        file_path: path of the job history file (used for reporting).
+        content: already-loaded file text; when given, the file is not read.
+        schema: compiled ElementSpec (default: templates/job_history_template.xml).
+        use_mmap: map the file instead of reading it (default: files of
+                  MMAP_THRESHOLD bytes or more).
+        The file and the default schema are only loaded when the checks
+        run, so a report served from the parse cache reads neither.
+        """
         self.file_path = file_path
-        with open(file_path, 'r', encoding='utf-8') as f:
-            self.content = f.read()
+        self.default_schema = schema is None
+        self._schema = schema
+        self._content = content
+        self._use_mmap = use_mmap
+        self.tree = None
+        self.model = None
         self.errors = []
         self.warnings = []
         self.info = []
-
-    def validate(self):
-        """Run all validation checks."""
-        print(f"\n🔍 Validating: {self.file_path}\n")
-
-        self.check_header()
-        self.check_version_history()
+        self._sections_found = set()
+        self._position_count = 0
+        self._last_top_level = -1
+        self._header_checked = False
+
+    @property
+    def schema(self):
+        if self._schema is None:
+            self._schema = load_schema()
+        return self._schema
+
+    @property
+    def content(self):
+        if self._content is None:
+            use_mmap = self._use_mmap
+            if use_mmap is None:
+                use_mmap = os.path.getsize(self.file_path) >= MMAP_THRESHOLD
+            if use_mmap:
+                self._content = _map_file(self.file_path)
+            else:
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    self._content = f.read()
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        self._content = value
+
+    @instrument("JobHistoryValidator.validate", size=lambda args, kwargs: _loaded_size(args[0]))
+    def validate(self, verbose=True, platform=None, follow=False, idle_timeout=5.0, digest=None):
+        """
+        Run all validation checks. verbose=False skips the printed report.
+        The file is tokenized once and each section is checked as soon as it
+        is complete. str content keeps the full section tree in self.tree;
+        mapped content is streamed and finished sections are discarded.
+        follow=True reads the file while it is still being written.
+        digest: the content's source_digest(); when given, the report comes
+        from the parse cache if this content was validated before (with the
+        default schema), and is stored there otherwise.
+        The outcome is counted in the metrics registry under `platform`.
+        """
+        if verbose:
+            print(f"\n🔍 Validating: {self.file_path}\n")
+
+        cacheable = digest is not None and not follow and self.default_schema
+        version = source_version(REPORT_SOURCES) if cacheable else None
+        report = get_cache().get(CACHE_TOOL, version, digest) if cacheable else None
+        if report is not None:
+            self.errors, self.warnings, self.info = (list(messages) for messages in report)
+        else:
+            self.run_checks(follow, idle_timeout)
+            if cacheable:
+                get_cache().put(CACHE_TOOL, version, digest, (self.errors, self.warnings, self.info))
+
+        if verbose:
+            self.print_results()
+
+        passed = len(self.errors) == 0
+        record_job_history_result(passed, platform)
+        return passed
+
+    def run_checks(self, follow=False, idle_timeout=5.0):
+        """Tokenize the content and run every check, filling errors, warnings and info."""
+        sections = set(self.schema.child_index) | set(GLOBAL_SECTIONS)
+        if follow:
+            for builder, element in follow_sections(self.file_path, sections, idle_timeout=idle_timeout):
+                self.tree = builder.tree
+                self.check_section(element)
+            self.content = self.tree.source if self.tree else b""
+        else:
+            builder = TreeBuilder(self.content, sections=sections, detach=not isinstance(self.content, str))
+            self.tree = builder.tree
+            for element in builder.feed():
+                self.check_section(element)
+            for element in builder.finish():
+                self.check_section(element)
+        if self.tree is None:
+            self.tree = scan(self.content)
+
+        if not self._header_checked:
+            self.check_header()
+            self.check_version_history()
         self.check_global_sections()
         self.check_positions()
         self.check_xml_balance()
 
-        self.print_results()
+    def _tree(self):
+        if self.tree is None:
+            self.tree = scan(self.content)
+        return self.tree
+
+    def _model(self):
+        """HistoryBuilder fed by check_section; positions are kept only for str content."""
+        if self.model is None:
+            self.model = HistoryBuilder(self._tree(), retain=isinstance(self.content, str))
+        return self.model
+
+    @property
+    def history(self):
+        """The parsed JobHistory after validate() on str content (None when streamed)."""
+        if self.model is None or not self.model.retain:
+            return None
+        return self.model.finish(self.content)
+
+    def check_section(self, element):
+        """
+        Check one completed section: a top-level element, or a global
+        section / position found at any depth.
+        """
+        tree = self._tree()
+        if not self._header_checked and tree.first_start is not None:
+            # The preamble is complete once the first top-level element opens
+            self._header_checked = True
+            self.check_header()
+            self.check_version_history()
+
+        position = self._model().add(element)
+        if element.parent is tree.root:
+            self.check_top_level_order(element)
+        self.check_section_content(element, position)
+
+    def check_top_level_order(self, element):
+        """Top-level elements must be template sections, in template order."""
+        tree = self._tree()
+        index = self.schema.child_index.get(element.name)
+        if index is None:
+            self.warnings.append(f"Unexpected top-level <{element.name}> ({tree.location(element.start)})")
+        elif index < self._last_top_level:
+            self.warnings.append(
+                f"Top-level <{element.name}> ({tree.location(element.start)}) is out of template order "
+                f"(should come before <{self.schema.children[self._last_top_level].name}>)")
+        else:
+            self._last_top_level = index
+
+    def check_section_content(self, element, position=None):
+        """
+        Schema checks for one global section or position (independent of its
+        neighbours). position: the element's model Position, if already built.
+        """
+        tree = self._tree()
+        index = self.schema.child_index.get(element.name)
+        if index is None:
+            return
 
-        return len(self.errors) == 0
+        spec = self.schema.children[index]
+        if spec.repeatable:
+            self._position_count += 1
+            self.validate_position(element.attrs.get('id') or '?', element, position)
+        elif element.closed:
+            if element.name not in self._sections_found:
+                self._sections_found.add(element.name)
+                self.info.append(f"✓ Section '{element.name}' found")
+            check_element(tree, element, spec, lambda: f"Section '{element.name}' ({tree.location(element.start)})",
+                          self._report)
 
     def check_header(self):
-        """Validate file header format."""
-        if not re.search(r'COMPREHENSIVE JOB HISTORY SUMMARIES - VERSION', self.content):
+        """Validate file header format (text before the first section)."""
+        history = self._model().header()
+
+        if history.version is None:
             self.errors.append("Missing header: 'COMPREHENSIVE JOB HISTORY SUMMARIES - VERSION'")
         else:
             self.info.append("✓ Header found")
 
-        if not re.search(r'Format: v\d+\.\d+ Schema', self.content):
+        if not re.match(r'v\d+\.\d+ Schema', history.format or ''):
             self.warnings.append("Missing 'Format: vX.X Schema' line")
 
-        if not re.search(r'Last Updated:', self.content):
+        if history.last_updated is None:
             self.warnings.append("Missing 'Last Updated:' line")
 
-        if not re.search(r'Total Jobs:', self.content):
+        if history.total_jobs is None:
             self.warnings.append("Missing 'Total Jobs:' line")
 
     def check_version_history(self):
         """Validate version history section."""
-        if not re.search(r'<!-- Version History:', self.content):
+        history = self._model().header().version_history
+        if history is None:
             self.errors.append("Missing version history comment block")
         else:
             self.info.append("✓ Version history found")
 
             # Check for version entries
-            version_entries = re.findall(r'v\d+\.\d+:', self.content)
+            version_entries = re.findall(r'v\d+\.\d+:', history)
             if version_entries:
                 self.info.append(f"✓ Found {len(version_entries)} version entries")
             else:
                 self.warnings.append("No version entries found in history")
 
+    def _report(self, severity, message):
+        (self.errors if severity == ERROR else self.warnings).append(message)
+
     def check_global_sections(self):
-        """Validate global profile sections."""
-        for section in self.REQUIRED_GLOBAL_SECTIONS:
-            if f'<{section}>' in self.content and f'</{section}>' in self.content:
-                self.info.append(f"✓ Section '{section}' found")
-            else:
-                self.errors.append(f"Missing required global section: '{section}'")
+        """Report required global sections that never appeared."""
+        for spec in self.schema.children:
+            if not spec.repeatable and spec.required and spec.name not in self._sections_found:
+                self.errors.append(f"Missing required global section: '{spec.name}'")
 
     def check_positions(self):
-        """Validate position structures."""
-        positions = re.findall(r'<position id="(\d+)">(.*?)</position>', self.content, re.DOTALL)
-
-        if not positions:
+        """Report the position count (each position is checked by check_section)."""
+        if not self._position_count:
             self.errors.append("No positions found")
             return
 
-        self.info.append(f"✓ Found {len(positions)} positions")
+        self.info.append(f"✓ Found {self._position_count} positions")
+
+    def validate_position(self, pos_id, content, model=None):
+        """
+        Validate a single position against the schema's <position> entry.
+        content: the position's Element in self.tree, or the raw text inside
+        its <position> tags (scanned on the fly; attributes are not checked).
+        model: its model Position (built from content if not given).
+        """
+        if isinstance(content, str):
+            tree = scan(content)
+            position = tree.root
+        else:
+            tree = self._tree()
+            position = content
+        spec = self.schema.child('position')
 
-        for pos_id, pos_content in positions:
-            self.validate_position(pos_id, pos_content)
+        def where():
+            return f"Position {pos_id} ({tree.location(position.start)})"
 
-    def validate_position(self, pos_id, content):
-        """Validate a single position structure."""
-        # Check required sections
-        for section in self.REQUIRED_POSITION_SECTIONS:
-            if f'<{section}>' in content and f'</{section}>' in content:
-                continue
-            else:
-                self.errors.append(f"Position {pos_id}: Missing required section '{section}'")
-
-        # Check metadata completeness
-        if '<metadata>' in content:
-            metadata = re.search(r'<metadata>(.*?)</metadata>', content, re.DOTALL)
-            if metadata:
-                meta_content = metadata.group(1)
-                required_meta = ['job_title', 'company', 'dates', 'duration']
-                for field in required_meta:
-                    if f'<{field}>' not in meta_content:
-                        self.warnings.append(f"Position {pos_id}: Missing metadata field '{field}'")
+        check_element(tree, position, spec, where, self._report, severity=ERROR)
 
         # Check for professional summary length
-        summary = re.search(r'<professional_summary>(.*?)</professional_summary>', content, re.DOTALL)
-        if summary:
-            summary_text = summary.group(1).strip()
+        if model is None:
+            model = position_from_element(tree, position, position_id=pos_id)
+        summary_text = model.professional_summary
+        if summary_text is not None:
             sentences = summary_text.count('.') + summary_text.count('!') + summary_text.count('?')
             if sentences < 2:
-                self.warnings.append(f"Position {pos_id}: Professional summary is very short ({sentences} sentences)")
+                self.warnings.append(f"{where()}: Professional summary is very short ({sentences} sentences)")
 
     def check_xml_balance(self):
-        """Check for balanced XML tags."""
-        # Find all opening tags
-        opening_tags = re.findall(r'<(\w+)[^/>]*>', self.content)
-        # Find all closing tags
-        closing_tags = re.findall(r'</(\w+)>', self.content)
-
-        # Count occurrences
-        from collections import Counter
-        open_counts = Counter(opening_tags)
-        close_counts = Counter(closing_tags)
-
-        # Check balance
-        all_tags = set(opening_tags) | set(closing_tags)
-        for tag in all_tags:
-            open_count = open_counts.get(tag, 0)
-            close_count = close_counts.get(tag, 0)
-            if open_count != close_count:
-                self.errors.append(
-                    f"Unbalanced tag '{tag}': {open_count} opening, {close_count} closing"
-                )
-
-        if not self.errors:
+        """Check for properly nested XML tags (recorded while scanning)."""
+        tree = self._tree()
+        for error in tree.errors:
+            line, col = tree.line_col(error.offset)
+            self.errors.append(f"Line {line}, col {col}: {error.message}")
+
+        if not tree.errors:
             self.info.append("✓ All XML tags are balanced")
 
     def print_results(self):
@@ -204,19 +360,50 @@ class JobHistoryValidator:
         print("=" * 70 + "\n")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_job_history.py <job_history_file.txt>")
-        sys.exit(1)
+def _loaded_size(validator) -> Optional[int]:
+    """Input size for the metrics, without loading content a cached report did not need."""
+    content = validator._content
+    return len(content) if isinstance(content, str) else None
+
 
-    file_path = sys.argv[1]
+def _map_file(file_path):
+    """Read-only mmap of a file (empty files map to b"")."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a job history file against the template schema.")
+    parser.add_argument("file", help="Job history .txt file")
+    parser.add_argument("--mmap", action="store_true", default=None,
+                        help=f"Memory-map the file (default for files >= {MMAP_THRESHOLD // (1024 * 1024)} MB)")
+    parser.add_argument("--follow", action="store_true",
+                        help="Validate while the file is still being written")
+    parser.add_argument("--idle-timeout", type=float, default=5.0,
+                        help="--follow: stop once the file has not grown for this many seconds (default: 5)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Validate even if this exact file was validated before")
+    args = parser.parse_args()
+
+    file_path = args.file
 
     if not Path(file_path).exists():
         print(f"Error: File not found: {file_path}")
         sys.exit(1)
 
-    validator = JobHistoryValidator(file_path)
-    success = validator.validate()
+    if args.follow:
+        validator = JobHistoryValidator(file_path, content=b"")
+        success = validator.validate(follow=True, idle_timeout=args.idle_timeout)
+    else:
+        digest = None if args.no_cache else source_digest(file_path)
+        validator = JobHistoryValidator(file_path, use_mmap=args.mmap)
+        success = validator.validate(digest=digest)
+        history = validator.history
+        if history is not None and digest is not None:
+            save_cached(digest, history)
+    write_metrics_file()
 
     sys.exit(0 if success else 1)
 
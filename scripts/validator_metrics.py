@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+validator_metrics.py - Layer 5: Validator Telemetry (OpenMetrics)
+
+Purpose: In-process metrics registry for the validators. Records:
+         - omr_validator_call_seconds     latency histogram per function
+         - omr_validator_input_chars      input-size histogram per function
+         - omr_guardrail_checks_total     pass/fail counter per guardrail and platform
+         - omr_job_history_validations_total  pass/fail counter per platform
+
+         Long-running callers (validator_server.py) serve the registry at
+         GET /metrics; batch and CLI callers write it as an OpenMetrics
+         textfile (e.g. for a node_exporter textfile collector) with
+         --metrics-file or OMR_METRICS_FILE.
+
+         Set OMR_METRICS=0 to turn recording off.
+
+Usage:
+    from validator_metrics import REGISTRY, instrument
+    @instrument("check_word_count")
+    def check_word_count(doc): ...
+    print(REGISTRY.render())
+"""
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Bucket upper bounds (the +Inf bucket is implicit)
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001,
+                   0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 10.0)
+SIZE_BUCKETS = tuple(float(256 * 4 ** i) for i in range(10))  # 256 .. 64Mi characters
+
+CALL_SECONDS = "omr_validator_call_seconds"
+INPUT_CHARS = "omr_validator_input_chars"
+GUARDRAIL_CHECKS = "omr_guardrail_checks_total"
+JOB_HISTORY_VALIDATIONS = "omr_job_history_validations_total"
+
+
+def default_platform() -> str:
+    return os.getenv("OPTIMIZE_PLATFORM", "unknown")
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters and histograms keyed by (metric, label values).
+    Histograms store per-bucket counts (non-cumulative) plus sum and count;
+    they are made cumulative only when rendered.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Tuple[str, str, Tuple[str, ...], Optional[tuple]]] = {}
+        self._counters: Dict[Tuple[str, tuple], float] = {}
+        self._histograms: Dict[Tuple[str, tuple], List] = {}
+
+    def describe(self, name: str, kind: str, help_text: str, labels: Iterable[str], buckets: tuple = None):
+        """Register a metric family. kind is 'counter' or 'histogram'."""
+        self._meta[name] = (kind, help_text, tuple(labels), buckets)
+
+    def inc(self, name: str, labels: tuple, amount: float = 1.0):
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def observe(self, name: str, labels: tuple, value: float):
+        buckets = self._meta[name][3]
+        index = bisect_left(buckets, value)
+        key = (name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [[0] * (len(buckets) + 1), 0.0, 0]
+            hist[0][index] += 1
+            hist[1] += value
+            hist[2] += 1
+
+    # -- Cross-process aggregation (batch workers) -------------------------
+
+    def snapshot(self, reset: bool = False) -> Dict:
+        """Picklable copy of the recorded values; reset=True starts a new delta."""
+        with self._lock:
+            snap = {
+                "counters": dict(self._counters),
+                "histograms": {k: [list(v[0]), v[1], v[2]] for k, v in self._histograms.items()},
+            }
+            if reset:
+                self._counters.clear()
+                self._histograms.clear()
+        return snap
+
+    def merge(self, snap: Dict):
+        """Add a snapshot taken in another process into this registry."""
+        with self._lock:
+            for key, value in snap["counters"].items():
+                self._counters[key] = self._counters.get(key, 0.0) + value
+            for key, (counts, total, n) in snap["histograms"].items():
+                hist = self._histograms.get(key)
+                if hist is None:
+                    self._histograms[key] = [list(counts), total, n]
+                else:
+                    hist[0] = [a + b for a, b in zip(hist[0], counts)]
+                    hist[1] += total
+                    hist[2] += n
+
+    # -- Exposition ---------------------------------------------------------
+
+    def render(self) -> str:
+        """OpenMetrics text exposition of every registered family."""
+        snap = self.snapshot()
+        lines = []
+        for name, (kind, help_text, label_names, buckets) in sorted(self._meta.items()):
+            family = name[:-len("_total")] if kind == "counter" and name.endswith("_total") else name
+            lines.append(f"# TYPE {family} {kind}")
+            lines.append(f"# HELP {family} {help_text}")
+            if kind == "counter":
+                for (metric, labels), value in sorted(snap["counters"].items()):
+                    if metric == name:
+                        lines.append(f"{family}_total{_labels(label_names, labels)} {_number(value)}")
+            else:
+                for (metric, labels), (counts, total, n) in sorted(snap["histograms"].items()):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(buckets + (float("inf"),), counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{family}_bucket{_labels(label_names + ('le',), labels + (le,))} {cumulative}")
+                    lines.append(f"{family}_count{_labels(label_names, labels)} {n}")
+                    lines.append(f"{family}_sum{_labels(label_names, labels)} {_number(total)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Atomically write the exposition to path (temp file + rename)."""
+        path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+REGISTRY = MetricsRegistry(enabled=os.getenv("OMR_METRICS", "1") != "0")
+REGISTRY.describe(CALL_SECONDS, "histogram", "Validator call latency in seconds.", ["function"], LATENCY_BUCKETS)
+REGISTRY.describe(INPUT_CHARS, "histogram", "Validator input size in characters.", ["function"], SIZE_BUCKETS)
+REGISTRY.describe(GUARDRAIL_CHECKS, "counter", "Guardrail outcomes, one per guardrail per validation.", ["guardrail", "platform", "result"])
+REGISTRY.describe(JOB_HISTORY_VALIDATIONS, "counter", "Job history validation outcomes.", ["platform", "result"])
+
+
+def _default_size(args, kwargs) -> Optional[int]:
+    """Size of the validated input: the first str argument or an object's .text/.content."""
+    for arg in args:
+        if isinstance(arg, str):
+            return len(arg)
+        for attr in ("text", "content"):
+            value = getattr(arg, attr, None)
+            if isinstance(value, str):
+                return len(value)
+    return None
+
+
+def instrument(function: str, size: Callable = _default_size):
+    """Decorator recording latency and input size for each call."""
+    def decorator(func):
+        labels = (function,)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not REGISTRY.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                REGISTRY.observe(CALL_SECONDS, labels, time.perf_counter() - start)
+                n = size(args, kwargs)
+                if n is not None:
+                    REGISTRY.observe(INPUT_CHARS, labels, n)
+        return wrapper
+    return decorator
+
+
+def record_guardrail_results(results, platform: Optional[str] = None):
+    """
+    Count pass/fail per guardrail for a list of ValidationResult objects.
+    A guardrail with several results (e.g. both G12 checks) counts once,
+    passing only if all of them passed.
+    """
+    if not REGISTRY.enabled:
+        return
+    platform = platform or default_platform()
+    outcomes = {}
+    for result in results:
+        outcomes[result.guardrail] = outcomes.get(result.guardrail, True) and result.passed
+    for guardrail, passed in outcomes.items():
+        REGISTRY.inc(GUARDRAIL_CHECKS, (guardrail, platform, "pass" if passed else "fail"))
+
+
+def record_job_history_result(passed: bool, platform: Optional[str] = None):
+    if REGISTRY.enabled:
+        REGISTRY.inc(JOB_HISTORY_VALIDATIONS, (platform or default_platform(), "pass" if passed else "fail"))
+
+
+def write_metrics_file(path: Optional[str] = None):
+    """Write the textfile to path, or to OMR_METRICS_FILE when set."""
+    path = path or os.getenv("OMR_METRICS_FILE")
+    if path and REGISTRY.enabled:
+        REGISTRY.write_textfile(path)
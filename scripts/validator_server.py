@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+validator_server.py - Persistent Local Validation Server
+
+Purpose: Long-lived HTTP server that keeps the validators warm (compiled
+         regexes, sanitizer tables, verb index) so n8n workflows and the local
+         GUI can validate every generation attempt without paying Python
+         interpreter startup, imports and regex compilation per call.
+
+         HTTP/1.1 keep-alive with request pipelining; one thread per
+         connection. The validators hold no per-request shared state, so
+         concurrent requests are safe.
+
+Usage:
+    python scripts/validator_server.py [--host 127.0.0.1] [--port 8765]
+    python scripts/validator_server.py --socket /tmp/omr-validator.sock
+
+Endpoints:
+    GET  /health               -> {"status": "ok", "requests": N, "uptime_s": S}
+    GET  /metrics              -> OpenMetrics text (validator_metrics.py registry)
+    POST /validate/bullets     {"text": "...", "sanitize": true, "log": false,
+                                "platform": "...", "model": "..."}
+                               -> {"passed": bool, "results": [...], "elapsed_ms": ms}
+                                  (with "log": also "drift_alerts": [...])
+    POST /validate/job-history {"text": "..."}
+                               -> {"passed": bool, "errors": [...], "warnings": [...],
+                                   "info": [...], "elapsed_ms": ms}
+
+    POST bodies must be application/json (anything else gets 415) with a
+    valid Content-Length (400 otherwise, 413 above MAX_BODY_BYTES).
+
+Security: binds to localhost only by default; there is no authentication.
+         Only JSON bodies are accepted, so a web page cannot reach the
+         endpoints with a cross-origin "simple" request (text/plain or form
+         POSTs skip the CORS preflight), and the server never opens files
+         named by a client.
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from validate_bullets import convert_results_to_json, sanitize_input, validate_output
+from validate_job_history import JobHistoryValidator
+from validator_metrics import REGISTRY
+from verb_index import load_verb_index
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest accepted request body (bytes)
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+# Origins allowed to call the server from a browser (local GUI dev server)
+ALLOWED_ORIGINS = {"http://localhost:3000", "http://127.0.0.1:3000"}
+
+
+class ValidationError(Exception):
+    """Bad request payload; reported to the client as HTTP 400 (or the given status)."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def handle_validate_bullets(payload: dict) -> dict:
+    text = payload.get("text")
+    if not isinstance(text, str) or not text.strip():
+        raise ValidationError("'text' must be a non-empty string")
+
+    platform = payload.get("platform") or os.getenv("OPTIMIZE_PLATFORM", "unknown")
+    if payload.get("sanitize", True):
+        text = sanitize_input(text)
+    results_json = convert_results_to_json(validate_output(text, platform=platform))
+    response = {"passed": all(r["passed"] for r in results_json), "results": results_json}
+
+    if payload.get("log"):
+        # Recorded quietly: drift alerts go back to the client, not to the server's stdout
+        from compliance_tracker import record_compliance
+
+        _, alerts = record_compliance(results_json, platform=platform,
+                                      model=payload.get("model") or os.getenv("OPTIMIZE_MODEL"))
+        response["drift_alerts"] = [str(alert) for alert in alerts]
+
+    return response
+
+
+def handle_validate_job_history(payload: dict) -> dict:
+    text = payload.get("text")
+    if not isinstance(text, str) or not text.strip():
+        raise ValidationError("'text' must be a non-empty string")
+    validator = JobHistoryValidator("<request>", content=text)
+
+    passed = validator.validate(verbose=False, platform=payload.get("platform"))
+    return {"passed": passed, "errors": validator.errors, "warnings": validator.warnings, "info": validator.info}
+
+
+ROUTES = {
+    "/validate/bullets": handle_validate_bullets,
+    "/validate/job-history": handle_validate_job_history,
+}
+
+
+class ValidatorRequestHandler(BaseHTTPRequestHandler):
+    """JSON request/response handler; HTTP/1.1 so connections are reused and pipelined."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "OMRValidator/1.0"
+    disable_nagle_algorithm = True
+    wbufsize = -1  # buffer each response, flushed once in _send()
+
+    stats_lock = threading.Lock()
+    request_count = 0
+    started = time.time()
+
+    def do_GET(self):
+        if self.path.rstrip('/') == "/metrics":
+            self._send_text(200, REGISTRY.render(), "application/openmetrics-text; version=1.0.0; charset=utf-8")
+        elif self.path.rstrip('/') == "/health":
+            self._send(200, {
+                "status": "ok",
+                "requests": ValidatorRequestHandler.request_count,
+                "uptime_s": round(time.time() - ValidatorRequestHandler.started, 1),
+            })
+        else:
+            self._send(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        handler = ROUTES.get(self.path.rstrip('/'))
+        try:
+            payload = self._read_payload()
+        except ValidationError as e:
+            self._send(e.status, {"error": str(e)})
+            return
+        if handler is None:
+            self._send(404, {"error": f"Unknown endpoint: {self.path}"})
+            return
+
+        start = time.perf_counter()
+        try:
+            response = handler(payload)
+        except ValidationError as e:
+            self._send(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        response["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        with ValidatorRequestHandler.stats_lock:
+            ValidatorRequestHandler.request_count += 1
+        self._send(200, response)
+
+    def do_OPTIONS(self):
+        """CORS preflight for the browser GUI."""
+        self.send_response(204)
+        self._send_cors_headers()
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        self.wfile.flush()
+
+    def _read_payload(self) -> dict:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be framed, so the connection cannot be reused
+            self.close_connection = True
+            raise ValidationError("Invalid Content-Length header")
+        if length > MAX_BODY_BYTES:
+            # Drain is not attempted for oversized bodies; close the connection
+            self.close_connection = True
+            raise ValidationError(f"Request body too large ({length} bytes)", status=413)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+
+        content_type = self.headers.get_content_type()
+        if content_type != "application/json":
+            raise ValidationError(f"Content-Type must be application/json, not {content_type}", status=415)
+        try:
+            payload = json.loads(body or "{}")
+        except ValueError as e:
+            raise ValidationError(f"Invalid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise ValidationError("JSON body must be an object")
+        return payload
+
+    def _send(self, status: int, payload: dict):
+        self._send_text(status, json.dumps(payload), "application/json")
+
+    def _send_text(self, status: int, text: str, content_type: str):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self._send_cors_headers()
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+
+    def _send_cors_headers(self):
+        origin = self.headers.get("Origin")
+        if origin in ALLOWED_ORIGINS:
+            self.send_header("Access-Control-Allow-Origin", origin)
+            self.send_header("Vary", "Origin")
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        """Per-request access logging is off; it would dominate sub-ms latency."""
+        pass
+
+
+class UnixSocketRequestHandler(ValidatorRequestHandler):
+    """Same handler for Unix sockets, where TCP_NODELAY does not apply."""
+    disable_nagle_algorithm = False
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def warm_up():
+    """Compile regexes, sanitizer tables and the verb index before serving."""
+    sample = "Budget Allocation Table\n### Position 0: Engineer\n- Built a résumé pipeline​ for testing\n"
+    validate_output(sanitize_input(sample))
+    load_verb_index()
+    JobHistoryValidator("<warm-up>", content=sample).validate(verbose=False)
+    REGISTRY.snapshot(reset=True)  # warm-up calls are not real traffic
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent local validation server.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--socket", help="Serve on this Unix socket path instead of TCP")
+    args = parser.parse_args()
+
+    warm_up()
+
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        server = ThreadingUnixHTTPServer(args.socket, UnixSocketRequestHandler)
+        where = f"unix:{args.socket}"
+    else:
+        server = ThreadingHTTPServer((args.host, args.port), ValidatorRequestHandler)
+        server.daemon_threads = True
+        where = f"http://{args.host}:{args.port}"
+
+    print(f"✅ Validator server listening on {where} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down validator server")
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
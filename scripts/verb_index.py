@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+verb_index.py - Compiled Verb-to-Category Index (G9 / G37)
+
+Purpose: Builds an exact-match verb index from the canonical category lists in
+         core/verb-categories.md ("**Top 10 verbs:**" lines). Verb forms are
+         normalized (built/builds/building -> build) so any tense maps to the
+         same key, and each bullet is classified with a constant number of
+         dictionary lookups.
+
+         The compiled index is cached on disk and rebuilt only when the
+         markdown changes (mtime/size first, then content hash).
+
+Usage:
+    python scripts/verb_index.py              # print the compiled index
+    python scripts/verb_index.py "Led a team" # classify a bullet
+
+Context: core/verb-categories.md - The Five Categories, Flagging Rule (v6.5.1)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from lazy_re import lazy_compile
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+VERB_CATEGORIES_FILE = REPO_ROOT / "core" / "verb-categories.md"
+CACHE_FILE = REPO_ROOT / ".cache" / "omr" / "verb_index.json"
+
+# Bump when the normalization or cache layout changes
+INDEX_VERSION = 1
+
+# G37: categories below this share of total bullets are flagged as TWEAK
+DISTRIBUTION_THRESHOLD_PCT = 5.0
+
+# Irregular forms mapped to their base form before normalization
+IRREGULAR_VERBS = {
+    'built': 'build',
+    'led': 'lead',
+    'drove': 'drive',
+    'driven': 'drive',
+    'oversaw': 'oversee',
+    'overseen': 'oversee',
+    'ran': 'run',
+    'won': 'win',
+    'wrote': 'write',
+    'written': 'write',
+    'began': 'begin',
+    'begun': 'begin',
+    'taught': 'teach',
+    'brought': 'bring',
+    'sold': 'sell',
+    'grew': 'grow',
+    'grown': 'grow',
+    'made': 'make',
+    'set': 'set',
+}
+
+_CATEGORY_HEADER_RE = lazy_compile(r'^###\s+\d+\.\s+(\w+)')
+_TOP_VERBS_RE = lazy_compile(r'^\*\*Top \d+ verbs:\*\*\s*(.+)$')
+_NON_LETTERS_RE = lazy_compile(r'[^a-z]')
+
+
+def normalize_verb(word: str) -> str:
+    """
+    Reduce a verb form to a normalization key shared by all its inflections.
+    The key is not a dictionary lemma; it only has to be identical for
+    base, -s/-es, -ed and -ing forms of the same verb.
+    """
+    word = _NON_LETTERS_RE.sub('', word.lower())
+    word = IRREGULAR_VERBS.get(word, word)
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            break
+    if len(word.rstrip('e')) >= 3:
+        word = word.rstrip('e')
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in 'aeiouls':
+        word = word[:-1]
+    return word
+
+
+def parse_verb_categories(markdown: str) -> Dict[str, List[str]]:
+    """Extract {category: [verbs]} from the '### N. Category' sections, in file order."""
+    categories = {}
+    current = None
+    for line in markdown.split('\n'):
+        line = line.strip()
+        header = _CATEGORY_HEADER_RE.match(line)
+        if header:
+            current = header.group(1)
+            continue
+        verbs = _TOP_VERBS_RE.match(line)
+        if verbs and current:
+            categories[current] = [v.strip().lower() for v in verbs.group(1).split(',') if v.strip()]
+            current = None
+    return categories
+
+
+@dataclass
+class VerbDistribution:
+    """Per-category verb distribution across a set of bullets."""
+    counts: Dict[str, int]
+    total: int
+    unclassified: int
+
+    @property
+    def percentages(self) -> Dict[str, float]:
+        return {c: round(n / self.total * 100, 1) if self.total else 0.0 for c, n in self.counts.items()}
+
+    @property
+    def categories_used(self) -> List[str]:
+        return [c for c, n in self.counts.items() if n]
+
+    @property
+    def below_threshold(self) -> List[str]:
+        """G37: categories under DISTRIBUTION_THRESHOLD_PCT of total bullets."""
+        if not self.total:
+            return []
+        return [c for c, pct in self.percentages.items() if pct < DISTRIBUTION_THRESHOLD_PCT]
+
+    def summary(self) -> str:
+        return ", ".join(f"{c} {n} ({p:.0f}%)" for (c, n), p in zip(self.counts.items(), self.percentages.values()))
+
+
+class VerbIndex:
+    """Exact-match index from normalized verb keys to categories."""
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self.categories = categories
+        self.index = {}
+        self.phrases = {}
+        self.ambiguous = {}
+
+        for category, verbs in categories.items():
+            for verb in verbs:
+                first, _, rest = verb.partition(' ')
+                key = normalize_verb(first)
+                target = self.phrases.setdefault(key, {}) if rest else self.index
+                slot = rest if rest else key
+                if slot in target and target[slot] != category:
+                    # First category in document order wins; keep a record
+                    self.ambiguous.setdefault(verb, [target[slot]]).append(category)
+                    continue
+                target[slot] = category
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VerbIndex":
+        index = cls.__new__(cls)
+        index.categories = data["categories"]
+        index.index = data["index"]
+        index.phrases = data["phrases"]
+        index.ambiguous = data["ambiguous"]
+        return index
+
+    def to_dict(self) -> Dict:
+        return {
+            "categories": self.categories,
+            "index": self.index,
+            "phrases": self.phrases,
+            "ambiguous": self.ambiguous,
+        }
+
+    def classify(self, bullet_text: str) -> Optional[str]:
+        """
+        Return the category of the bullet's leading verb, or None.
+        Leading tokens without letters (emoji markers, numbering) are skipped.
+        """
+        words = [w for w in bullet_text.lower().split(None, 4) if any(ch.isalpha() for ch in w)]
+        if not words:
+            return None
+        key = normalize_verb(words[0])
+        if len(words) > 1 and key in self.phrases:
+            category = self.phrases[key].get(_NON_LETTERS_RE.sub('', words[1]))
+            if category:
+                return category
+        return self.index.get(key)
+
+    def distribution(self, bullet_texts: Iterable[str]) -> VerbDistribution:
+        """Classify every bullet once and tally categories."""
+        counts = {category: 0 for category in self.categories}
+        total = unclassified = 0
+        for text in bullet_texts:
+            total += 1
+            category = self.classify(text)
+            if category:
+                counts[category] += 1
+            else:
+                unclassified += 1
+        return VerbDistribution(counts=counts, total=total, unclassified=unclassified)
+
+
+def _source_stamp(path: Path) -> Dict:
+    stat = path.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build_verb_index(source: Path = VERB_CATEGORIES_FILE, cache: Optional[Path] = CACHE_FILE) -> VerbIndex:
+    """
+    Load the verb index from cache when the source is unchanged, otherwise
+    compile it from the markdown and refresh the cache. The cache is
+    trusted when mtime and size match; if only the mtime moved, the
+    content hash decides.
+    """
+    stamp = _source_stamp(source)
+    cached = None
+    if cache is not None and cache.exists():
+        try:
+            with open(cache, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = None
+    if cached and cached.get("version") != INDEX_VERSION:
+        cached = None
+
+    if cached and cached["source"]["size"] == stamp["size"]:
+        if cached["source"]["mtime_ns"] == stamp["mtime_ns"]:
+            return VerbIndex.from_dict(cached)
+        digest = _sha256(source)
+        if cached["source"]["sha256"] == digest:
+            cached["source"].update(stamp)
+            _write_cache(cache, cached)
+            return VerbIndex.from_dict(cached)
+
+    index = VerbIndex(parse_verb_categories(source.read_text(encoding='utf-8')))
+    if cache is not None:
+        _write_cache(cache, {
+            "version": INDEX_VERSION,
+            "source": dict(stamp, sha256=_sha256(source)),
+            **index.to_dict(),
+        })
+    return index
+
+
+def _write_cache(cache: Path, data: Dict):
+    """Atomically replace the cache file; a read-only tree just skips caching."""
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+
+
+_loaded_index = None
+
+
+def load_verb_index() -> VerbIndex:
+    """Process-wide verb index, compiled (or loaded from cache) on first use."""
+    global _loaded_index
+    if _loaded_index is None:
+        _loaded_index = build_verb_index()
+    return _loaded_index
+
+
+if __name__ == "__main__":
+    verb_index = load_verb_index()
+    if len(sys.argv) > 1:
+        text = " ".join(sys.argv[1:])
+        print(f"{text!r} -> {verb_index.classify(text)}")
+    else:
+        print(json.dumps(verb_index.to_dict(), indent=2))
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+watch_job_history.py - Incremental Validation and Conversion While Editing
+
+Purpose: Watches a job history .txt file and, on every save, re-validates it
+         (validate_job_history.py) and re-renders its Markdown
+         (convert_job_history_to_md.py) - re-doing work only for what changed.
+
+         The file is split into blocks: each top-level element (a global
+         section or a <position>) together with the text before it, which
+         holds the "POSITION N:" header. Every block is hashed; parsing into
+         the job history model (job_history_model.py), the schema checks
+         (validate_position and the global-section checks) and the Markdown
+         rendering (render_position) run only for blocks whose hash is new,
+         and cached messages, sections and fragments are spliced back in
+         document order.
+
+         After an edit, only the region between the first and last changed
+         byte is re-scanned; the parse resumes at the block boundary before
+         the edit and re-joins the previous parse at the first unchanged block
+         boundary after it. Unchanged blocks are only shifted. Cached messages
+         store offsets relative to their block, so line/column numbers stay
+         right when an edit above moves them.
+
+Usage:
+    python scripts/watch_job_history.py job_history.txt [output.md]
+    python scripts/watch_job_history.py job_history.txt --once --verbose
+    (Ctrl+C to stop)
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from convert_job_history_to_md import iter_document, render_position, rendered_positions
+from job_history_model import GLOBAL_SECTIONS, HistoryBuilder, position_zero_from_text
+from job_history_scanner import COMMENT, Element, SectionTree, TreeBuilder, iter_events
+from job_history_schema import load_schema
+from lazy_re import lazy_compile
+from validate_job_history import JobHistoryValidator
+
+# Chunk size when comparing the previous and new text for the edited region
+COMPARE_CHUNK = 1 << 16
+
+# Block-relative location left in cached messages: line delta, then the
+# column (or, on the block's first line, the distance from the block start)
+_MARKER_RE = lazy_compile('\x00(\\d+)\x00(\\d+)\x00')
+
+
+class Block:
+    """
+    One top-level element plus the text before it. gap_start..end is the
+    hashed region; start is where the element's tag begins (name and start
+    let a Block stand in for its element in the top-level order check).
+    """
+
+    __slots__ = ("gap_start", "start", "end", "name", "digest")
+
+    def __init__(self, gap_start: int, start: int, end: int, name: str, digest: str):
+        self.gap_start = gap_start
+        self.start = start
+        self.end = end
+        self.name = name
+        self.digest = digest
+
+    def shifted(self, delta: int) -> "Block":
+        return Block(self.gap_start + delta, self.start + delta, self.end + delta, self.name, self.digest)
+
+
+class BlockResult:
+    """Cached per-block work; message locations are markers relative to gap_start."""
+
+    __slots__ = ("newlines", "errors", "warnings", "info", "sections_found", "position_count",
+                 "sections", "position_zero", "position_zero_wrapped", "positions")
+
+    def __init__(self, newlines: int = 0):
+        self.newlines = newlines  # line breaks between gap_start and end
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.info: List[str] = []
+        self.sections_found = set()
+        self.position_count = 0
+        self.sections: List[Tuple[str, object]] = []  # (global section name, model value)
+        self.position_zero = ""
+        self.position_zero_wrapped = False  # from a <position id="0"> element
+        self.positions: List[str] = []
+
+
+class _BlockView(SectionTree):
+    """The document as seen while checking one block: locations become block-relative markers."""
+
+    def __init__(self, source: str, base: int):
+        super().__init__(source, Element("#document", None, 0, 0), [], {}, [])
+        self.base = base
+
+    def location(self, offset: int) -> str:
+        lines = self.source.count("\n", self.base, offset)
+        col = offset - self.source.rfind("\n", self.base, offset) if lines else offset - self.base
+        return f"\x00{lines}\x00{col}\x00"
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix: chunked compares, then bisection within the first differing chunk."""
+    n = min(len(a), len(b))
+    i = 0
+    while i < n:
+        hi = min(i + COMPARE_CHUNK, n)
+        if a[i:hi] != b[i:hi]:
+            while hi - i > 1:  # a[:i] == b[:i] and a[i:hi] != b[i:hi]
+                mid = (i + hi) // 2
+                if a[i:mid] == b[i:mid]:
+                    i = mid
+                else:
+                    hi = mid
+            return i
+        i = hi
+    return n
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix, at most limit (same strategy as _common_prefix)."""
+    la, lb = len(a), len(b)
+    i = 0
+    while i < limit:
+        hi = min(i + COMPARE_CHUNK, limit)
+        if a[la - hi:la - i] != b[lb - hi:lb - i]:
+            while hi - i > 1:
+                mid = (i + hi) // 2
+                if a[la - mid:la - i] == b[lb - mid:lb - i]:
+                    i = mid
+                else:
+                    hi = mid
+            return i
+        i = hi
+    return limit
+
+
+def _sections(element: Element, names) -> List[Element]:
+    """element and its descendants named in names, in closing-tag order (as the streaming scan yields them)."""
+    found = []
+    stack = [(element, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            if node.name in names:
+                found.append(node)
+            continue
+        stack.append((node, True))
+        stack.extend((child, False) for child in reversed(node.children))
+    return found
+
+
+class WatchSession:
+    """
+    Incremental state for one watched file: the previous text, its blocks,
+    the document's nesting errors and header comments, and per-block
+    results keyed by content hash.
+    """
+
+    def __init__(self, file_path, schema=None):
+        self.file_path = str(file_path)
+        self.schema = schema or load_schema()
+        self.text: Optional[str] = None
+        self.blocks: List[Block] = []
+        self.errors = []          # ScanErrors for the whole document
+        self.comments = []        # comment spans before the first block's element
+        self.first_start = None
+        self.results: Dict[str, BlockResult] = {}
+        self.rechecked = 0
+
+    def update(self, text: str) -> Tuple[JobHistoryValidator, Iterator[str]]:
+        """
+        Bring the state up to date with the file's new text. Returns a
+        validator holding the full set of results (for print_results) and
+        the document's Markdown fragments (consume before the next update).
+        """
+        self.rechecked = 0
+        self._rescan(text)
+        self.text = text
+        live = {block.digest for block in self.blocks}
+        self.results = {digest: result for digest, result in self.results.items() if digest in live}
+        return self._validator(), self._markdown()
+
+    # -- Scanning -----------------------------------------------------------
+
+    def _rescan(self, text: str):
+        old, blocks = self.text, self.blocks
+        if old is None:
+            first, start, lo, edit_end, delta = 0, 0, 0, len(text), 0
+        else:
+            lo = _common_prefix(old, text)
+            if lo == len(old) == len(text):
+                return
+            suffix = _common_suffix(old, text, min(len(old), len(text)) - lo)
+            edit_end = len(text) - suffix
+            delta = len(text) - len(old)
+            first = bisect_right([block.end for block in blocks], lo)  # first block the edit touches
+            start = blocks[first - 1].end if first else 0
+            # A '<!--' left open before the resume point could now be closed by
+            # the edit and swallow the text after it: rescan from the top.
+            if start and old.find('<!--', max(old.rfind('-->', 0, start), 0), start) != -1:
+                first, start = 0, 0
+
+        builder = TreeBuilder(text, start=start, sections=())
+        window: List[Block] = []
+        gap_start = start
+        rejoin = None
+        old_ends = [block.end for block in blocks]
+        for element in builder.feed():
+            window.append(self._block(text, gap_start, element))
+            gap_start = element.end
+            if old is not None and element.end >= edit_end:
+                # Past the edit: the rest matches the old text, so the old parse
+                # can be reused from any point where it was back at top level.
+                old_end = element.end - delta
+                j = bisect_right(old_ends, old_end) - 1
+                if j >= 0 and old_ends[j] == old_end:
+                    rejoin = j + 1
+                    break
+        else:
+            for element in builder.finish():
+                window.append(self._block(text, gap_start, element))
+                gap_start = element.end
+
+        errors = [e for e in self.errors if e.offset < start] + builder.tree.errors
+        tail: List[Block] = []
+        if rejoin is not None:
+            old_end = old_ends[rejoin - 1]
+            errors += [type(e)(e.message, e.offset + delta) for e in self.errors if e.offset >= old_end]
+            tail = [block.shifted(delta) for block in blocks[rejoin:]]
+        self.blocks = blocks[:first] + window + tail
+        self.errors = errors
+
+        if start == 0:
+            self.first_start = builder.tree.first_start
+            self.comments = [span for span in builder.tree.comments
+                             if self.first_start is None or span[0] < self.first_start]
+
+    def _block(self, text: str, gap_start: int, element: Element) -> Block:
+        region = text[gap_start:element.end]
+        digest = hashlib.blake2b(region.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+        if digest not in self.results:
+            self.results[digest] = self._check_block(text, gap_start, element)
+            self.rechecked += 1
+        return Block(gap_start, element.start, element.end, element.name, digest)
+
+    def _check_block(self, text: str, gap_start: int, element: Element) -> BlockResult:
+        """Schema checks and Markdown fragments for one block (the work being cached)."""
+        result = BlockResult(text.count("\n", gap_start, element.end))
+        view = _BlockView(text, gap_start)
+
+        validator = JobHistoryValidator(self.file_path, content=text, schema=self.schema)
+        validator.tree = view
+        model = HistoryBuilder(view, start=gap_start, retain=False)
+        for section in _sections(element, set(self.schema.child_index) | set(GLOBAL_SECTIONS)):
+            position = model.add(section)
+            validator.check_section_content(section, position)
+            if position is None or not position.id.isdigit():
+                continue
+            if position.id != "0":
+                result.positions.append("".join(rendered_positions([position])))
+            elif not result.position_zero_wrapped:
+                result.position_zero = "".join(render_position(position))
+                result.position_zero_wrapped = True
+        result.errors = validator.errors
+        result.warnings = validator.warnings
+        result.info = validator.info
+        result.sections_found = validator._sections_found
+        result.position_count = validator._position_count
+        result.sections = model.sections()
+
+        if not result.position_zero_wrapped:
+            position_zero = position_zero_from_text(text[gap_start:element.end])
+            if position_zero is not None:
+                result.position_zero = "".join(render_position(position_zero))
+        return result
+
+    # -- Splicing -----------------------------------------------------------
+
+    def _tree(self) -> SectionTree:
+        tree = SectionTree(self.text, Element("#document", None, 0, 0), self.comments, {}, self.errors)
+        tree.first_start = self.first_start
+        return tree
+
+    def _validator(self) -> JobHistoryValidator:
+        """Cached block results spliced in document order, plus the whole-document checks."""
+        tree = self._tree()
+        validator = JobHistoryValidator(self.file_path, content=self.text, schema=self.schema)
+        validator.tree = tree
+        validator.check_header()
+        validator.check_version_history()
+
+        text = self.text
+        line = 1  # line of the current block's gap_start
+        for block in self.blocks:
+            result = self.results[block.digest]
+            validator.check_top_level_order(block)
+
+            def locate(m, base=block.gap_start, base_line=line):
+                lines, col = int(m.group(1)), int(m.group(2))
+                if not lines:
+                    col += base - text.rfind("\n", 0, base)
+                return f"line {base_line + lines}, col {col}"
+
+            def resolve(message):
+                return _MARKER_RE.sub(locate, message)
+
+            validator.errors.extend(resolve(message) for message in result.errors)
+            validator.warnings.extend(resolve(message) for message in result.warnings)
+            validator.info.extend(line for line in result.info if line not in validator.info)
+            validator._sections_found |= result.sections_found
+            validator._position_count += result.position_count
+            line += result.newlines
+
+        validator.check_global_sections()
+        validator.check_positions()
+        validator.check_xml_balance()
+        return validator
+
+    def _markdown(self) -> Iterator[str]:
+        model = HistoryBuilder(self._tree())
+        wrapped_zero = unwrapped_zero = ""
+        positions = []
+        for block in self.blocks:
+            result = self.results[block.digest]
+            for name, value in result.sections:
+                model.add_section(name, value)
+            if result.position_zero_wrapped:
+                wrapped_zero = wrapped_zero or result.position_zero
+            else:
+                unwrapped_zero = unwrapped_zero or result.position_zero
+            positions.extend(result.positions)
+        return iter_document(model.header(), [wrapped_zero or unwrapped_zero], positions)
+
+
+def _write_atomic(path: Path, fragments: Iterator[str]):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.writelines(fragments)
+    os.replace(tmp, path)
+
+
+def watch(file_path: Path, output_path: Path, interval: float = 0.5, once: bool = False,
+          verbose: bool = False) -> bool:
+    """Re-validate and re-render on every change; returns the last validation verdict."""
+    session = WatchSession(file_path)
+    stamp = None
+    passed = False
+    while True:
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            stat = None  # editors may replace the file on save
+        if stat is not None and (stat.st_mtime_ns, stat.st_size) != stamp:
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            started = time.perf_counter()
+            with open(file_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            validator, fragments = session.update(text)
+            _write_atomic(output_path, fragments)
+            elapsed = (time.perf_counter() - started) * 1000
+            passed = not validator.errors
+
+            if verbose:
+                validator.print_results()
+            else:
+                for error in validator.errors:
+                    print(f"  • {error}")
+            status = "✅" if passed else "❌"
+            print(f"{status} {time.strftime('%H:%M:%S')} {file_path.name}: "
+                  f"{session.rechecked}/{len(session.blocks)} blocks re-checked in {elapsed:.0f} ms, "
+                  f"{len(validator.errors)} errors, {len(validator.warnings)} warnings -> {output_path}")
+            sys.stdout.flush()
+        if once:
+            return passed
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch a job history file; re-validate and re-convert on save.")
+    parser.add_argument("file", help="Job history .txt file")
+    parser.add_argument("output", nargs="?", help="Markdown output (default: input with .md extension)")
+    parser.add_argument("--interval", type=float, default=0.5, help="Polling interval in seconds (default: 0.5)")
+    parser.add_argument("--once", action="store_true", help="Process the file once and exit (status = verdict)")
+    parser.add_argument("--verbose", action="store_true", help="Print the full validation report on every change")
+    args = parser.parse_args()
+
+    file_path = Path(args.file)
+    if not file_path.exists():
+        print(f"Error: File not found: {file_path}")
+        sys.exit(1)
+    output_path = Path(args.output) if args.output else file_path.with_suffix('.md')
+
+    print(f"👀 Watching {file_path} (Ctrl+C to stop)")
+    try:
+        passed = watch(file_path, output_path, args.interval, args.once, args.verbose)
+    except KeyboardInterrupt:
+        print()
+        sys.exit(0)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
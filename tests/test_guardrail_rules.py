@@ -0,0 +1,55 @@
+"""Tests for the guardrail rule engine (scripts/guardrail_rules.py)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from guardrail_rules import RULES, run_rules  # noqa: E402
+from validate_bullets import parse_document  # noqa: E402
+
+OVERLAPPING = """\
+### Position 1: Engineer at Acme
+- Cut cloud costs—saving 3M USD across 150% of FISMA targets for 12 teams within the first year of the new platform.
+"""
+
+
+def _details(results):
+    return {gid: (passed, details) for gid, _, passed, details in results}
+
+
+def test_overlapping_matches_reach_every_rule():
+    # "3M USD" is a G11 match containing the G20 acronym USD, next to a G22 em dash
+    results = _details(run_rules(parse_document(OVERLAPPING), content_rules=True))
+
+    passed, details = results["G11"]
+    assert not passed
+    assert "currency without '$' '3M USD'" in details
+    assert "percentage over 100% '150%'" in details
+
+    passed, details = results["G20"]
+    assert not passed
+    assert "'USD'" in details
+    assert "'FISMA'" in details
+
+    passed, details = results["G22"]
+    assert not passed
+    assert "em dash '—'" in details
+
+
+def test_content_rules_are_opt_in():
+    gids = [result[0] for result in run_rules(parse_document(OVERLAPPING))]
+    assert gids == ["G24", "G9"]
+
+
+def test_one_matcher_finds_every_rule_match():
+    rules = tuple(RULES.rules)
+    matcher = RULES.matcher(rules)
+    assert matcher is RULES.matcher(rules)
+
+    body = OVERLAPPING.splitlines()[1][2:]
+    hits = RULES._scan(matcher, rules, body)
+    for i, rule in enumerate(rules):
+        if rule.pattern:
+            expected = [match.span() for match in rule.regex.finditer(body)]
+            assert [match.span() for match in hits.get(i, ())] == expected, rule.gid
@@ -0,0 +1,20 @@
+"""Every omr.py command imports within its STARTUP_BUDGET_MS (scripts/omr.py)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import omr  # noqa: E402
+
+
+def test_every_command_has_a_budget():
+    assert set(omr.STARTUP_BUDGET_MS) == {"omr", *omr.COMMANDS}
+
+
+@pytest.mark.parametrize("command", ["omr", *omr.COMMANDS])
+def test_startup_within_budget(command):
+    [(_, ms, budget)] = omr.measure_startup([command], runs=5)
+    assert ms <= budget, f"{command} imports in {ms:.1f} ms, budget {budget} ms"